@@ -1,13 +1,49 @@
 
 # IMPORTING LIBRARIES
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import tempfile
+import threading
+import time
+import warnings
 import numpy as np
 import pandas as pd
 
 import mix
 # IMPORTING FILES
 import tools
+import compiled
 import iwata
 import enderling
+import schedule
+
+# NUMBER OF MESH POINTS PER CHUNK OF 'iterateThreaded'.  LARGE
+# ENOUGH TO AMORTIZE THE THREAD POOL OVERHEAD, SMALL ENOUGH FOR ONE
+# CHUNK OF AN ARRAY /512 KB/ TO STAY IN CACHE BETWEEN UFUNCS.
+CHUNK_SIZE = 2**16
+
+# SMALLEST  'max_mesh_size'  REACHABLE BY 'tools.reduceMesh':  IT
+# ALWAYS KEEPS TWO RECENT POINTS AND THE LAST ONE, SO SMALLER MESHES
+# CANNOT BE COARSENED ANY FURTHER.
+MIN_MESH_SIZE = 4
+
+# DEFAULT NUMBER OF ITERATIONS BETWEEN TWO CALLS OF 'tools.prune-
+# Mesh'. EACH CALL SCANS THE WHOLE MESH, WHILE FEW POINTS BECOME
+# NEGLIGIBLE PER ITERATION.
+PRUNING_INTERVAL = 100
+
+# KERNELS OF THE 'iterate' FUNCTIONS AVAILABLE FOR EACH MODEL
+KERNELS = {'G': ('standard', 'workspace', 'fused', 'numba', 'log_density', 'closed_form', 'high_order', 'threaded',
+                 'adaptive'),
+           'GLQ': ('standard', 'workspace', 'fused', 'numba', 'log_density', 'high_order', 'threaded', 'adaptive'),
+           'LQ': ('standard', 'workspace', 'fused', 'numba', 'scaled', 'high_order', 'threaded')}
+
+# POST-STEP PASSES OF THE 'standard' KERNEL AVAILABLE FOR EACH MODEL
+PASSES = {'G': ('saturation_tolerance', 'pruning', 'max_mesh_size'),
+          'GLQ': ('saturation_tolerance', 'pruning', 'max_mesh_size'),
+          'LQ': ('pruning', 'max_mesh_size')}
+
+# STEP SIZE CONTROLS OF THE 'adaptive' KERNEL /SEE 'iterateAdaptive'/
+STEP_CONTROL = ('tolerance', 'k_min', 'k_max', 'event_times')
 
 # ======================================================== GOMPERTZ ===================================================
 # INTERMEDIATE TIME-STEP
@@ -88,16 +124,17 @@ def fullTimeStep_G(previous_time, x_prev, x_inter, rho_prev, a_G, b_G, k, m_G, a
 
 # ITERATION
 def iterate_G(number_of_iterations, initial_time, maximum_time, a_G, b_G, k, m_G, alpha_G, x_initial_condition,
-              export_filename=None, initialize=True, x_initial=None, rho_initial=None):
+              export_filename=None, initialize=True, x_initial=None, rho_initial=None, kernel='standard',
+              passes=None, report=None, threads=None, scratch_directory=None, step_control=None):
     # ITERATES OVER CALLS TO FUNCTIONS  'intermediateTimeStep',
     # AND  'fullTimeStep' AS SEEN IN THE ANGULO PAPERS. IN EACH
     # ITERATION IT COMPUTES NUMERICAL APPROXIMATIONS FOR 'x(t)'
     # /TUMOR SIZE IN CELLS/,  AND 'rho(x,t)' /THE CORRESPONDING
-    # DENSITY/. UNLIKE IN THE ANGULO PAPERS, NO DIMENSIONAL RE-
-    # DUCTION IS PERFORMED i.e: THE ARRAYS' DIMENSION INCREASES
-    # BY  1  EACH ITERATION. THE MORE ITERATIONS, THE FINER THE
-    # FINAL MESH ON THE 'x(t)' ARRAY /AND THEREFORE MORE EVALU-
-    # ATIONS OF 'rho'/.
+    # DENSITY/. BY DEFAULT, UNLIKE IN THE ANGULO PAPERS, NO DI-
+    # MENSIONAL REDUCTION IS PERFORMED i.e: THE ARRAYS' DIMEN-
+    # SION INCREASES BY 1 EACH ITERATION /THE MORE ITERATIONS,
+    # THE FINER THE FINAL MESH/. REDUCTION IS OPT-IN THROUGH
+    # 'passes' /SEE 'PASSES'/.
     #
     # INPUT:
     #   number_of_iterations : INTEGER. SPECIFIES THE NUMBER OF
@@ -118,6 +155,81 @@ def iterate_G(number_of_iterations, initial_time, maximum_time, a_G, b_G, k, m_G
     #   rho_initial : NUMPY  ARRAY.  CONTAINS   DENSITY VALUES.
     #                 ONLY USED  WHEN  'initialize'  IS  SET TO
     #                 FALSE.
+    #   kernel : STRING. DEFAULTS TO 'standard'. SCHEME THAT CAR-
+    #            RIES OUT THE ITERATIONS /SEE 'KERNELS'/:
+    #              - 'standard' : THE TIME-STEP FUNCTIONS ABOVE.
+    #              - 'workspace' : 'iterateInWorkspace', WHICH AL-
+    #                LOCATES THE FINAL MESH AND ITS SCRATCH BUFFERS
+    #                ONCE AND UPDATES THEM IN PLACE.  RESULTS ARE
+    #                IDENTICAL.
+    #              - 'fused' : 'iterateFused',  WHICH MERGES INTER-
+    #                MEDIATE AND FULL TIME-STEPS INTO A SINGLE PASS
+    #                OVER REUSABLE BUFFERS.
+    #              - 'numba' : 'compiled.iterateCompiled', THE WHOLE
+    #                LOOP COMPILED BY NUMBA.  IT AGREES WITH 'fused'
+    #                WITHIN A RELATIVE TOLERANCE OF 'compiled.TOLE-
+    #                RANCE' AND FALLS BACK TO IT IF NUMBA IS NOT
+    #                INSTALLED.  IT IS NOT A SPEED BACKEND: ITS SCA-
+    #                LAR 'log' AND 'exp' ARE SLOWER THAN THE VECTOR-
+    #                IZED ONES OF NUMPY, SO IT ONLY BEATS 'fused' BE-
+    #                LOW ABOUT 1000 ITERATIONS AND 'standard' BELOW
+    #                ABOUT 2000 /MEASURED WITH k=0.5: 10000 ITERA-
+    #                TIONS TAKE 5.6 s, 5.1 s AND 2.2 s WITH 'numba',
+    #                'standard' AND 'fused'/.
+    #              - 'log_density' : 'iterateLogDomain', WHICH STORES
+    #                'log(rho)' TO AVOID SUBNORMAL AND UNDERFLOWING
+    #                DENSITIES.  IF 'report' IS GIVEN, IT RECEIVES
+    #                THE FINAL 'log(rho)'.
+    #              - 'closed_form' : 'iterateClosedForm_G', WHICH
+    #                EVALUATES THE MESH ANALYTICALLY FROM THE BIRTH
+    #                TIMES OF ITS POINTS AND USES THE EXACT JACOBIAN
+    #                FOR 'rho'.
+    #              - 'high_order' : 'iterateHighOrder' /RUNGE-KUTTA
+    #                TRANSPORT AND SIMPSON BOUNDARY/.
+    #              - 'threaded' : 'iterateThreaded',  WITH 'threads'
+    #                THREADS AND OPTIONALLY OVER MEMORY-MAPPED FILES
+    #                IN 'scratch_directory'. RESULTS DO NOT DEPEND
+    #                ON THE NUMBER OF THREADS.
+    #              - 'adaptive' : 'iterateAdaptive',  WHICH ADAPTS
+    #                THE TIME-STEP TO THE LOCAL ERROR, STARTING WITH
+    #                'k' AND STOPPING AT  'initial_time + number_of_
+    #                iterations*k'.
+    #   passes : DICTIONARY. DEFAULTS TO 'None'. POST-STEP PASSES
+    #            APPLIED AFTER EACH ITERATION, IN THIS ORDER /ONLY
+    #            WITH THE 'standard' KERNEL, SEE 'PASSES'/:
+    #              - 'saturation_tolerance' : FLOAT. THE OLDEST
+    #                POINTS /CONVERGING TO SATURATION/ WHOSE RELA-
+    #                TIVE DISTANCE IS BELOW IT ARE MERGED /SEE 'tools.
+    #                compactSaturatedMesh'/. 'report' RECEIVES THE
+    #                FRACTION OF THE MESH REMOVED.
+    #              - 'pruning' : DICTIONARY. THE NEGLIGIBLE POINTS
+    #                ARE DROPPED EVERY 'interval' ITERATIONS /DE-
+    #                FAULTS TO 'PRUNING_INTERVAL'/ AND AFTER THE LAST
+    #                ONE /SEE 'tools.pruneMesh'/.  THE OTHER KEYS
+    #                ARE 'size_threshold', 'relative_density' AND
+    #                'max_discarded_mass', THE CAP ON THE NUMBER OF
+    #                METASTASIS DISCARDED DURING THIS CALL.
+    #              - 'max_mesh_size' : INTEGER. THE MESH IS COARSE-
+    #                NED BY 'tools.reduceMesh' AS SOON AS IT EXCEEDS
+    #                THIS NUMBER OF POINTS.  MUST BE AT LEAST 'MIN_
+    #                MESH_SIZE'.
+    #   report : DICTIONARY. DEFAULTS TO 'None'.  IF GIVEN, IT IS
+    #            FILLED WITH DIAGNOSTICS OF THE RUN /e.g. NUMBER
+    #            OF REDUCTIONS, REMOVED POINTS AND THE ESTIMATED
+    #            DEVIATION FROM THE UNREDUCED RESULT/.
+    #   threads : INTEGER. DEFAULTS TO 'None' /AS CHOSEN BY 'concur-
+    #             rent.futures'/. ONLY WITH THE 'threaded' KERNEL.
+    #   scratch_directory : STRING. DEFAULTS TO 'None'. ONLY WITH
+    #                       THE 'threaded' KERNEL. IF GIVEN, THE
+    #                       BUFFERS ARE MEMORY-MAPPED FILES IN THIS
+    #                       DIRECTORY AND THE INITIAL MESH IS BUILT
+    #                       THERE BY 'initialMeshInChunks'.  THE RE-
+    #                       TURNED ARRAYS ARE 'numpy.memmap' VIEWS.
+    #   step_control : DICTIONARY. DEFAULTS TO 'None'. ONLY WITH THE
+    #                  'adaptive' KERNEL.  KEYWORD ARGUMENTS  OF
+    #                  'iterateAdaptive' /SEE 'STEP_CONTROL'/. IF
+    #                  'report' IS GIVEN, IT RECEIVES THE ACCEPTED
+    #                  AND REJECTED STEPS.
     #
     # HARD-CODED VARIABLES:
     #   export_path : STRING.PATH USED TO SAVE THE DATAFRAME AS
@@ -130,7 +242,18 @@ def iterate_G(number_of_iterations, initial_time, maximum_time, a_G, b_G, k, m_G
     #   export_filename.csv : CSV FILE. STORED
     #                         'numerical_approximation_DF'.
 
-    if initialize:
+    # CHECKING KERNEL AND POST-STEP PASSES
+    passes = checkKernel('G', kernel, passes, threads, scratch_directory, step_control)
+    saturation_tolerance = passes.get('saturation_tolerance')
+    pruning = passes.get('pruning')
+    max_mesh_size = passes.get('max_mesh_size')
+
+    if initialize and scratch_directory is not None:
+        # INITIALIZING MAPPED ARRAYS /SEE 'scratch_directory'/
+        x_initial, rho_initial = initialMeshInChunks(lambda t: iwata.x_max_G(x_initial_condition, t, a_G, b_G),
+                                                     initial_time, maximum_time, number_of_iterations+1,
+                                                     scratch_directory)
+    elif initialize:
         # INITIALIZING NUMPY ARRAYS
         t = np.linspace(initial_time, maximum_time, number_of_iterations+1)
         x_initial = iwata.x_max_G(x_initial_condition, t, a_G, b_G)
@@ -141,22 +264,395 @@ def iterate_G(number_of_iterations, initial_time, maximum_time, a_G, b_G, k, m_G
     x_prev = x_initial
     rho_prev = rho_initial
 
+    # ITERATING WITH THE MULTITHREADED KERNEL
+    if kernel == 'threaded':
+        t_prev, x_prev, rho_prev = iterateThreaded('G', number_of_iterations, t_prev, x_prev, rho_prev, k, m_G,
+                                                   alpha_G, x_initial_condition, a_G=a_G, b_G=b_G, threads=threads,
+                                                   scratch_directory=scratch_directory)
+
+    # ITERATING WITH AN ADAPTIVE TIME-STEP
+    elif kernel == 'adaptive':
+        g, g_x, x_max = modelFunctions('G', a_G=a_G, b_G=b_G)
+        t_prev, x_prev, rho_prev = iterateAdaptive(t_prev, initial_time + (number_of_iterations*k), x_prev, rho_prev, k,
+                                                   m_G, alpha_G, x_initial_condition, g, g_x, x_max, report=report,
+                                                   **(step_control or {}))
+
+    # ITERATING WITH HIGHER-ORDER TRANSPORT AND QUADRATURE
+    elif kernel == 'high_order':
+        g, g_x, x_max = modelFunctions('G', a_G=a_G, b_G=b_G)
+        t_prev, x_prev, rho_prev = iterateHighOrder(number_of_iterations, t_prev, x_prev, rho_prev, k, m_G, alpha_G,
+                                                    x_initial_condition, g, g_x, x_max)
+
+    # ITERATING OVER THE CLOSED-FORM MESH
+    elif kernel == 'closed_form':
+        t_prev, x_prev, rho_prev = iterateClosedForm_G(number_of_iterations, t_prev, x_prev, rho_prev, k, m_G, alpha_G,
+                                                       x_initial_condition, a_G, b_G)
+
+    # ITERATING IN THE LOG-DOMAIN
+    elif kernel == 'log_density':
+        law = growthLaw('G', a_G=a_G, b_G=b_G)
+        t_prev, x_prev, rho_prev = iterateLogDomain(number_of_iterations, t_prev, x_prev, rho_prev, k, m_G, alpha_G,
+                                                    x_initial_condition, law, report)
+
+    # ITERATING WITH THE COMPILED KERNEL
+    elif kernel == 'numba' and numbaAvailable():
+        t_prev, x_prev, rho_prev = compiled.iterateCompiled('G', number_of_iterations, t_prev, x_prev, rho_prev, k, m_G,
+                                                            alpha_G, x_initial_condition, a_G=a_G, b_G=b_G)
+
+    # ITERATING WITH THE FUSED KERNEL
+    elif kernel in ('fused', 'numba'):
+        t_prev, x_prev, rho_prev = iterateFused('G', number_of_iterations, t_prev, x_prev, rho_prev, k, m_G, alpha_G,
+                                                x_initial_condition, a_G=a_G, b_G=b_G)
+
+    # ITERATING OVER A PREALLOCATED MESH
+    elif kernel == 'workspace':
+        g, g_x, x_max = modelFunctions('G', a_G=a_G, b_G=b_G)
+        t_prev, x_prev, rho_prev = iterateInWorkspace(number_of_iterations, t_prev, x_prev, rho_prev, k, m_G, alpha_G,
+                                                      x_initial_condition, g, g_x, x_max)
+
     # ITERATING
-    for iteration in range(number_of_iterations):
-        # COMPUTING INTERMEDIATE TIME-STEP
-        x_inter = intermediateTimeStep_G(x_prev, a_G, b_G, k, x_initial_condition)
-        # COMPUTING FULL TIME-STEP
-        t_prev, x_prev, rho_prev = fullTimeStep_G(t_prev, x_prev, x_inter, rho_prev, a_G, b_G, k, m_G,
-                                                         alpha_G, x_initial_condition)
+    else:
+        discarded_mass = 0.0
+        for iteration in range(number_of_iterations):
+            # COMPUTING INTERMEDIATE TIME-STEP
+            x_inter = intermediateTimeStep_G(x_prev, a_G, b_G, k, x_initial_condition)
+            # COMPUTING FULL TIME-STEP
+            t_prev, x_prev, rho_prev = fullTimeStep_G(t_prev, x_prev, x_inter, rho_prev, a_G, b_G, k, m_G,
+                                                      alpha_G, x_initial_condition)
+            # MERGING SATURATED POINTS
+            if saturation_tolerance:
+                x_prev, rho_prev = applySaturationCompaction(x_prev, rho_prev, saturation_tolerance, report)
+            # PRUNING NEGLIGIBLE POINTS
+            if pruning:
+                x_prev, rho_prev, discarded_mass = applyPruning(x_prev, rho_prev, pruning, discarded_mass, iteration,
+                                                                number_of_iterations, report)
+            # REDUCING MESH DIMENSION
+            if max_mesh_size:
+                x_prev, rho_prev = applyMeshReduction(x_prev, rho_prev, max_mesh_size, report)
 
     # EXPORTING
     if export_filename:
-        numerical_approximation_DF = pd.DataFrame({'x': x_prev, 'rho': rho_prev})
         export_path = '/Users/victor/Documents/TUM/Thesis/Output/' + export_filename + '.csv'
-        numerical_approximation_DF.to_csv(export_path, index=False)
+        tools.exportInChunks(x_prev, rho_prev, export_path)
 
     return x_prev, rho_prev
 
+# CLOSED-FORM CHARACTERISTIC MESH
+def characteristicMesh_G(birth_times, t, x_init, a_G, b_G):
+    # EVALUATES THE WHOLE MESH AT TIME 't' IN A SINGLE VECTORIZED
+    # CALL.  FOR GOMPERTZ GROWTH EACH MESH POINT IS A CHARACTER-
+    # ISTIC BORN AT 'x_init', HENCE ITS EXACT POSITION IS 'iwata.
+    # x_max_G(x_init, t - birth_time)'.  WRITING
+    #       s = exp(-a_G*(t - birth_time))
+    # IT IS EVALUATED AS  'log(x) = log(b_G) + s*log(x_init/b_G)'
+    # AND THE GROWTH AS 'g = a_G*x*s*log(b_G/x_init)',  WHICH COSTS
+    # TWO EXPONENTIALS AND NO LOGARITHM PER POINT.
+    #
+    # INPUT:
+    #   birth_times : NUMPY ARRAY. BIRTH TIMES OF THE MESH POINTS.
+    #   t : FLOAT. TIME AT WHICH THE MESH IS EVALUATED.
+    #   x_init,...,b_G : FLOATS. GOMPERTZ PARAMETERS.
+    #
+    # OUTPUT:
+    #   x : NUMPY ARRAY. TUMOR SIZES AT TIME 't'.
+    #   growth : NUMPY ARRAY. GOMPERTZ GROWTH AT 'x'.
+
+    log_ratio = np.log(x_init/b_G)
+    s = np.exp(a_G*(birth_times - t))
+    x = np.exp(np.log(b_G) + (s*log_ratio))
+    growth = -a_G*x*s*log_ratio
+
+    return x, growth
+
+# CLOSED-FORM ITERATION
+def iterateClosedForm_G(number_of_iterations, t_prev, x_initial, rho_initial, k, m_G, alpha_G, x_init, a_G, b_G):
+    # PERFORMS THE ITERATIONS OF 'iterate_G' WITHOUT INTEGRATING
+    # THE MESH NUMERICALLY.  EVERY POINT STORES ITS BIRTH TIME
+    # /'iwata.t_from_x_G' FOR THE INITIAL MESH/ AND IS EVALUATED
+    # EXACTLY BY  'characteristicMesh_G'.  THE DENSITY  USES THE
+    # EXACT JACOBIAN:  FOR AUTONOMOUS GROWTH THE FLUX  'q = rho*g'
+    # IS CONSTANT ALONG CHARACTERISTICS,  SO  'rho = q/g(x)'  AND
+    # THE ONLY QUANTITY COMPUTED BY THE SCHEME IS THE FLUX OF THE
+    # POINT BORN IN EACH ITERATION /IWATA'S BOUNDARY CONDITION,
+    # AS IN 'fullTimeStep_G'/. THIS REMOVES THE DISCRETIZATION
+    # ERROR OF 'intermediateTimeStep_G' AND 'fullTimeStep_G'.
+    #
+    # INPUT:
+    #   number_of_iterations,...,x_init : SEE FUNCTION 'iterate-
+    #                                     InWorkspace'.
+    #   a_G, b_G : FLOATS. GOMPERTZ PARAMETERS.
+    #
+    # OUTPUT:
+    #   t_prev : FLOAT. TIME AFTER THE LAST ITERATION.
+    #   x_prev : NUMPY ARRAY. COMPUTED TUMOR SIZES.
+    #   rho_prev : NUMPY ARRAY. COMPUTED DENSITY VALUES.
+
+    # ALLOCATING BUFFERS FOR THE FINAL MESH SIZE
+    capacity = len(x_initial) + number_of_iterations
+    birth_buffer = np.zeros(capacity)
+    flux_buffer = np.zeros(capacity)
+    start = number_of_iterations
+    birth_buffer[start:] = t_prev - iwata.t_from_x_G(np.asarray(x_initial, dtype=float), x_init, a_G, b_G)
+    x_prev, growth = characteristicMesh_G(birth_buffer[start:], t_prev, x_init, a_G, b_G)
+    flux_buffer[start:] = rho_initial*growth
+    beta_0 = iwata.beta(x_init, m_G, alpha_G)
+
+    # ITERATING
+    x_new = x_prev
+    rho_new = np.asarray(rho_initial, dtype=float)
+    for iteration in range(number_of_iterations):
+        t_new = t_prev + k
+        # ADDING THE NEWLY BORN POINT IN FRONT OF THE MESH
+        start -= 1
+        birth_buffer[start] = t_new
+        x_new, growth = characteristicMesh_G(birth_buffer[start:], t_new, x_init, a_G, b_G)
+        x_new[0] = x_init
+        rho_new = np.zeros(len(x_new))
+        np.divide(flux_buffer[start+1:], growth[1:], out=rho_new[1:], where=flux_buffer[start+1:] != 0)
+        beta_vals = iwata.beta(x_new, m_G, alpha_G)
+        x_new_jmin1, x_new_j = tools.splitShift(x_new, 1)
+        betaRho = np.multiply(beta_vals[1:], rho_new[1:])
+        betaRho_jmin1, betaRho_j = tools.splitShift(betaRho, 1)
+        coeff = 2/((2*growth[0])-((x_new[1]-x_new[0])*beta_0))
+        first_term = ((x_new[1]-x_new[0])/2)*betaRho[0]
+        sum_term = np.sum(np.multiply(((x_new_j[1:]-x_new_jmin1[1:])/2), (betaRho_jmin1+betaRho_j)))
+        additonal_seed = iwata.beta(iwata.x_max_G(x_init, t_new, a_G, b_G), m_G, alpha_G)
+        # INCORPORATING IWATA'S SEEDING TERM
+        rho_new[0] = coeff * (first_term + sum_term + additonal_seed)
+        flux_buffer[start] = rho_new[0]*growth[0]
+        t_prev = t_new
+
+    return t_prev, x_new, rho_new
+
+# BATCHED ITERATION
+def iterate_G_batch(number_of_iterations, initial_time, maximum_time, a_G, b_G, k, m_G, alpha_G, x_initial_condition,
+                    export_filename_list=None):
+    # SAME  AS  'iterate_G'  BUT  FOR SEVERAL PARAMETER SETS AT
+    # ONCE.  ARGUMENTS  'a_G',  'b_G',  'm_G'  AND 'alpha_G' MAY
+    # BE  LISTS  /OR  ARRAYS/  OF  EQUAL  LENGTH  OR  SCALARS
+    # SHARED  BY ALL SCENARIOS. SINCE EVERY SCENARIO HAS THE SAME
+    # NUMBER  OF ITERATIONS, ALL MESHES HAVE THE SAME LENGTH AT
+    # EVERY STEP AND ARE ADVANCED TOGETHER AS THE ROWS OF 2D AR-
+    # RAYS  OF  SHAPE  /n_params, mesh/.  THE ROWS ARE STORED IN
+    # PREALLOCATED  BUFFERS  /SEE  'iterateInWorkspace'/.  AS IN
+    # 'iterateFused',  'log(x)'  IS  KEPT ALONGSIDE 'x' AND SHARED
+    # BY  THE  GROWTH  FUNCTION  AND  THE COLONIZATION RATE. RE-
+    # SULTS AGREE WITH 'iterate_G' UP TO ROUNDING ERRORS.
+    #
+    # INPUT:
+    #   number_of_iterations,...,x_initial_condition : SEE FUNC-
+    #                       TION 'iterate_G'.
+    #   export_filename_list : LIST. DEFAULTS TO 'None'. CONTAINS
+    #                          ONE FILENAME /OR 'None'/ PER SCENA-
+    #                          RIO.
+    #
+    # HARD-CODED VARIABLES:
+    #   export_path : STRING.PATH USED TO SAVE THE DATAFRAME AS
+    #                 A '.csv'  FILE. EXPORTS FILE TO  'Output'
+    #                 DIRECTORY.
+    #
+    # OUTPUT:
+    #   x_list : LIST. CONTAINS ONE ARRAY OF TUMOR SIZES PER SCE-
+    #            NARIO.
+    #   rho_list : LIST.  CONTAINS  ONE  ARRAY  OF  DENSITY VALUES
+    #              PER SCENARIO.
+
+    # SETTING PARAMETERS AS COLUMN VECTORS
+    a_G, b_G, m_G, alpha_G = [np.asarray(parameter, dtype=float).ravel()
+                              for parameter in np.broadcast_arrays(a_G, b_G, m_G, alpha_G)]
+    number_of_scenarios = len(a_G)
+    a_col, b_col, m_col, alpha_col = [parameter[:, None] for parameter in (a_G, b_G, m_G, alpha_G)]
+    a_log_b_col = a_col*np.log(b_col)
+
+    # INITIALIZING NUMPY ARRAYS
+    t = np.linspace(initial_time, maximum_time, number_of_iterations+1)
+    x_initial = iwata.x_max_G(x_initial_condition, t, a_col, b_col)
+    capacity = x_initial.shape[1] + number_of_iterations
+    x_buffer = np.zeros((number_of_scenarios, capacity))
+    log_x_buffer = np.zeros((number_of_scenarios, capacity))
+    rho_buffer = np.zeros((number_of_scenarios, capacity))
+    start = number_of_iterations
+    x_buffer[:, start:] = x_initial
+    log_x_buffer[:, start:] = np.log(x_initial)
+    rho_buffer[:, start:] = iwata.rho_at_x_t0(x_initial[0], t)
+
+    # ITERATING
+    t_prev = initial_time
+    for iteration in range(number_of_iterations):
+        x_prev = x_buffer[:, start:]
+        rho_prev = rho_buffer[:, start:]
+        # COMPUTING INTERMEDIATE TIME-STEP /g_G = a_G*x*(log(b_G)-log(x))/
+        x_inter = x_prev*(1+((k/2)*(a_log_b_col-(a_col*log_x_buffer[:, start:]))))
+        # COMPUTING FULL TIME-STEP
+        t_new = t_prev + k
+        specific_growth = a_log_b_col-(a_col*np.log(x_inter))
+        x_prev += k*x_inter*specific_growth
+        rho_prev *= np.exp(-k*(specific_growth-a_col))
+        start -= 1
+        x_new = x_buffer[:, start:]
+        rho_new = rho_buffer[:, start:]
+        x_new[:, 0] = x_initial_condition
+        log_x_buffer[:, start:] = np.log(x_new)
+        beta_vals = m_col*np.exp(alpha_col*log_x_buffer[:, start:])
+        betaRho = np.multiply(beta_vals[:, 1:], rho_new[:, 1:])
+        coeff = 2/((2*iwata.g_G(x_new[:, 0], a_G, b_G))-((x_new[:, 1]-x_new[:, 0])*beta_vals[:, 0]))
+        first_term = ((x_new[:, 1]-x_new[:, 0])/2)*betaRho[:, 0]
+        sum_term = np.sum(np.multiply(((x_new[:, 2:]-x_new[:, 1:-1])/2), (betaRho[:, :-1]+betaRho[:, 1:])), axis=1)
+        additonal_seed = iwata.beta(iwata.x_max_G(x_initial_condition, t_new, a_G, b_G), m_G, alpha_G)
+        # INCORPORATING IWATA'S SEEDING TERM
+        rho_new[:, 0] = coeff * (first_term + sum_term + additonal_seed)
+        t_prev = t_new
+
+    # SPLITTING SCENARIOS
+    x_list = list(x_buffer)
+    rho_list = list(rho_buffer)
+
+    # EXPORTING
+    if export_filename_list:
+        for x_prev, rho_prev, export_filename in zip(x_list, rho_list, export_filename_list):
+            if export_filename:
+                numerical_approximation_DF = pd.DataFrame({'x': x_prev, 'rho': rho_prev})
+                export_path = '/Users/victor/Documents/TUM/Thesis/Output/' + export_filename + '.csv'
+                numerical_approximation_DF.to_csv(export_path, index=False)
+
+    return x_list, rho_list
+
+# ITERATION FOR SEVERAL COLONIZATION RATES
+def iterate_G_colonization(number_of_iterations, initial_time, maximum_time, a_G, b_G, k, m_G, alpha_G,
+                           x_initial_condition, export_filename_list=None, initialize=True, x_initial=None,
+                           rho_initial=None):
+    # SAME  AS  'iterate_G'  BUT  FOR SEVERAL PAIRS  OF  'm_G' AND
+    # 'alpha_G' AT ONCE.  THE MESH 'x' AND THE TRANSPORT FACTOR
+    # 'exp(-k*g_x_G)'  ONLY DEPEND ON  'a_G', 'b_G', 'k' AND 'x_-
+    # initial_condition':  THEY ARE ADVANCED ONCE AND SHARED BY
+    # ALL PAIRS, WHILE ONE ROW OF 'rho' IS CARRIED PER PAIR.  THE
+    # PAIRS ONLY ENTER THROUGH THE COLONIZATION RATE  OF THE BOUN-
+    # DARY CONDITION,  WHOSE TRAPEZOID SUMS ARE COMPUTED FOR ALL
+    # PAIRS AS A SINGLE MATRIX-VECTOR PRODUCT. AS IN 'iterateFused',
+    # 'log(x)' IS KEPT ALONGSIDE 'x'. RESULTS AGREE WITH 'iterate_
+    # G' UP TO ROUNDING ERRORS.
+    #
+    # INPUT:
+    #   number_of_iterations,...,b_G, k : SEE FUNCTION 'iterate_G'.
+    #   m_G, alpha_G : LISTS /OR ARRAYS/ OF EQUAL LENGTH OR SCALARS
+    #                  SHARED BY ALL PAIRS.
+    #   x_initial_condition : SEE FUNCTION 'iterate_G'.
+    #   export_filename_list : LIST. DEFAULTS TO 'None'. CONTAINS
+    #                          ONE FILENAME /OR 'None'/ PER PAIR.
+    #   initialize, x_initial, rho_initial : SEE FUNCTION 'ite-
+    #                          rate_G'. 'rho_initial' MAY HOLD ONE
+    #                          ROW PER PAIR.
+    #
+    # HARD-CODED VARIABLES:
+    #   export_path : STRING.PATH USED TO SAVE THE DATAFRAME AS
+    #                 A '.csv'  FILE. EXPORTS FILE TO  'Output'
+    #                 DIRECTORY.
+    #
+    # OUTPUT:
+    #   x_G : NUMPY ARRAY. COMPUTED TUMOR SIZES, SHARED BY ALL PAIRS.
+    #   rho_list : LIST.  CONTAINS  ONE  ARRAY  OF  DENSITY VALUES
+    #              PER PAIR.
+
+    # SETTING PARAMETERS AS COLUMN VECTORS
+    m_G, alpha_G = [np.asarray(parameter, dtype=float).ravel() for parameter in np.broadcast_arrays(m_G, alpha_G)]
+    colonization = iwata.Colonization(m_G[:, None], alpha_G[:, None])
+    a_log_b_G = a_G*np.log(b_G)
+
+    if initialize:
+        # INITIALIZING NUMPY ARRAYS
+        t = np.linspace(initial_time, maximum_time, number_of_iterations+1)
+        x_initial = iwata.x_max_G(x_initial_condition, t, a_G, b_G)
+        rho_initial = iwata.rho_at_x_t0(x_initial, t)
+
+    # ALLOCATING BUFFERS FOR THE FINAL MESH SIZE
+    capacity = len(x_initial) + number_of_iterations
+    x_buffer = np.zeros(capacity)
+    log_x_buffer = np.zeros(capacity)
+    rho_buffer = np.zeros((len(m_G), capacity))
+    start = number_of_iterations
+    x_buffer[start:] = x_initial
+    log_x_buffer[start:] = np.log(x_initial)
+    rho_buffer[:, start:] = rho_initial
+    log_x_init = np.log(x_initial_condition)
+    beta_0 = colonization.rate(log_x_init)[:, 0]
+    g_0 = iwata.g_G(x_initial_condition, a_G, b_G)
+
+    # ITERATING
+    t_prev = initial_time
+    for iteration in range(number_of_iterations):
+        x_prev = x_buffer[start:]
+        # COMPUTING INTERMEDIATE TIME-STEP /g_G = a_G*x*(log(b_G)-log(x))/
+        x_inter = x_prev*(1+((k/2)*(a_log_b_G-(a_G*log_x_buffer[start:]))))
+        # COMPUTING FULL TIME-STEP ONCE FOR ALL PAIRS
+        t_new = t_prev + k
+        specific_growth = a_log_b_G-(a_G*np.log(x_inter))
+        x_prev += k*x_inter*specific_growth
+        rho_buffer[:, start:] *= np.exp(-k*(specific_growth-a_G))
+        log_x_buffer[start:] = np.log(x_prev)
+        # ADDING THE NEWLY BORN POINT IN FRONT OF THE MESH
+        start -= 1
+        x_new = x_buffer[start:]
+        rho_new = rho_buffer[:, start:]
+        x_new[0] = x_initial_condition
+        log_x_buffer[start] = log_x_init
+        # TRAPEZOID WEIGHTS OF THE BOUNDARY INTEGRAL /SHARED BY ALL PAIRS/
+        half_x_differences = np.diff(x_new)/2
+        weights = half_x_differences.copy()
+        weights[:-1] += half_x_differences[1:]
+        betaRho = colonization.rate(log_x_buffer[start+1:])*rho_new[:, 1:]
+        coeff = 2/((2*g_0)-((x_new[1]-x_new[0])*beta_0))
+        additonal_seed = colonization.rate(np.log(iwata.x_max_G(x_initial_condition, t_new, a_G, b_G)))[:, 0]
+        # INCORPORATING IWATA'S SEEDING TERM
+        rho_new[:, 0] = coeff * ((betaRho @ weights) + additonal_seed)
+        t_prev = t_new
+
+    # SPLITTING PAIRS
+    x_G = x_buffer
+    rho_list = list(rho_buffer)
+
+    # EXPORTING
+    if export_filename_list:
+        for rho_G, export_filename in zip(rho_list, export_filename_list):
+            if export_filename:
+                numerical_approximation_DF = pd.DataFrame({'x': x_G, 'rho': rho_G})
+                export_path = '/Users/victor/Documents/TUM/Thesis/Output/' + export_filename + '.csv'
+                numerical_approximation_DF.to_csv(export_path, index=False)
+
+    return x_G, rho_list
+
+# STREAMED ITERATION
+def iterate_G_stream(number_of_iterations, initial_time, maximum_time, a_G, b_G, k, m_G, alpha_G, x_initial_condition,
+                     stride=None, times=None, initialize=True, x_initial=None, rho_initial=None):
+    # GENERATOR VERSION OF 'iterate_G'.  INSTEAD OF RETURNING THE
+    # FINAL  'x'  AND  'rho',  IT YIELDS THE INTERMEDIATE STATES
+    # /SEE FUNCTION 'streamInWorkspace'/,  SO  OBSERVABLES  CAN BE
+    # COMPUTED AT SEVERAL TIMES IN A SINGLE RUN. THE STATE AFTER
+    # 'n' ITERATIONS IS IDENTICAL TO THE RESULT OF 'iterate_G' RUN
+    # FOR 'n' ITERATIONS ON THE SAME INITIAL MESH.
+    #
+    # INPUT:
+    #   number_of_iterations,...,x_initial_condition : SEE FUNC-
+    #                                                  TION 'iterate_G'.
+    #   stride, times : SEE FUNCTION 'streamInWorkspace'.
+    #   initialize, x_initial, rho_initial : SEE FUNCTION 'ite-
+    #                                        rate_G'.
+    #
+    # OUTPUT /YIELDED/:
+    #   t : FLOAT. TIME AFTER THE ITERATION.
+    #   x_view : NUMPY ARRAY. VIEW OF THE COMPUTED TUMOR SIZES.
+    #   rho_view : NUMPY ARRAY. VIEW OF THE COMPUTED DENSITY VALUES.
+
+    if initialize:
+        # INITIALIZING NUMPY ARRAYS
+        t = np.linspace(initial_time, maximum_time, number_of_iterations+1)
+        x_initial = iwata.x_max_G(x_initial_condition, t, a_G, b_G)
+        rho_initial = iwata.rho_at_x_t0(x_initial, t)
+
+    # ITERATING
+    g, g_x, x_max = modelFunctions('G', a_G=a_G, b_G=b_G)
+    yield from streamInWorkspace(number_of_iterations, initial_time, x_initial, rho_initial, k, m_G, alpha_G,
+                                 x_initial_condition, g, g_x, x_max, stride=stride, times=times)
+
 
 # =================================================== GOMPERTZ & LIN-QUAD =============================================
 # INTERMEDIATE TIME-STEP
@@ -239,16 +735,18 @@ def fullTimeStep_GLQ(t_prev, x_prev, x_inter, rho_prev, a_G, b_G, k, m_G, D_LQ,
 
 # ITERATION
 def iterate_GLQ(number_of_iterations,initial_time, maximum_time, a_G, b_G, k, m_G, D_LQ, alpha_G, alpha_LQ, beta_LQ,
-                x_initial_condition, export_filename=None, initialize=True, x_initial=None, rho_initial=None):
+                x_initial_condition, export_filename=None, initialize=True, x_initial=None, rho_initial=None,
+                kernel='standard', passes=None, report=None, threads=None, scratch_directory=None,
+                step_control=None):
     # ITERATES OVER CALLS TO FUNCTIONS  'intermediateTimeStep',
     # AND  'fullTimeStep' AS SEEN IN THE ANGULO PAPERS. IN EACH
     # ITERATION IT COMPUTES NUMERICAL APPROXIMATIONS FOR 'x(t)'
     # /TUMOR SIZE IN CELLS/,  AND 'rho(x,t)' /THE CORRESPONDING
-    # DENSITY/. UNLIKE IN THE ANGULO PAPERS, NO DIMENSIONAL RE-
-    # DUCTION IS PERFORMED i.e: THE ARRAYS' DIMENSION INCREASES
-    # BY  1  EACH ITERATION. THE MORE ITERATIONS, THE FINER THE
-    # FINAL MESH ON THE 'x(t)' ARRAY /AND THEREFORE MORE EVALU-
-    # ATIONS OF 'rho'/.
+    # DENSITY/. BY DEFAULT, UNLIKE IN THE ANGULO PAPERS, NO DI-
+    # MENSIONAL REDUCTION IS PERFORMED i.e: THE ARRAYS' DIMEN-
+    # SION INCREASES BY 1 EACH ITERATION /THE MORE ITERATIONS,
+    # THE FINER THE FINAL MESH/. REDUCTION IS OPT-IN THROUGH
+    # 'passes' /SEE 'PASSES'/.
     #
     # INPUT:
     #   number_of_iterations : INTEGER. SPECIFIES THE NUMBER OF
@@ -262,6 +760,9 @@ def iterate_GLQ(number_of_iterations,initial_time, maximum_time, a_G, b_G, k, m_
     #   initialize : BOOLEAN. DEFUALTS TO TRUE. IF SET TO FALSE
     #                USES     PARAMETERS     'x_initial'    AND
     #                'rho_initial'.
+    #   kernel,...,step_control : SEE FUNCTION 'iterate_G'. THE
+    #                             'closed_form' KERNEL IS NOT AVAI-
+    #                             LABLE.
     #
     # HARD-CODED VARIABLES:
     #   export_path : STRING.PATH USED TO SAVE THE DATAFRAME AS
@@ -274,7 +775,19 @@ def iterate_GLQ(number_of_iterations,initial_time, maximum_time, a_G, b_G, k, m_
     #   export_filename.csv : CSV FILE. STORED
     #                         'numerical_approximation_DF'.
 
-    if initialize:
+    # CHECKING KERNEL AND POST-STEP PASSES
+    passes = checkKernel('GLQ', kernel, passes, threads, scratch_directory, step_control)
+    saturation_tolerance = passes.get('saturation_tolerance')
+    pruning = passes.get('pruning')
+    max_mesh_size = passes.get('max_mesh_size')
+
+    if initialize and scratch_directory is not None:
+        # INITIALIZING MAPPED ARRAYS /SEE 'scratch_directory'/
+        x_initial, rho_initial = initialMeshInChunks(lambda t: mix.x_max_GLQ(x_initial_condition, t, a_G, b_G, D_LQ,
+                                                                            alpha_LQ, beta_LQ),
+                                                     initial_time, maximum_time, number_of_iterations+1,
+                                                     scratch_directory)
+    elif initialize:
         # INITIALIZING NUMPY ARRAYS
         t = np.linspace(initial_time, maximum_time, number_of_iterations+1)
         x_initial = mix.x_max_GLQ(x_initial_condition, t, a_G, b_G, D_LQ, alpha_LQ, beta_LQ)
@@ -285,22 +798,108 @@ def iterate_GLQ(number_of_iterations,initial_time, maximum_time, a_G, b_G, k, m_
     x_prev = x_initial
     rho_prev = rho_initial
 
+    # ITERATING WITH THE MULTITHREADED KERNEL
+    if kernel == 'threaded':
+        t_prev, x_prev, rho_prev = iterateThreaded('GLQ', number_of_iterations, t_prev, x_prev, rho_prev, k, m_G,
+                                                   alpha_G, x_initial_condition, a_G=a_G, b_G=b_G, D_LQ=D_LQ,
+                                                   alpha_LQ=alpha_LQ, beta_LQ=beta_LQ, threads=threads,
+                                                   scratch_directory=scratch_directory)
+
+    # ITERATING WITH AN ADAPTIVE TIME-STEP
+    elif kernel == 'adaptive':
+        g, g_x, x_max = modelFunctions('GLQ', a_G=a_G, b_G=b_G, D_LQ=D_LQ, alpha_LQ=alpha_LQ, beta_LQ=beta_LQ)
+        t_prev, x_prev, rho_prev = iterateAdaptive(t_prev, initial_time + (number_of_iterations*k), x_prev, rho_prev, k,
+                                                   m_G, alpha_G, x_initial_condition, g, g_x, x_max, report=report,
+                                                   **(step_control or {}))
+
+    # ITERATING WITH HIGHER-ORDER TRANSPORT AND QUADRATURE
+    elif kernel == 'high_order':
+        g, g_x, x_max = modelFunctions('GLQ', a_G=a_G, b_G=b_G, D_LQ=D_LQ, alpha_LQ=alpha_LQ, beta_LQ=beta_LQ)
+        t_prev, x_prev, rho_prev = iterateHighOrder(number_of_iterations, t_prev, x_prev, rho_prev, k, m_G, alpha_G,
+                                                    x_initial_condition, g, g_x, x_max)
+
+    # ITERATING IN THE LOG-DOMAIN
+    elif kernel == 'log_density':
+        law = growthLaw('GLQ', a_G=a_G, b_G=b_G, D_LQ=D_LQ, alpha_LQ=alpha_LQ, beta_LQ=beta_LQ)
+        t_prev, x_prev, rho_prev = iterateLogDomain(number_of_iterations, t_prev, x_prev, rho_prev, k, m_G, alpha_G,
+                                                    x_initial_condition, law, report)
+
+    # ITERATING WITH THE COMPILED KERNEL
+    elif kernel == 'numba' and numbaAvailable():
+        t_prev, x_prev, rho_prev = compiled.iterateCompiled('GLQ', number_of_iterations, t_prev, x_prev, rho_prev, k,
+                                                            m_G, alpha_G, x_initial_condition, a_G=a_G, b_G=b_G,
+                                                            D_LQ=D_LQ, alpha_LQ=alpha_LQ, beta_LQ=beta_LQ)
+
+    # ITERATING WITH THE FUSED KERNEL
+    elif kernel in ('fused', 'numba'):
+        t_prev, x_prev, rho_prev = iterateFused('GLQ', number_of_iterations, t_prev, x_prev, rho_prev, k, m_G, alpha_G,
+                                                x_initial_condition, a_G=a_G, b_G=b_G, D_LQ=D_LQ, alpha_LQ=alpha_LQ,
+                                                beta_LQ=beta_LQ)
+
+    # ITERATING OVER A PREALLOCATED MESH
+    elif kernel == 'workspace':
+        g, g_x, x_max = modelFunctions('GLQ', a_G=a_G, b_G=b_G, D_LQ=D_LQ, alpha_LQ=alpha_LQ, beta_LQ=beta_LQ)
+        t_prev, x_prev, rho_prev = iterateInWorkspace(number_of_iterations, t_prev, x_prev, rho_prev, k, m_G, alpha_G,
+                                                      x_initial_condition, g, g_x, x_max)
+
     # ITERATING
-    for iteration in range(number_of_iterations):
-        # COMPUTING INTERMEDIATE TIME-STEP
-        x_inter = intermediateTimeStep_GLQ(t_prev, x_prev, a_G, b_G, k, D_LQ, alpha_LQ, beta_LQ, x_initial_condition)
-        # COMPUTING FULL TIME-STEP
-        t_prev, x_prev, rho_prev = fullTimeStep_GLQ(t_prev, x_prev, x_inter, rho_prev, a_G, b_G, k, m_G,
-                                                    D_LQ, alpha_G, alpha_LQ, beta_LQ, x_initial_condition)
+    else:
+        discarded_mass = 0.0
+        for iteration in range(number_of_iterations):
+            # COMPUTING INTERMEDIATE TIME-STEP
+            x_inter = intermediateTimeStep_GLQ(t_prev, x_prev, a_G, b_G, k, D_LQ, alpha_LQ, beta_LQ,
+                                               x_initial_condition)
+            # COMPUTING FULL TIME-STEP
+            t_prev, x_prev, rho_prev = fullTimeStep_GLQ(t_prev, x_prev, x_inter, rho_prev, a_G, b_G, k, m_G,
+                                                        D_LQ, alpha_G, alpha_LQ, beta_LQ, x_initial_condition)
+            # MERGING SATURATED POINTS
+            if saturation_tolerance:
+                x_prev, rho_prev = applySaturationCompaction(x_prev, rho_prev, saturation_tolerance, report)
+            # PRUNING NEGLIGIBLE POINTS
+            if pruning:
+                x_prev, rho_prev, discarded_mass = applyPruning(x_prev, rho_prev, pruning, discarded_mass, iteration,
+                                                                number_of_iterations, report)
+            # REDUCING MESH DIMENSION
+            if max_mesh_size:
+                x_prev, rho_prev = applyMeshReduction(x_prev, rho_prev, max_mesh_size, report)
 
     # EXPORTING
     if export_filename:
-        numerical_approximation_DF = pd.DataFrame({'x': x_prev, 'rho': rho_prev})
         export_path = '/Users/victor/Documents/TUM/Thesis/Output/' + export_filename + '.csv'
-        numerical_approximation_DF.to_csv(export_path, index=False)
+        tools.exportInChunks(x_prev, rho_prev, export_path)
 
     return x_prev, rho_prev
 
+# STREAMED ITERATION
+def iterate_GLQ_stream(number_of_iterations, initial_time, maximum_time, a_G, b_G, k, m_G, D_LQ, alpha_G, alpha_LQ,
+                       beta_LQ, x_initial_condition, stride=None, times=None, initialize=True, x_initial=None,
+                       rho_initial=None):
+    # GENERATOR VERSION OF 'iterate_GLQ'. SEE FUNCTION 'iterate_
+    # G_stream'.
+    #
+    # INPUT:
+    #   number_of_iterations,...,x_initial_condition : SEE FUNC-
+    #                                                  TION 'iterate_GLQ'.
+    #   stride, times : SEE FUNCTION 'streamInWorkspace'.
+    #   initialize, x_initial, rho_initial : SEE FUNCTION 'ite-
+    #                                        rate_GLQ'.
+    #
+    # OUTPUT /YIELDED/:
+    #   t : FLOAT. TIME AFTER THE ITERATION.
+    #   x_view : NUMPY ARRAY. VIEW OF THE COMPUTED TUMOR SIZES.
+    #   rho_view : NUMPY ARRAY. VIEW OF THE COMPUTED DENSITY VALUES.
+
+    if initialize:
+        # INITIALIZING NUMPY ARRAYS
+        t = np.linspace(initial_time, maximum_time, number_of_iterations+1)
+        x_initial = mix.x_max_GLQ(x_initial_condition, t, a_G, b_G, D_LQ, alpha_LQ, beta_LQ)
+        rho_initial = iwata.rho_at_x_t0(x_initial, t)
+
+    # ITERATING
+    g, g_x, x_max = modelFunctions('GLQ', a_G=a_G, b_G=b_G, D_LQ=D_LQ, alpha_LQ=alpha_LQ, beta_LQ=beta_LQ)
+    yield from streamInWorkspace(number_of_iterations, initial_time, x_initial, rho_initial, k, m_G, alpha_G,
+                                 x_initial_condition, g, g_x, x_max, stride=stride, times=times)
+
 
 # ======================================================== LIN-QUAD ===================================================
 # INTERMEDIATE TIME STEP
@@ -383,16 +982,17 @@ def fullTimeStep_LQ(t_prev, x_prev, x_inter, rho_prev, k, m_G, D_LQ, alpha_G, al
 
 # ITERATION
 def iterate_LQ(number_of_iterations, initial_time, maximum_time, k, m_G, D_LQ, alpha_G, alpha_LQ, beta_LQ,
-               x_initial_condition, export_filename=None):
+               x_initial_condition, export_filename=None, kernel='standard', passes=None, report=None,
+               threads=None, scratch_directory=None):
     # ITERATES OVER CALLS TO FUNCTIONS  'intermediateTimeStep',
     # AND  'fullTimeStep' AS SEEN IN THE ANGULO PAPERS. IN EACH
     # ITERATION IT COMPUTES NUMERICAL APPROXIMATIONS FOR 'x(t)'
     # /TUMOR SIZE IN CELLS/,  AND 'rho(x,t)' /THE CORRESPONDING
-    # DENSITY/. UNLIKE IN THE ANGULO PAPERS, NO DIMENSIONAL RE-
-    # DUCTION IS PERFORMED i.e: THE ARRAYS' DIMENSION INCREASES
-    # BY  1  EACH ITERATION. THE MORE ITERATIONS, THE FINER THE
-    # FINAL MESH ON THE 'x(t)' ARRAY /AND THEREFORE MORE EVALU-
-    # ATIONS OF 'rho'/.
+    # DENSITY/. BY DEFAULT, UNLIKE IN THE ANGULO PAPERS, NO DI-
+    # MENSIONAL REDUCTION IS PERFORMED i.e: THE ARRAYS' DIMEN-
+    # SION INCREASES BY 1 EACH ITERATION /THE MORE ITERATIONS,
+    # THE FINER THE FINAL MESH/. REDUCTION IS OPT-IN THROUGH
+    # 'passes' /SEE 'PASSES'/.
     #
     # INPUT:
     #   number_of_iterations : INTEGER. SPECIFIES THE NUMBER OF
@@ -413,6 +1013,14 @@ def iterate_LQ(number_of_iterations, initial_time, maximum_time, k, m_G, D_LQ, a
     #   rho_initial : NUMPY  ARRAY.  CONTAINS   DENSITY VALUES.
     #                 ONLY USED  WHEN  'initialize'  IS  SET TO
     #                 FALSE.
+    #   kernel, passes, report, threads, scratch_directory : SEE
+    #                       FUNCTION 'iterate_G'.  INSTEAD OF 'log_
+    #                       density' AND 'closed_form' THE 'scaled'
+    #                       KERNEL IS AVAILABLE: 'iterateScaled_LQ'
+    #                       COSTS 'O(1)' PER TIME-STEP BY UPDATING
+    #                       ALL POINTS VIA GLOBAL SCALES.  THE
+    #                       'saturation_tolerance' PASS IS NOT
+    #                       AVAILABLE.
     #
     # HARD-CODED VARIABLES:
     #   export_path : STRING.PATH USED TO SAVE THE DATAFRAME AS
@@ -425,32 +1033,1179 @@ def iterate_LQ(number_of_iterations, initial_time, maximum_time, k, m_G, D_LQ, a
     #   export_filename.csv : CSV FILE. STORED
     #                         'numerical_approximation_DF'.
 
-    # INITIALIZING NUMPY ARRAYS
-    t = np.linspace(initial_time, maximum_time, number_of_iterations+1)
-    x_initial = enderling.x_max_LQ(x_initial_condition, t, D_LQ, alpha_LQ, beta_LQ)
-    rho_initial = iwata.rho_at_x_t0(x_initial, t)
+    # CHECKING KERNEL AND POST-STEP PASSES
+    passes = checkKernel('LQ', kernel, passes, threads, scratch_directory)
+    pruning = passes.get('pruning')
+    max_mesh_size = passes.get('max_mesh_size')
+
+    if scratch_directory is not None:
+        # INITIALIZING MAPPED ARRAYS /SEE 'scratch_directory'/
+        x_initial, rho_initial = initialMeshInChunks(lambda t: enderling.x_max_LQ(x_initial_condition, t, D_LQ,
+                                                                                  alpha_LQ, beta_LQ),
+                                                     initial_time, maximum_time, number_of_iterations+1,
+                                                     scratch_directory)
+    else:
+        # INITIALIZING NUMPY ARRAYS
+        t = np.linspace(initial_time, maximum_time, number_of_iterations+1)
+        x_initial = enderling.x_max_LQ(x_initial_condition, t, D_LQ, alpha_LQ, beta_LQ)
+        rho_initial = iwata.rho_at_x_t0(x_initial, t)
 
     # INITIALIZING VARIABLES
     t_prev = initial_time
     x_prev = x_initial
     rho_prev = rho_initial
 
+    # ITERATING WITH THE MULTITHREADED KERNEL
+    if kernel == 'threaded':
+        t_prev, x_prev, rho_prev = iterateThreaded('LQ', number_of_iterations, t_prev, x_prev, rho_prev, k, m_G,
+                                                   alpha_G, x_initial_condition, D_LQ=D_LQ, alpha_LQ=alpha_LQ,
+                                                   beta_LQ=beta_LQ, threads=threads,
+                                                   scratch_directory=scratch_directory)
+
+    # ITERATING WITH HIGHER-ORDER TRANSPORT AND QUADRATURE
+    elif kernel == 'high_order':
+        g, g_x, x_max = modelFunctions('LQ', D_LQ=D_LQ, alpha_LQ=alpha_LQ, beta_LQ=beta_LQ)
+        t_prev, x_prev, rho_prev = iterateHighOrder(number_of_iterations, t_prev, x_prev, rho_prev, k, m_G, alpha_G,
+                                                    x_initial_condition, g, g_x, x_max)
+
+    # ITERATING WITH GLOBAL SCALES
+    elif kernel == 'scaled':
+        t_prev, x_prev, rho_prev = iterateScaled_LQ(number_of_iterations, t_prev, x_prev, rho_prev, k, m_G, alpha_G,
+                                                    x_initial_condition, D_LQ, alpha_LQ, beta_LQ, report)
+
+    # ITERATING WITH THE COMPILED KERNEL
+    elif kernel == 'numba' and numbaAvailable():
+        t_prev, x_prev, rho_prev = compiled.iterateCompiled('LQ', number_of_iterations, t_prev, x_prev, rho_prev, k,
+                                                            m_G, alpha_G, x_initial_condition, D_LQ=D_LQ,
+                                                            alpha_LQ=alpha_LQ, beta_LQ=beta_LQ)
+
+    # ITERATING WITH THE FUSED KERNEL
+    elif kernel in ('fused', 'numba'):
+        t_prev, x_prev, rho_prev = iterateFused('LQ', number_of_iterations, t_prev, x_prev, rho_prev, k, m_G, alpha_G,
+                                                x_initial_condition, D_LQ=D_LQ, alpha_LQ=alpha_LQ, beta_LQ=beta_LQ)
+
+    # ITERATING OVER A PREALLOCATED MESH
+    elif kernel == 'workspace':
+        g, g_x, x_max = modelFunctions('LQ', D_LQ=D_LQ, alpha_LQ=alpha_LQ, beta_LQ=beta_LQ)
+        t_prev, x_prev, rho_prev = iterateInWorkspace(number_of_iterations, t_prev, x_prev, rho_prev, k, m_G, alpha_G,
+                                                      x_initial_condition, g, g_x, x_max)
+
     # ITERATING
-    for iteration in range(number_of_iterations):
-        # COMPUTING INTERMEDIATE TIME-STEP
-        x_inter = intermediateTimeStep_LQ(t_prev, x_prev, k, D_LQ, alpha_LQ, beta_LQ, x_initial_condition)
-        # COMPUTING FULL TIME-STEP
-        t_prev, x_prev, rho_prev = fullTimeStep_LQ(t_prev, x_prev, x_inter, rho_prev, k, m_G, D_LQ, alpha_G,
-                                                    alpha_LQ, beta_LQ, x_initial_condition)
+    else:
+        discarded_mass = 0.0
+        for iteration in range(number_of_iterations):
+            # COMPUTING INTERMEDIATE TIME-STEP
+            x_inter = intermediateTimeStep_LQ(t_prev, x_prev, k, D_LQ, alpha_LQ, beta_LQ, x_initial_condition)
+            # COMPUTING FULL TIME-STEP
+            t_prev, x_prev, rho_prev = fullTimeStep_LQ(t_prev, x_prev, x_inter, rho_prev, k, m_G, D_LQ, alpha_G,
+                                                       alpha_LQ, beta_LQ, x_initial_condition)
+            # PRUNING NEGLIGIBLE POINTS
+            if pruning:
+                x_prev, rho_prev, discarded_mass = applyPruning(x_prev, rho_prev, pruning, discarded_mass, iteration,
+                                                                number_of_iterations, report)
+            # REDUCING MESH DIMENSION
+            if max_mesh_size:
+                x_prev, rho_prev = applyMeshReduction(x_prev, rho_prev, max_mesh_size, report)
 
     # EXPORTING
     if export_filename:
-        numerical_approximation_DF = pd.DataFrame({'x': x_prev, 'rho': rho_prev})
         export_path = '/Users/victor/Documents/TUM/Thesis/Output/' + export_filename + '.csv'
-        numerical_approximation_DF.to_csv(export_path, index=False)
+        tools.exportInChunks(x_prev, rho_prev, export_path)
+
+    return x_prev, rho_prev
+
+
+# LAZILY SCALED ITERATION
+def iterateScaled_LQ(number_of_iterations, t_prev, x_initial, rho_initial, k, m_G, alpha_G, x_init, D_LQ, alpha_LQ,
+                     beta_LQ, report=None):
+    # PERFORMS THE SAME ITERATIONS AS 'iterate_LQ' IN 'O(1)' PER
+    # TIME-STEP.  SINCE  'g_LQ = -c(t)*x',  INTERMEDIATE AND FULL
+    # TIME-STEP MULTIPLY  EVERY  EXISTING TUMOR SIZE BY THE SAME
+    # FACTOR  '1 - k*c(t)*(1 - k*c(t)/2)'  AND  EVERY DENSITY BY
+    # 'exp(k*c(t+k))'.  THESE FACTORS ARE  ACCUMULATED AS GLOBAL
+    # SCALES /IN LOGARITHMIC FORM/ AND THE MESH IS STORED DIVIDED
+    # BY THEM. THE TRAPEZOID SUM OF THE BOUNDARY CONDITION OVER
+    # THE EXISTING POINTS SCALES WITH 'x_scale**(1+alpha_G)*rho_-
+    # scale',  HENCE  IT  IS STORED AS A RUNNING SUM AND EACH NEW
+    # POINT ONLY ADDS ITS OWN TRAPEZOID PAIR. 'x' AND 'rho' ARE
+    # ONLY MATERIALIZED /'O(N)'/ ON OUTPUT AND WHEN THE SCALES
+    # GROW TOO LARGE TO BE STORED SAFELY.  RESULTS AGREE WITH THE
+    # REGULAR ITERATION UP TO ROUNDING ERRORS /SEE 'tools.compare-
+    # Kernels'/.
+    #
+    # INPUT:
+    #   number_of_iterations,...,x_init : SEE FUNCTION 'iterate-
+    #                                     InWorkspace'.
+    #   D_LQ, alpha_LQ, beta_LQ : FLOATS. RADIOTHERAPY PARAMETERS.
+    #   report : DICTIONARY. DEFAULTS TO 'None'. IF GIVEN, THE NUM-
+    #            BER OF RENORMALIZATIONS IS STORED UNDER 'renorma-
+    #            lizations'.
+    #
+    # HARD-CODED VARIABLES:
+    #   log_scale_limit : FLOAT. LARGEST LOGARITHM OF THE SCALES
+    #                     BEFORE THEY ARE APPLIED TO THE STORED MESH.
+    #
+    # OUTPUT:
+    #   t_prev : FLOAT. TIME AFTER THE LAST ITERATION.
+    #   x_prev : NUMPY ARRAY. COMPUTED TUMOR SIZES.
+    #   rho_prev : NUMPY ARRAY. COMPUTED DENSITY VALUES.
+
+    log_scale_limit = 200
+    law = enderling.LinQuadGrowth(D_LQ, alpha_LQ, beta_LQ)
+
+    # ALLOCATING BUFFERS FOR THE FINAL MESH SIZE
+    capacity = len(x_initial) + number_of_iterations
+    x_buffer = np.zeros(capacity)
+    rho_buffer = np.zeros(capacity)
+    start = number_of_iterations
+    x_buffer[start:] = x_initial
+    rho_buffer[start:] = rho_initial
+    # TRAPEZOID SUM OVER THE INITIAL MESH
+    betaRho = iwata.beta(x_buffer[start:], m_G, alpha_G)*rho_buffer[start:]
+    pair_sum = np.sum((np.diff(x_buffer[start:])/2)*(betaRho[:-1]+betaRho[1:]))
+    front_betaRho = betaRho[0]
+    log_x_scale = 0.0
+    log_rho_scale = 0.0
+    renormalizations = 0
+    beta_0 = iwata.beta(x_init, m_G, alpha_G)
+
+    # ITERATING
+    for iteration in range(number_of_iterations):
+        t_new = t_prev + k
+        # SCALING ALL EXISTING POINTS AT ONCE
+        rate_prev = law.specificRate(t_prev)
+        log_x_scale += np.log(1 + (k*rate_prev*(1+((k/2)*rate_prev))))
+        log_rho_scale -= k*law.specificRate(t_new)
+        x_scale = np.exp(log_x_scale)
+        rho_scale = np.exp(log_rho_scale)
+        # COMPUTING THE DENSITY OF THE NEWLY BORN POINT
+        x_1 = x_buffer[start]*x_scale
+        coeff = 2/((2*law.growth(t_new, x_init, None))-((x_1-x_init)*beta_0))
+        first_term = ((x_1-x_init)/2)*(front_betaRho*(x_scale**alpha_G)*rho_scale)
+        sum_term = pair_sum*(x_scale**(1+alpha_G))*rho_scale
+        additonal_seed = iwata.beta(law.maximumSize(x_init, t_new), m_G, alpha_G)
+        # INCORPORATING IWATA'S SEEDING TERM
+        rho_0 = coeff * (first_term + sum_term + additonal_seed)
+        # STORING THE NEW POINT DIVIDED BY THE SCALES AND ADDING ITS TRAPEZOID PAIR
+        start -= 1
+        x_buffer[start] = x_init/x_scale
+        rho_buffer[start] = rho_0/rho_scale
+        new_betaRho = iwata.beta(x_buffer[start], m_G, alpha_G)*rho_buffer[start]
+        pair_sum += ((x_buffer[start+1]-x_buffer[start])/2)*(new_betaRho+front_betaRho)
+        front_betaRho = new_betaRho
+        t_prev = t_new
+        # APPLYING THE SCALES BEFORE THEY OVER- OR UNDERFLOW
+        if max(abs(log_x_scale), abs(log_rho_scale), abs(((1+alpha_G)*log_x_scale)+log_rho_scale)) > log_scale_limit:
+            x_buffer[start:] *= x_scale
+            rho_buffer[start:] *= rho_scale
+            pair_sum *= (x_scale**(1+alpha_G))*rho_scale
+            front_betaRho *= (x_scale**alpha_G)*rho_scale
+            log_x_scale = 0.0
+            log_rho_scale = 0.0
+            renormalizations += 1
+
+    if report is not None:
+        report['renormalizations'] = renormalizations
+
+    # MATERIALIZING 'x' AND 'rho'
+    return t_prev, x_buffer[start:]*np.exp(log_x_scale), rho_buffer[start:]*np.exp(log_rho_scale)
+
+
+# =================================================== SHARED ITERATION ================================================
+# KERNEL AND POST-STEP PASS SELECTION
+def checkKernel(model, kernel, passes, threads=None, scratch_directory=None, step_control=None):
+    # CHECKS THE ARGUMENTS 'kernel', 'passes', 'threads', 'scratch_
+    # directory' AND 'step_control' OF THE 'iterate' FUNCTIONS AGAINST
+    # 'KERNELS', 'PASSES' AND 'STEP_CONTROL'.  PASSES SET TO 'None'
+    # ARE DROPPED.
+    #
+    # INPUT:
+    #   model : STRING. 'G', 'GLQ' OR 'LQ'.
+    #   kernel : STRING. SCHEME SELECTED /SEE 'iterate_G'/.
+    #   passes : DICTIONARY. POST-STEP PASSES /SEE 'iterate_G'/.
+    #   threads,...,step_control : SEE FUNCTION 'iterate_G'.
+    #
+    # OUTPUT:
+    #   passes : DICTIONARY. POST-STEP PASSES TO APPLY.
+
+    if kernel not in KERNELS[model]:
+        raise ValueError("'kernel' OF MODEL '" + model + "' MUST BE ONE OF " + str(KERNELS[model]) + ".")
+    if kernel != 'threaded' and (threads is not None or scratch_directory is not None):
+        raise ValueError("'threads' AND 'scratch_directory' ARE ONLY AVAILABLE WITH THE 'threaded' KERNEL.")
+    if step_control is not None and kernel != 'adaptive':
+        raise ValueError("'step_control' IS ONLY AVAILABLE WITH THE 'adaptive' KERNEL.")
+    unknown = sorted(set(step_control or {}) - set(STEP_CONTROL))
+    if unknown:
+        raise ValueError("'step_control' MUST BE AMONG " + str(STEP_CONTROL) + ", NOT " + str(unknown) + ".")
+    k_min, k_max = (step_control or {}).get('k_min'), (step_control or {}).get('k_max')
+    if k_min is not None and k_max is not None and k_min > k_max:
+        raise ValueError("'k_min' CANNOT BE LARGER THAN 'k_max'.")
+    passes = {name: value for name, value in (passes or {}).items() if value is not None}
+    unknown = sorted(set(passes) - set(PASSES[model]))
+    if unknown:
+        raise ValueError("'passes' OF MODEL '" + model + "' MUST BE AMONG " + str(PASSES[model]) + ", NOT " +
+                         str(unknown) + ".")
+    if passes and kernel != 'standard':
+        raise ValueError("'passes' ARE ONLY AVAILABLE WITH THE 'standard' KERNEL.")
+    if passes.get('max_mesh_size', MIN_MESH_SIZE) < MIN_MESH_SIZE:
+        raise ValueError("'max_mesh_size' MUST BE AT LEAST " + str(MIN_MESH_SIZE) + ".")
+
+    return passes
+
+# GROWTH FUNCTIONS WITH A COMMON SIGNATURE
+def modelFunctions(model, a_G=None, b_G=None, D_LQ=None, alpha_LQ=None, beta_LQ=None):
+    # WRAPS THE GROWTH FUNCTION, ITS DERIVATIVE AND THE MAXIMUM
+    # TUMOR SIZE OF THE GIVEN MODEL SO THAT ALL OF THEM ARE CAL-
+    # LED AS  'g(t, x)',  'g_x(t, x)'  AND  'x_max(x_init, t)'.
+    # THIS  LETS  THE  SHARED  ITERATION  FUNCTIONS  HANDLE THE
+    # GOMPERTZ, GOMPERTZ-LIN-QUAD AND LIN-QUAD MODELS ALIKE. THE
+    # WRAPPED  FUNCTIONS  EVALUATE  EXACTLY  THE SAME EXPRESSIONS
+    # AS THE MODEL SPECIFIC TIME-STEPS.  IF AN ARRAY 'out' IS GI-
+    # VEN /AND 'scratch' FOR 'g'/,  THE SAME OPERATIONS ARE WRIT-
+    # TEN INTO IT INSTEAD OF NEW ARRAYS. 'g_x' OF THE 'LQ' MODEL
+    # DOES NOT DEPEND ON 'x' AND ALWAYS RETURNS A FLOAT.
+    #
+    # INPUT:
+    #   model : STRING. POSSIBLE VALUES ARE 'G', 'GLQ' AND 'LQ'.
+    #   a_G,...,beta_LQ : FLOATS. PARAMETERS OF THE MODEL. ONLY
+    #                     THOSE USED BY 'model' ARE NEEDED.
+    #
+    # OUTPUT:
+    #   g : FUNCTION. GROWTH FUNCTION.
+    #   g_x : FUNCTION. GROWTH DERIVATIVE.
+    #   x_max : FUNCTION. MAXIMUM TUMOR SIZE AT TIME 't'.
+
+    # GOMPERTZ TERMS WRITTEN INTO 'out' /SEE 'iwata.g_G' AND 'iwata.g_x_G'/
+    def gompertzInto(x, out, scratch):
+        np.multiply(a_G, x, out=scratch)
+        np.divide(b_G, x, out=out)
+        np.log(out, out=out)
+        out *= scratch
+        return out
+
+    def gompertzDerivativeInto(x, out):
+        np.divide(b_G, x, out=out)
+        np.log(out, out=out)
+        out *= a_G
+        out -= a_G
+        return out
+
+    if model == 'G':
+        def g(t, x, out=None, scratch=None):
+            if out is None:
+                return iwata.g_G(x, a_G, b_G)
+            return gompertzInto(x, out, scratch)
+
+        def g_x(t, x, out=None):
+            if out is None:
+                return iwata.g_x_G(x, a_G, b_G)
+            return gompertzDerivativeInto(x, out)
+
+        def x_max(x_init, t):
+            return iwata.x_max_G(x_init, t, a_G, b_G)
+
+    elif model == 'GLQ':
+        def g(t, x, out=None, scratch=None):
+            if out is None:
+                return mix.g_GLQ(t, x, a_G, b_G, D_LQ, alpha_LQ, beta_LQ)
+            gompertzInto(x, out, scratch)
+            np.multiply(enderling.g_x_LQ(t, D_LQ, alpha_LQ, beta_LQ), x, out=scratch)
+            out += scratch
+            return out
+
+        def g_x(t, x, out=None):
+            if out is None:
+                return mix.g_x_GLQ(t, x, a_G, b_G, D_LQ, alpha_LQ, beta_LQ)
+            gompertzDerivativeInto(x, out)
+            out += enderling.g_x_LQ(t, D_LQ, alpha_LQ, beta_LQ)
+            return out
+
+        def x_max(x_init, t):
+            return mix.x_max_GLQ(x_init, t, a_G, b_G, D_LQ, alpha_LQ, beta_LQ)
+
+    elif model == 'LQ':
+        def g(t, x, out=None, scratch=None):
+            if out is None:
+                return enderling.g_LQ(x, t, D_LQ, alpha_LQ, beta_LQ)
+            return np.multiply(enderling.g_x_LQ(t, D_LQ, alpha_LQ, beta_LQ), x, out=out)
+
+        def g_x(t, x, out=None):
+            return enderling.g_x_LQ(t, D_LQ, alpha_LQ, beta_LQ)
+
+        def x_max(x_init, t):
+            return enderling.x_max_LQ(x_init, t, D_LQ, alpha_LQ, beta_LQ)
+
+    else:
+        raise ValueError("'model' MUST BE ONE OF 'G', 'GLQ' OR 'LQ'.")
+
+    return g, g_x, x_max
+
+# GROWTH LAW OBJECTS
+def growthLaw(model, a_G=None, b_G=None, D_LQ=None, alpha_LQ=None, beta_LQ=None):
+    # RETURNS THE GROWTH LAW OBJECT OF THE GIVEN MODEL  /'iwata.
+    # GompertzGrowth',  'mix.GompertzLinQuadGrowth' OR 'enderling.
+    # LinQuadGrowth'/.  THEY EVALUATE GROWTH AND GROWTH DERIVATIVE
+    # FROM A PRECOMPUTED  'log(x)',  SO KERNELS THAT KEEP 'log(x)'
+    # ALONGSIDE 'x' COMPUTE ONE LOGARITHM PER MESH AND TIME-STEP.
+    #
+    # INPUT:
+    #   model : STRING. POSSIBLE VALUES ARE 'G', 'GLQ' AND 'LQ'.
+    #   a_G,...,beta_LQ : FLOATS. PARAMETERS OF THE MODEL. ONLY
+    #                     THOSE USED BY 'model' ARE NEEDED.
+    #
+    # OUTPUT:
+    #   law : OBJECT. GROWTH LAW OF THE MODEL.
+
+    if model == 'G':
+        return iwata.GompertzGrowth(a_G, b_G)
+    elif model == 'GLQ':
+        return mix.GompertzLinQuadGrowth(a_G, b_G, D_LQ, alpha_LQ, beta_LQ)
+    elif model == 'LQ':
+        return enderling.LinQuadGrowth(D_LQ, alpha_LQ, beta_LQ)
+    raise ValueError("'model' MUST BE ONE OF 'G', 'GLQ' OR 'LQ'.")
+
+# ITERATION OVER A PREALLOCATED MESH
+def iterateInWorkspace(number_of_iterations, t_prev, x_initial, rho_initial, k, m_G, alpha_G, x_init, g, g_x, x_max):
+    # PERFORMS THE SAME ITERATIONS AS THE  'iterate'  FUNCTIONS
+    # BUT  WITHOUT ALLOCATING ANY ARRAY EACH TIME-STEP.  SINCE THE
+    # MESH GROWS BY ONE POINT PER ITERATION THE FINAL SIZE IS
+    # KNOWN IN ADVANCE.  BUFFERS OF THAT SIZE /FOR 'x', 'rho' AND
+    # THE INTERMEDIATE RESULTS/ ARE ALLOCATED ONCE. THE MESH IS
+    # FILLED FROM THE BACK: THE CURRENT MESH IS THE VIEW 'buffer
+    # [start:]' AND THE POINT BORN IN EACH ITERATION IS WRITTEN
+    # TO 'buffer[start-1]'.  EXISTING POINTS ARE UPDATED IN PLACE
+    # USING THE SAME FLOATING POINT OPERATIONS AS 'intermediate-
+    # TimeStep' AND 'fullTimeStep' /SEE 'stepInWorkspace'/, HENCE
+    # THE OUTPUT IS IDENTICAL BIT FOR BIT.
+    #
+    # INPUT:
+    #   number_of_iterations : INTEGER. NUMBER OF ITERATIONS.
+    #   t_prev : FLOAT. TIME AT WHICH ITERATIONS START.
+    #   x_initial : NUMPY ARRAY. INITIAL TUMOR SIZES.
+    #   rho_initial : NUMPY ARRAY. INITIAL DENSITY VALUES.
+    #   k : FLOAT. STEP VALUE.
+    #   m_G, alpha_G : FLOATS. USED IN COLONY RATE COMPUTATION.
+    #   x_init : FLOAT. SIZE OF NEWLY BORN METASTASIS.
+    #   g, g_x, x_max : FUNCTIONS. AS RETURNED BY FUNCTION
+    #                   'modelFunctions'.
+    #
+    # OUTPUT:
+    #   t_prev : FLOAT. TIME AFTER THE LAST ITERATION.
+    #   x_prev : NUMPY ARRAY. COMPUTED TUMOR SIZES.
+    #   rho_prev : NUMPY ARRAY. COMPUTED DENSITY VALUES.
+
+    x_prev = np.array(x_initial, dtype=float)
+    rho_prev = np.array(rho_initial, dtype=float)
+    for t_prev, x_prev, rho_prev in streamInWorkspace(number_of_iterations, t_prev, x_initial, rho_initial, k, m_G,
+                                                      alpha_G, x_init, g, g_x, x_max,
+                                                      stride=max(number_of_iterations, 1)):
+        pass
+
+    return t_prev, x_prev, rho_prev
+
+# STREAMED ITERATION OVER A PREALLOCATED MESH
+def streamInWorkspace(number_of_iterations, t_prev, x_initial, rho_initial, k, m_G, alpha_G, x_init, g, g_x, x_max,
+                      stride=None, times=None):
+    # GENERATOR  VERSION OF  'iterateInWorkspace'.  YIELDS  THE
+    # CURRENT  TIME  AND  VIEWS  OF THE  CURRENT  'x' AND 'rho'
+    # AFTER  EVERY  'stride'-TH  ITERATION  AND/OR  AT  THE GIVEN
+    # 'times'.  THE VIEWS POINT INTO THE BUFFERS AND ARE OVERWRIT-
+    # TEN BY THE NEXT ITERATION: CONSUMERS NEEDING TO KEEP THEM
+    # MUST COPY THEM.
+    #
+    # INPUT:
+    #   number_of_iterations,...,x_max : SEE FUNCTION 'iterate-
+    #                                    InWorkspace'.
+    #   stride : INTEGER. DEFAULTS TO 'None'. YIELDS EVERY 'stride'
+    #            ITERATIONS. IF NEITHER 'stride' NOR 'times' ARE
+    #            GIVEN, EVERY ITERATION IS YIELDED.
+    #   times : LIST. DEFAULTS TO 'None'. TIMES AT WHICH TO YIELD,
+    #           ROUNDED TO THE NEAREST TIME-STEP.
+    #
+    # OUTPUT /YIELDED/:
+    #   t_new : FLOAT. TIME AFTER THE ITERATION.
+    #   x_view : NUMPY ARRAY. VIEW OF THE COMPUTED TUMOR SIZES.
+    #   rho_view : NUMPY ARRAY. VIEW OF THE COMPUTED DENSITY VALUES.
+
+    # ITERATIONS AFTER WHICH TO YIELD
+    if stride is None and times is None:
+        stride = 1
+    yield_iterations = set()
+    if times is not None:
+        yield_iterations = {round((time-t_prev)/k) for time in times}
+
+    # ALLOCATING BUFFERS FOR THE FINAL MESH SIZE
+    capacity = len(x_initial) + number_of_iterations
+    x_buffer = np.zeros(capacity)
+    x_inter_buffer = np.zeros(capacity)
+    rho_buffer = np.zeros(capacity)
+    scratch_buffers = np.zeros((3, capacity))
+    start = number_of_iterations
+    x_buffer[start:] = x_initial
+    rho_buffer[start:] = rho_initial
+
+    # ITERATING
+    for iteration in range(number_of_iterations):
+        start, t_prev = stepInWorkspace(start, t_prev, x_buffer, rho_buffer, x_inter_buffer, scratch_buffers, k, m_G,
+                                        alpha_G, x_init, g, g_x, x_max)
+        # YIELDING THE CURRENT STATE
+        if (stride and (iteration+1) % stride == 0) or (iteration+1) in yield_iterations:
+            yield t_prev, x_buffer[start:], rho_buffer[start:]
+
+# ONE ITERATION OVER A PREALLOCATED MESH
+def stepInWorkspace(start, t_prev, x_buffer, rho_buffer, x_inter_buffer, scratch_buffers, k, m_G, alpha_G, x_init,
+                    g, g_x, x_max):
+    # PERFORMS ONE ITERATION ON THE MESH 'buffer[start:]' /SEE FUNC-
+    # TION 'iterateInWorkspace'/.  EVERY ARRAY OPERATION IS WRIT-
+    # TEN INTO  'x_inter_buffer'  OR  'scratch_buffers',  SO NO
+    # TEMPORARY ARRAYS ARE CREATED.  THE OPERATIONS AND THEIR OR-
+    # DER ARE THOSE OF  'intermediateTimeStep'  AND 'fullTimeStep',
+    # HENCE THE OUTPUT IS IDENTICAL BIT FOR BIT.
+    #
+    # INPUT:
+    #   start : INTEGER. INDEX OF THE FIRST POINT OF THE MESH.
+    #   t_prev : FLOAT. TIME BEFORE THE ITERATION.
+    #   x_buffer, rho_buffer : NUMPY ARRAYS. BUFFERS HOLDING 'x'
+    #                          AND 'rho' FROM INDEX 'start' ON.
+    #   x_inter_buffer : NUMPY ARRAY. BUFFER OF THE SAME SIZE FOR
+    #                    THE INTERMEDIATE TIME-STEP.
+    #   scratch_buffers : NUMPY ARRAY. THREE ROWS OF THE SAME SIZE.
+    #   k,...,x_max : SEE FUNCTION 'iterateInWorkspace'.
+    #
+    # OUTPUT:
+    #   start : INTEGER. INDEX OF THE NEWLY BORN POINT.
+    #   t_new : FLOAT. TIME AFTER THE ITERATION.
+
+    size = len(x_buffer) - start
+    scratch_1, scratch_2, scratch_3 = scratch_buffers
+    x_prev = x_buffer[start:]
+    rho_prev = rho_buffer[start:]
+    growth = scratch_1[:size]
+    # COMPUTING INTERMEDIATE TIME-STEP
+    x_inter = x_inter_buffer[start:]
+    g(t_prev, x_prev, out=growth, scratch=scratch_2[:size])
+    growth *= k/2
+    np.add(x_prev, growth, out=x_inter)
+    # COMPUTING FULL TIME-STEP IN PLACE
+    t_new = t_prev + k
+    g(t_prev, x_inter, out=growth, scratch=scratch_2[:size])
+    growth *= k
+    x_prev += growth
+    derivative = g_x(t_new, x_inter, out=scratch_2[:size])
+    if np.ndim(derivative) == 0:
+        rho_prev *= np.exp(-k*derivative)
+    else:
+        derivative *= -k
+        np.exp(derivative, out=derivative)
+        rho_prev *= derivative
+
+    # ADDING THE NEWLY BORN POINT IN FRONT OF THE MESH
+    start -= 1
+    x_new = x_buffer[start:]
+    rho_new = rho_buffer[start:]
+    x_new[0] = x_init
+    # COLONIZATION RATE /SEE 'iwata.beta'/
+    beta_vals = scratch_1[:size+1]
+    np.power(x_new, alpha_G, out=beta_vals)
+    beta_vals *= m_G
+    coeff = 2/((2*g(t_new, x_new[0]))-((x_new[1]-x_new[0])*beta_vals[0]))
+    # 'betaRho' OVERWRITES 'beta_vals[1:]'
+    betaRho = beta_vals[1:]
+    betaRho *= rho_new[1:]
+    first_term = ((x_new[1]-x_new[0])/2)*betaRho[0]
+    # TRAPEZOID SUM OVER THE OLD MESH POINTS
+    x_differences = scratch_2[:size-1]
+    np.subtract(x_new[2:], x_new[1:-1], out=x_differences)
+    x_differences /= 2
+    betaRho_sums = scratch_3[:size-1]
+    np.add(betaRho[:-1], betaRho[1:], out=betaRho_sums)
+    x_differences *= betaRho_sums
+    sum_term = np.sum(x_differences)
+    additonal_seed = iwata.beta(x_max(x_init, t_new), m_G, alpha_G)
+    # INCORPORATING IWATA'S SEEDING TERM
+    rho_new[0] = coeff * (first_term + sum_term + additonal_seed)
+
+    return start, t_new
+
+# LOG-DOMAIN ITERATION
+def iterateLogDomain(number_of_iterations, t_prev, x_initial, rho_initial, k, m_G, alpha_G, x_init, law,
+                     report=None):
+    # PERFORMS THE SAME ITERATIONS AS  'iterateInWorkspace'  BUT
+    # STORES 'log(rho)' INSTEAD OF 'rho'. THE MULTIPLICATIVE DEN-
+    # SITY UPDATE BECOMES AN ADDITION AND THE TRAPEZOID SUM OF
+    # THE BOUNDARY CONDITION  IS  EVALUATED  AS A  LOG-SUM-EXP
+    # REDUCTION /SHIFTED BY THE LARGEST TERM/.  HENCE  DENSITIES
+    # NEVER BECOME SUBNORMAL OR UNDERFLOW DURING THE ITERATIONS:
+    # LINEAR 'rho' IS ONLY PRODUCED ON OUTPUT. ZERO DENSITIES ARE
+    # STORED AS '-inf'. 'log(x)' IS KEPT ALONGSIDE 'x' AND SHARED
+    # BY THE GROWTH LAW AND THE COLONIZATION RATE.
+    #
+    # INPUT:
+    #   number_of_iterations,...,x_init : SEE FUNCTION 'iterate-
+    #                                     InWorkspace'.
+    #   law : OBJECT. AS RETURNED BY FUNCTION 'growthLaw'.
+    #   report : DICTIONARY. DEFAULTS TO 'None'. IF GIVEN, THE
+    #            FINAL 'log(rho)' IS STORED UNDER 'log_rho'.
+    #
+    # OUTPUT:
+    #   t_prev : FLOAT. TIME AFTER THE LAST ITERATION.
+    #   x_prev : NUMPY ARRAY. COMPUTED TUMOR SIZES.
+    #   rho_prev : NUMPY ARRAY. COMPUTED DENSITY VALUES.
+
+    # ALLOCATING BUFFERS FOR THE FINAL MESH SIZE
+    capacity = len(x_initial) + number_of_iterations
+    x_buffer = np.zeros(capacity)
+    log_x_buffer = np.zeros(capacity)
+    x_inter_buffer = np.zeros(capacity)
+    log_rho_buffer = np.zeros(capacity)
+    start = number_of_iterations
+    x_buffer[start:] = x_initial
+    log_x_buffer[start:] = np.log(x_buffer[start:])
+    with np.errstate(divide='ignore'):
+        log_rho_buffer[start:] = np.log(rho_initial)
+    colonization = iwata.Colonization(m_G, alpha_G)
+    log_x_init = np.log(x_init)
+    beta_0 = colonization.rate(log_x_init)
+    log_cutoff = np.log(np.finfo(float).eps)
+
+    # ITERATING
+    for iteration in range(number_of_iterations):
+        x_prev = x_buffer[start:]
+        log_rho_prev = log_rho_buffer[start:]
+        # COMPUTING INTERMEDIATE TIME-STEP
+        x_inter = x_inter_buffer[start:]
+        x_inter[:] = x_prev + ((k/2)*law.growth(t_prev, x_prev, log_x_buffer[start:]))
+        log_x_inter = np.log(x_inter)
+        # COMPUTING FULL TIME-STEP IN PLACE
+        t_new = t_prev + k
+        x_prev += k*law.growth(t_prev, x_inter, log_x_inter)
+        log_rho_prev -= k*law.growthDerivative(t_new, log_x_inter)
+        # ADDING THE NEWLY BORN POINT IN FRONT OF THE MESH
+        start -= 1
+        x_new = x_buffer[start:]
+        log_x_new = log_x_buffer[start:]
+        log_rho_new = log_rho_buffer[start:]
+        x_new[0] = x_init
+        np.log(x_new, out=log_x_new)
+        # LOG-SUM-EXP REDUCTION OF THE TRAPEZOID SUM: THE TERMS ARE
+        # SCALED BY THE LARGEST 'beta*rho' BEFORE EXPONENTIATING. TERMS
+        # BELOW 'eps/len(x)' TIMES THE LARGEST ONE CANNOT CHANGE THE SUM
+        # AND ARE NOT EXPONENTIATED /NO SUBNORMALS ARE PRODUCED/
+        log_betaRho = colonization.logRate(log_x_new[1:]) + log_rho_new[1:]
+        log_shift = np.max(log_betaRho)
+        log_seed = colonization.logRate(np.log(law.maximumSize(x_init, t_new)))
+        if np.isfinite(log_shift):
+            log_betaRho -= log_shift
+            relevant = log_betaRho > log_cutoff - np.log(len(log_betaRho))
+            betaRho = np.exp(log_betaRho, out=np.zeros(len(log_betaRho)), where=relevant)
+            x_new_jmin1, x_new_j = tools.splitShift(x_new, 1)
+            betaRho_jmin1, betaRho_j = tools.splitShift(betaRho, 1)
+            first_term = ((x_new[1]-x_new[0])/2)*betaRho[0]
+            sum_term = np.dot((x_new_j[1:]-x_new_jmin1[1:])/2, betaRho_jmin1+betaRho_j)
+            scaled_sum = first_term + sum_term + np.exp(log_seed - log_shift)
+            sign = np.sign(scaled_sum)
+            log_sum = log_shift + np.log(np.abs(scaled_sum))
+        else:
+            sign = 1.0
+            log_sum = log_seed
+        coeff = 2/((2*law.growth(t_new, x_init, log_x_init))-((x_new[1]-x_new[0])*beta_0))
+        if sign*coeff <= 0:
+            raise ValueError("NON-POSITIVE BOUNDARY DENSITY AT t = " + str(t_new) +
+                             ". IT CANNOT BE REPRESENTED IN THE LOG-DOMAIN.")
+        # INCORPORATING IWATA'S SEEDING TERM
+        log_rho_new[0] = np.log(sign*coeff) + log_sum
+        t_prev = t_new
+
+    if report is not None:
+        report['log_rho'] = log_rho_buffer[start:]
+
+    return t_prev, x_buffer[start:], np.exp(log_rho_buffer[start:])
+
+# HIGHER-ORDER ITERATION
+def iterateHighOrder(number_of_iterations, t_prev, x_initial, rho_initial, k, m_G, alpha_G, x_init, g, g_x, x_max):
+    # PERFORMS THE SAME ITERATIONS AS  'iterateInWorkspace'  WITH
+    # FOURTH-ORDER  COMPONENTS  INSTEAD OF THE MIDPOINT AND TRAPE-
+    # ZOID RULES:
+    #   - EACH  MESH POINT AND THE LOGARITHM OF ITS DENSITY ARE AD-
+    #     VANCED TOGETHER BY THE CLASSICAL RUNGE-KUTTA METHOD APPLIED
+    #     TO THE CHARACTERISTIC SYSTEM
+    #           dx/dt = g(t, x),  d(log(rho))/dt = -g_x(t, x).
+    #   - THE  INTEGRAL  OF  THE  BOUNDARY  CONDITION  USES  THE
+    #     NON-UNIFORM SIMPSON WEIGHTS 'w' OF 'tools.simpsonWeights'.
+    #     THE UNKNOWN BOUNDARY DENSITY ENTERS IT LINEARLY, SO
+    #           rho_0 = (sum_{j>0} w_j*beta_j*rho_j + seed)/(g_0 - w_0*beta_0).
+    # EACH TIME-STEP COSTS FOUR EVALUATIONS OF 'g' AND 'g_x' IN-
+    # STEAD OF TWO AND ONE,  BUT THE ERROR DECREASES FASTER WITH
+    # 'k', SO A SEVERAL TIMES LARGER 'k' REACHES THE SAME ACCURACY
+    # /SEE 'tools.convergenceOrder'/.
+    #
+    # INPUT:
+    #   number_of_iterations,...,x_max : SEE FUNCTION 'iterate-
+    #                                    InWorkspace'.
+    #
+    # OUTPUT:
+    #   t_prev : FLOAT. TIME AFTER THE LAST ITERATION.
+    #   x_prev : NUMPY ARRAY. COMPUTED TUMOR SIZES.
+    #   rho_prev : NUMPY ARRAY. COMPUTED DENSITY VALUES.
+
+    # ALLOCATING BUFFERS FOR THE FINAL MESH SIZE
+    capacity = len(x_initial) + number_of_iterations
+    x_buffer = np.zeros(capacity)
+    rho_buffer = np.zeros(capacity)
+    start = number_of_iterations
+    x_buffer[start:] = x_initial
+    rho_buffer[start:] = rho_initial
+    beta_0 = iwata.beta(x_init, m_G, alpha_G)
+
+    # ITERATING
+    for iteration in range(number_of_iterations):
+        x_prev = x_buffer[start:]
+        rho_prev = rho_buffer[start:]
+        t_half = t_prev + (k/2)
+        t_new = t_prev + k
+        # RUNGE-KUTTA STAGES OF THE CHARACTERISTIC SYSTEM
+        x_stage = x_prev
+        slope_1 = g(t_prev, x_stage)
+        exponent = g_x(t_prev, x_stage)
+        x_stage = x_prev + ((k/2)*slope_1)
+        slope_2 = g(t_half, x_stage)
+        exponent = exponent + (2*g_x(t_half, x_stage))
+        x_stage = x_prev + ((k/2)*slope_2)
+        slope_3 = g(t_half, x_stage)
+        exponent = exponent + (2*g_x(t_half, x_stage))
+        x_stage = x_prev + (k*slope_3)
+        slope_4 = g(t_new, x_stage)
+        exponent = exponent + g_x(t_new, x_stage)
+        # COMPUTING FULL TIME-STEP IN PLACE
+        x_prev += (k/6)*(slope_1 + (2*slope_2) + (2*slope_3) + slope_4)
+        rho_prev *= np.exp(-(k/6)*exponent)
+        # ADDING THE NEWLY BORN POINT IN FRONT OF THE MESH
+        start -= 1
+        x_new = x_buffer[start:]
+        rho_new = rho_buffer[start:]
+        x_new[0] = x_init
+        weights = tools.simpsonWeights(x_new)
+        integral_term = np.dot(weights[1:], iwata.beta(x_new[1:], m_G, alpha_G)*rho_new[1:])
+        additonal_seed = iwata.beta(x_max(x_init, t_new), m_G, alpha_G)
+        # INCORPORATING IWATA'S SEEDING TERM
+        rho_new[0] = (integral_term + additonal_seed)/(g(t_new, x_init) - (weights[0]*beta_0))
+        t_prev = t_new
+
+    return t_prev, x_buffer[start:], rho_buffer[start:]
+
+# ADAPTIVE TIME-STEP ITERATION
+def iterateAdaptive(t_prev, t_end, x_initial, rho_initial, k, m_G, alpha_G, x_init, g, g_x, x_max, tolerance=None,
+                    k_min=None, k_max=None, event_times=None, report=None):
+    # ITERATES FROM 't_prev' UNTIL 't_end' WITH A TIME-STEP THAT
+    # ADAPTS TO THE LOCAL ERROR.  THE INTERMEDIATE AND FULL TIME-
+    # STEPS FORM AN EMBEDDED PAIR:  THE FULL STEP /MIDPOINT RULE/
+    # IS COMPARED TO THE EULER STEP  'x + k*g(t, x)',  WHICH ONLY
+    # NEEDS THE GROWTH ALREADY COMPUTED FOR THE INTERMEDIATE STEP.
+    # THE SAME IS DONE FOR THE EXPONENT OF THE DENSITY UPDATE. THE
+    # ERROR OF A STEP IS THE LARGEST OF
+    #       |x_full - x_euler|/x_full  AND  k*|g_x(t_new, x_inter)
+    #       - g_x(t_prev, x_prev)|
+    # OVER THE MESH POINTS OF AT LEAST 'x_init' /SMALLER ONES ARE
+    # ERADICATED METASTASIS, SEE 'tools.deleteMetastasis', WHICH
+    # MAY UNDERFLOW UNDER RADIOTHERAPY/.  STEPS WHOSE ERROR EXCEEDS
+    # 'tolerance' ARE REJECTED AND REPEATED.  THE NEXT STEP IS 'k*
+    # 0.9*sqrt(tolerance/error)', LIMITED TO ['k/5', '5*k'] AND TO
+    # ['k_min', 'k_max'].  STEPS ARE SHORTENED TO LAND EXACTLY ON
+    # 'event_times' AND ON 't_end'.  ACCEPTED STEPS ARE THOSE OF
+    # 'intermediateTimeStep' AND 'fullTimeStep',  HENCE WITH 'k_min'
+    # = 'k_max' = 'k' THE RESULTS ARE IDENTICAL TO THE 'standard'
+    # KERNEL.  AS A NEW POINT IS BORN EACH TIME-STEP, LONGER STEPS
+    # ALSO GIVE A COARSER MESH.
+    #
+    # INPUT:
+    #   t_prev : FLOAT. TIME AT WHICH ITERATIONS START.
+    #   t_end : FLOAT. TIME AT WHICH ITERATIONS STOP.
+    #   x_initial,...,x_max : SEE FUNCTION 'iterateInWorkspace'.
+    #                         'k' IS THE FIRST STEP TRIED.
+    #   tolerance : FLOAT. DEFAULTS TO 'None' /THE ERROR OF THE FIRST
+    #               STEP, SO THAT 'k' SETS THE ACCURACY/.  LARGEST
+    #               ERROR ACCEPTED PER TIME-STEP.
+    #   k_min : FLOAT. DEFAULTS TO 'None' /'k/100'/. SMALLEST STEP.
+    #           STEPS OF THIS SIZE ARE ALWAYS ACCEPTED.
+    #   k_max : FLOAT. DEFAULTS TO 'None' /'100*k'/. LARGEST STEP.
+    #   event_times : LIST. DEFAULTS TO 'None'.  TIMES THAT MUST BE
+    #                 HIT EXACTLY /e.g. 'FractionationSchedule.event-
+    #                 Times'/.
+    #   report : DICTIONARY. DEFAULTS TO 'None'. IF GIVEN, IT IS
+    #            FILLED WITH THE NUMBER OF ACCEPTED  AND REJECTED
+    #            STEPS AND THE ACCEPTED STEP SIZES.
+    #
+    # OUTPUT:
+    #   t_prev : FLOAT. TIME AFTER THE LAST ITERATION.
+    #   x_prev : NUMPY ARRAY. COMPUTED TUMOR SIZES.
+    #   rho_prev : NUMPY ARRAY. COMPUTED DENSITY VALUES.
+
+    if k_min is None:
+        k_min = k/100
+    if k_max is None:
+        k_max = 100*k
+    # TIMES THAT MUST BE HIT EXACTLY
+    stop_times = sorted(time for time in set(event_times or []) if t_prev < time < t_end) + [t_end]
+
+    x_prev = x_initial
+    rho_prev = rho_initial
+    step_sizes = []
+    rejected_steps = 0
+    for stop_time in stop_times:
+        while t_prev < stop_time:
+            # SPLITTING THE REST BEFORE THE NEXT STOP TIME INTO EQUAL STEPS /NO SLIVER IS LEFT BEFORE IT/
+            remaining = stop_time - t_prev
+            k_step = remaining/np.ceil(remaining/k) if remaining < 2*k else k
+            t_new = stop_time if k_step == remaining else t_prev + k_step
+            # COMPUTING INTERMEDIATE AND FULL TIME-STEPS
+            growth_prev = g(t_prev, x_prev)
+            x_inter = x_prev + ((k_step/2)*growth_prev)
+            growth_inter = g(t_prev, x_inter)
+            x_full = x_prev + (k_step*growth_inter)
+            growth_der_inter = g_x(t_new, x_inter)
+            # EMBEDDED ERROR ESTIMATE AGAINST THE EULER STEP /OVER THE POINTS OF AT LEAST 'x_init'/
+            alive = x_prev >= x_init
+            x_error = np.max(np.abs(k_step*(growth_inter[alive]-growth_prev[alive]))/x_full[alive], initial=0)
+            rho_error = np.max(np.abs(k_step*(growth_der_inter[alive]-g_x(t_prev, x_prev[alive]))), initial=0)
+            if tolerance is None:
+                tolerance = max(x_error, rho_error)
+            error = max(x_error, rho_error)/tolerance
+            factor = min(5, max(0.2, 0.9/np.sqrt(error))) if error > 0 else 5
+            # REJECTING THE STEP
+            if error > 1 and k_step > k_min:
+                rejected_steps += 1
+                k = max(k_min, k_step*factor)
+                continue
+            # ACCEPTING THE STEP AND ADDING THE NEWLY BORN POINT
+            x_new = np.zeros(len(x_prev)+1)
+            x_new[0] = x_init
+            x_new[1:] = x_full
+            rho_new = np.zeros(len(x_prev)+1)
+            rho_new[1:] = np.multiply(rho_prev, np.exp(-k_step*growth_der_inter))
+            beta_vals = iwata.beta(x_new, m_G, alpha_G)
+            x_new_jmin1, x_new_j = tools.splitShift(x_new, 1)
+            betaRho = np.multiply(beta_vals[1:], rho_new[1:])
+            betaRho_jmin1, betaRho_j = tools.splitShift(betaRho, 1)
+            coeff = 2/((2*g(t_new, x_new[0]))-((x_new[1]-x_new[0])*beta_vals[0]))
+            first_term = ((x_new[1]-x_new[0])/2)*(beta_vals[1]*rho_new[1])
+            sum_term = np.sum(np.multiply(((x_new_j[1:]-x_new_jmin1[1:])/2), (betaRho_jmin1+betaRho_j)))
+            additonal_seed = iwata.beta(x_max(x_init, t_new), m_G, alpha_G)
+            # INCORPORATING IWATA'S SEEDING TERM
+            rho_new[0] = coeff * (first_term + sum_term + additonal_seed)
+            step_sizes.append(k_step)
+            t_prev, x_prev, rho_prev = t_new, x_new, rho_new
+            # PROPOSING THE NEXT STEP /A STEP SHORTENED BY A STOP TIME DOES NOT SHRINK IT/
+            k = min(k_max, max(k_min, k_step*factor, k if k_step < k else 0))
+
+    if report is not None:
+        report['accepted_steps'] = len(step_sizes)
+        report['rejected_steps'] = rejected_steps
+        report['step_sizes'] = step_sizes
+
+    return t_prev, x_prev, rho_prev
+
+# DIMENSIONAL REDUCTION WITH BOOKKEEPING
+def applyMeshReduction(x_prev, rho_prev, max_mesh_size, report=None):
+    # CALLS 'tools.reduceMesh' UNTIL THE MESH HAS NO MORE THAN
+    # 'max_mesh_size' POINTS /OR UNTIL A PASS REMOVES NOTHING/.
+    # IF A 'report' IS GIVEN, THE NUMBER OF REDUCTIONS, REMOVED
+    # POINTS AND THE ACCUMULATED DEVIATION ESTIMATE ARE RECORDED
+    # IN IT.
+    #
+    # INPUT:
+    #   x_prev : NUMPY ARRAY. CONTAINS TUMOR SIZES.
+    #   rho_prev : NUMPY ARRAY. CONTAINS DENSITY VALUES.
+    #   max_mesh_size : INTEGER. MAXIMUM NUMBER OF MESH POINTS.
+    #   report : DICTIONARY. DEFAULTS TO 'None'.
+    #
+    # OUTPUT:
+    #   x_prev : NUMPY ARRAY. REDUCED TUMOR SIZES.
+    #   rho_prev : NUMPY ARRAY. REDUCED DENSITY VALUES.
+
+    while len(x_prev) > max_mesh_size:
+        mesh_size = len(x_prev)
+        x_prev, rho_prev, deviation = tools.reduceMesh(x_prev, rho_prev, max_mesh_size)
+        # STOPPING IF THE MESH CANNOT BE COARSENED ANY FURTHER
+        if len(x_prev) == mesh_size:
+            break
+        if report is not None:
+            report['reductions'] = report.get('reductions', 0) + 1
+            report['points_removed'] = report.get('points_removed', 0) + mesh_size - len(x_prev)
+            report['estimated_deviation'] = report.get('estimated_deviation', 0.0) + deviation
 
     return x_prev, rho_prev
 
+# SATURATION COMPACTION WITH BOOKKEEPING
+def applySaturationCompaction(x_prev, rho_prev, saturation_tolerance, report=None):
+    # CALLS 'tools.compactSaturatedMesh'. IF A 'report' IS GIVEN,
+    # THE NUMBER OF COMPACTIONS, MERGED-AWAY POINTS AND THE FRAC-
+    # TION OF ALL POINTS BORN SO FAR THAT WERE REMOVED ARE RECOR-
+    # DED IN IT.
+    #
+    # INPUT:
+    #   x_prev : NUMPY ARRAY. CONTAINS TUMOR SIZES.
+    #   rho_prev : NUMPY ARRAY. CONTAINS DENSITY VALUES.
+    #   saturation_tolerance : FLOAT. RELATIVE DISTANCE BELOW WHICH
+    #                          POINTS ARE MERGED.
+    #   report : DICTIONARY. DEFAULTS TO 'None'.
+    #
+    # OUTPUT:
+    #   x_prev : NUMPY ARRAY. COMPACTED TUMOR SIZES.
+    #   rho_prev : NUMPY ARRAY. COMPACTED DENSITY VALUES.
+
+    x_prev, rho_prev, points_removed = tools.compactSaturatedMesh(x_prev, rho_prev, saturation_tolerance)
+    if report is not None and points_removed:
+        report['compactions'] = report.get('compactions', 0) + 1
+        report['points_compacted'] = report.get('points_compacted', 0) + points_removed
+        report['compacted_fraction'] = report['points_compacted']/(report['points_compacted'] + len(x_prev))
+
+    return x_prev, rho_prev
+
+# PRUNING WITH BOOKKEEPING
+def applyPruning(x_prev, rho_prev, pruning, discarded_mass, iteration, number_of_iterations, report=None):
+    # CALLS 'tools.pruneMesh' WITH THE PART OF 'max_discarded_
+    # mass' NOT YET USED, EVERY 'interval' ITERATIONS AND AFTER THE
+    # LAST ONE.  ONCE THE CAP IS USED UP THE MESH IS LEFT AS IT IS.
+    # IF A 'report' IS GIVEN, THE NUMBER OF PRUNINGS, PRUNED POINTS
+    # AND THE DISCARDED MASS ARE RECORDED IN IT.
+    #
+    # INPUT:
+    #   x_prev : NUMPY ARRAY. CONTAINS TUMOR SIZES.
+    #   rho_prev : NUMPY ARRAY. CONTAINS DENSITY VALUES.
+    #   pruning : DICTIONARY. PRUNING POLICY /SEE 'iterate_G'/.
+    #   discarded_mass : FLOAT. MASS DISCARDED SO FAR.
+    #   iteration : INTEGER. INDEX OF THE ITERATION JUST PERFORMED.
+    #   number_of_iterations : INTEGER. TOTAL NUMBER OF ITERATIONS.
+    #   report : DICTIONARY. DEFAULTS TO 'None'.
+    #
+    # OUTPUT:
+    #   x_prev : NUMPY ARRAY. PRUNED TUMOR SIZES.
+    #   rho_prev : NUMPY ARRAY. PRUNED DENSITY VALUES.
+    #   discarded_mass : FLOAT. MASS DISCARDED SO FAR.
+
+    # SKIPPING ITERATIONS BETWEEN PRUNINGS
+    if (iteration+1) % pruning.get('interval', PRUNING_INTERVAL) and iteration+1 < number_of_iterations:
+        return x_prev, rho_prev, discarded_mass
+    # SKIPPING ONCE THE CAP IS USED UP
+    remaining_mass = pruning.get('max_discarded_mass', np.inf) - discarded_mass
+    if remaining_mass <= 0:
+        return x_prev, rho_prev, discarded_mass
+
+    mesh_size = len(x_prev)
+    x_prev, rho_prev, mass = tools.pruneMesh(x_prev, rho_prev, size_threshold=pruning.get('size_threshold'),
+                                             relative_density=pruning.get('relative_density'),
+                                             max_discarded_mass=remaining_mass)
+    if report is not None and len(x_prev) < mesh_size:
+        report['prunings'] = report.get('prunings', 0) + 1
+        report['points_pruned'] = report.get('points_pruned', 0) + mesh_size - len(x_prev)
+        report['discarded_mass'] = report.get('discarded_mass', 0.0) + mass
+
+    return x_prev, rho_prev, discarded_mass + mass
+
+# FUSED TIME-STEP KERNEL
+def iterateFused(model, number_of_iterations, t_prev, x_initial, rho_initial, k, m_G, alpha_G, x_init,
+                 a_G=None, b_G=None, D_LQ=None, alpha_LQ=None, beta_LQ=None):
+    # PERFORMS  THE  INTERMEDIATE  AND  FULL  TIME-STEPS  OF THE
+    # GIVEN  MODEL  IN  A SINGLE PASS.  ALL ARRAY OPERATIONS ARE
+    # WRITTEN  INTO  BUFFERS  ALLOCATED  ONCE  /SEE  FUNCTION
+    # 'iterateInWorkspace'/  SO  NO  TEMPORARY  ARRAYS ARE CREA-
+    # TED.  THE THREE GROWTH  FUNCTIONS ARE WRITTEN AS
+    #       g(t, x) = x * r(t, x),  r = A(t) - a_G*log(x)
+    #       g_x(t, x) = r(t, x) - a_G
+    # WHERE 'A(t)' ONLY DEPENDS ON TIME:
+    #   - 'G'   : A = a_G*log(b_G)
+    #   - 'GLQ' : A = a_G*log(b_G) - c(t)
+    #   - 'LQ'  : A = -c(t) AND a_G = 0
+    # WITH  c(t) = alpha_LQ*D_LQ + 2*beta_LQ*D_LQ^2*t.  'A(t)' IS
+    # GIVEN BY THE GROWTH LAW OBJECT /SEE FUNCTION 'growthLaw'/.
+    # 'A(t)', THE BOUNDARY GROWTH  'g(t, x_init)'  AND IWATA'S
+    # ADDITIONAL  SEEDING  TERM  ARE  COMPUTED FOR THE WHOLE TIME
+    # GRID BEFORE ITERATING.  'log(x)'  IS  KEPT ALONGSIDE  'x'
+    # SO THAT THE LOGARITHM COMPUTED FOR THE COLONIZATION RATE OF
+    # ONE STEP IS REUSED BY THE INTERMEDIATE TIME-STEP OF THE NEXT
+    # ONE.
+    # RESULTS AGREE WITH THE  'iterate'  FUNCTIONS UP TO ROUNDING
+    # ERRORS.
+    #
+    # INPUT:
+    #   model : STRING. POSSIBLE VALUES ARE 'G', 'GLQ' AND 'LQ'.
+    #   number_of_iterations,...,x_init : SEE FUNCTION
+    #                                     'iterateInWorkspace'.
+    #   a_G,...,beta_LQ : FLOATS. PARAMETERS OF THE MODEL. ONLY
+    #                     THOSE USED BY 'model' ARE NEEDED.
+    #
+    # OUTPUT:
+    #   t_prev : FLOAT. TIME AFTER THE LAST ITERATION.
+    #   x_prev : NUMPY ARRAY. COMPUTED TUMOR SIZES.
+    #   rho_prev : NUMPY ARRAY. COMPUTED DENSITY VALUES.
+
+    # PRECOMPUTING TIME DEPENDENT TERMS
+    law = growthLaw(model, a_G=a_G, b_G=b_G, D_LQ=D_LQ, alpha_LQ=alpha_LQ, beta_LQ=beta_LQ)
+    t_grid = t_prev + (k*np.arange(number_of_iterations+1))
+    a_coeff = law.log_coefficient
+    A_grid = law.specificRate(t_grid)
+    boundary_growth = x_init*(A_grid-(a_coeff*np.log(x_init)))
+    additional_seed = iwata.beta(law.maximumSize(x_init, t_grid), m_G, alpha_G)
+
+    # ALLOCATING BUFFERS FOR THE FINAL MESH SIZE
+    capacity = len(x_initial) + number_of_iterations
+    x_buffer = np.zeros(capacity)
+    log_x_buffer = np.zeros(capacity)
+    rho_buffer = np.zeros(capacity)
+    x_inter_buffer = np.zeros(capacity)
+    scratch_1 = np.zeros(capacity)
+    scratch_2 = np.zeros(capacity)
+    start = number_of_iterations
+    x_buffer[start:] = x_initial
+    np.log(x_buffer[start:], out=log_x_buffer[start:])
+    rho_buffer[start:] = rho_initial
+
+    # ITERATING
+    for iteration in range(number_of_iterations):
+        size = capacity - start
+        A_prev, A_new = A_grid[iteration], A_grid[iteration+1]
+        x_prev = x_buffer[start:]
+        rho_prev = rho_buffer[start:]
+        rate = scratch_1[:size]
+        # INTERMEDIATE TIME-STEP:  x_inter = x + (k/2)*x*r(t_prev, x)
+        np.multiply(log_x_buffer[start:], -a_coeff, out=rate)
+        rate += A_prev
+        rate *= k/2
+        rate += 1
+        x_inter = x_inter_buffer[start:]
+        np.multiply(x_prev, rate, out=x_inter)
+        # FULL TIME-STEP:  x += k*x_inter*r(t_prev, x_inter)
+        log_x_inter = scratch_1[:size]
+        np.log(x_inter, out=log_x_inter)
+        log_x_inter *= -a_coeff
+        np.add(log_x_inter, A_prev, out=scratch_2[:size])
+        scratch_2[:size] *= x_inter
+        scratch_2[:size] *= k
+        x_prev += scratch_2[:size]
+        # TRANSPORT:  rho *= exp(-k*g_x(t_new, x_inter))
+        np.add(log_x_inter, A_new-a_coeff, out=scratch_2[:size])
+        scratch_2[:size] *= -k
+        np.exp(scratch_2[:size], out=scratch_2[:size])
+        rho_prev *= scratch_2[:size]
+
+        # ADDING THE NEWLY BORN POINT IN FRONT OF THE MESH
+        start -= 1
+        x_new = x_buffer[start:]
+        rho_new = rho_buffer[start:]
+        log_x_new = log_x_buffer[start:]
+        x_new[0] = x_init
+        np.log(x_new, out=log_x_new)
+        # COLONIZATION RATE:  beta = m_G*exp(alpha_G*log(x))
+        beta_vals = scratch_1[:size+1]
+        np.multiply(log_x_new, alpha_G, out=beta_vals)
+        np.exp(beta_vals, out=beta_vals)
+        beta_vals *= m_G
+        betaRho = beta_vals[1:]
+        betaRho *= rho_new[1:]
+        # TRAPEZOID SUM OVER THE OLD MESH POINTS
+        x_differences = scratch_2[:size-1]
+        np.subtract(x_new[2:], x_new[1:-1], out=x_differences)
+        betaRho_sums = x_inter_buffer[start:start+size-1]
+        np.add(betaRho[:-1], betaRho[1:], out=betaRho_sums)
+        sum_term = np.dot(x_differences, betaRho_sums)/2
+        coeff = 2/((2*boundary_growth[iteration+1])-((x_new[1]-x_new[0])*beta_vals[0]))
+        first_term = ((x_new[1]-x_new[0])/2)*betaRho[0]
+        # INCORPORATING IWATA'S SEEDING TERM
+        rho_new[0] = coeff * (first_term + sum_term + additional_seed[iteration+1])
+
+    return t_grid[-1], x_buffer[start:], rho_buffer[start:]
+
+# MULTITHREADED CHUNKED KERNEL
+def iterateThreaded(model, number_of_iterations, t_prev, x_initial, rho_initial, k, m_G, alpha_G, x_init,
+                    a_G=None, b_G=None, D_LQ=None, alpha_LQ=None, beta_LQ=None, threads=None,
+                    chunk_size=CHUNK_SIZE, scratch_directory=None):
+    # PERFORMS THE ITERATIONS OF  'iterateFused'  WITH THE MESH
+    # SPLIT INTO CHUNKS OF 'chunk_size' POINTS.  EACH TIME-STEP,
+    # A POOL OF THREADS ADVANCES THE CHUNKS:  INTERMEDIATE AND FULL
+    # TIME-STEP,  'log(x)',  COLONIZATION RATE AND THE TRAPEZOID
+    # SUM OVER THE INTERVALS INSIDE THE CHUNK.  NUMPY RELEASES THE
+    # GIL WHILE  EVALUATING UFUNCS, SO THE CHUNKS ARE PROCESSED IN
+    # PARALLEL WHILE EACH ONE STAYS IN CACHE.  THE INTERVALS JOIN-
+    # ING TWO CHUNKS AND THE BOUNDARY CONDITION ARE COMPUTED AFTER-
+    # WARDS BY THE CALLING THREAD.  INTERMEDIATE VALUES ONLY LIVE
+    # IN SCRATCH ARRAYS OF ONE CHUNK PER THREAD.
+    # THE CHUNKS ARE COUNTED FROM THE END OF THE BUFFERS, SO A POINT
+    # STAYS IN THE SAME CHUNK AS THE MESH GROWS, AND THE PARTIAL SUMS
+    # ARE ADDED IN CHUNK ORDER.  HENCE RESULTS DO NOT DEPEND ON THE
+    # NUMBER OF THREADS.  THEY AGREE WITH 'iterateFused' UP TO THE
+    # ROUNDING ERRORS OF THE SPLIT SUM.
+    #
+    # IF 'scratch_directory' IS GIVEN, THE BUFFERS OF 'x', 'log(x)'
+    # AND 'rho' ARE 'numpy.memmap' ARRAYS BACKED BY TEMPORARY FILES
+    # IN THAT DIRECTORY.  THE OPERATING SYSTEM PAGES THEM IN AND OUT
+    # AS THE CHUNKS ARE VISITED,  SO THE MESH MAY EXCEED THE AVAIL-
+    # ABLE MEMORY.  THE RETURNED ARRAYS ARE MEMORY-MAPPED VIEWS. THE
+    # FILES ARE DELETED ON CREATION AND THEIR SPACE IS RELEASED ONCE
+    # THE LAST VIEW IS GONE.  THE TIME DEPENDENT TERMS ARE EVALUATED
+    # EACH TIME-STEP, SO NO ARRAY OF LENGTH 'number_of_iterations' IS
+    # KEPT IN MEMORY.
+    #
+    # INPUT:
+    #   model,...,beta_LQ : SEE FUNCTION 'iterateFused'.
+    #   threads : INTEGER. DEFAULTS TO 'None' /AS CHOSEN BY 'concur-
+    #             rent.futures.ThreadPoolExecutor'/. NUMBER OF THREADS.
+    #   chunk_size : INTEGER. DEFAULTS TO 'CHUNK_SIZE'. NUMBER OF
+    #                MESH POINTS PER CHUNK.
+    #   scratch_directory : STRING. DEFAULTS TO 'None' /BUFFERS IN
+    #                       MEMORY/. DIRECTORY OF THE MAPPED FILES.
+    #
+    # OUTPUT:
+    #   t_prev : FLOAT. TIME AFTER THE LAST ITERATION.
+    #   x_prev : NUMPY ARRAY. COMPUTED TUMOR SIZES.
+    #   rho_prev : NUMPY ARRAY. COMPUTED DENSITY VALUES.
+
+    # TIME DEPENDENT TERMS ARE EVALUATED EACH TIME-STEP /NO ARRAYS
+    # OF LENGTH 'number_of_iterations' ARE KEPT IN MEMORY/
+    law = growthLaw(model, a_G=a_G, b_G=b_G, D_LQ=D_LQ, alpha_LQ=alpha_LQ, beta_LQ=beta_LQ)
+    a_coeff = law.log_coefficient
+    beta_0 = iwata.beta(x_init, m_G, alpha_G)
+    t_start = t_prev
+
+    # ALLOCATING BUFFERS FOR THE FINAL MESH SIZE
+    capacity = len(x_initial) + number_of_iterations
+    if scratch_directory is None:
+        x_buffer, log_x_buffer, rho_buffer = np.zeros(capacity), np.zeros(capacity), np.zeros(capacity)
+    else:
+        x_buffer, log_x_buffer, rho_buffer = [np.memmap(tempfile.TemporaryFile(dir=scratch_directory), dtype=float,
+                                                        mode='w+', shape=(capacity,)) for buffer in range(3)]
+    start = number_of_iterations
+    for lo in range(0, len(x_initial), chunk_size):
+        x_buffer[start+lo:start+lo+chunk_size] = x_initial[lo:lo+chunk_size]
+        rho_buffer[start+lo:start+lo+chunk_size] = rho_initial[lo:lo+chunk_size]
+        np.log(x_buffer[start+lo:start+lo+chunk_size], out=log_x_buffer[start+lo:start+lo+chunk_size])
+    thread_scratch = threading.local()
+
+    def advanceChunk(chunk, A_prev, A_new):
+        # ADVANCES THE POINTS 'lo' TO 'hi'. RETURNS THEIR PARTIAL
+        # TRAPEZOID SUM /WITHOUT THE FACTOR 1/2/ AND THE FIRST AND
+        # LAST 'beta*rho'
+        lo, hi = chunk
+        if not hasattr(thread_scratch, 'arrays'):
+            thread_scratch.arrays = (np.zeros(chunk_size), np.zeros(chunk_size), np.zeros(chunk_size))
+        rate, x_inter, update = [array[:hi-lo] for array in thread_scratch.arrays]
+        x_prev, log_x, rho_prev = x_buffer[lo:hi], log_x_buffer[lo:hi], rho_buffer[lo:hi]
+        # INTERMEDIATE TIME-STEP:  x_inter = x + (k/2)*x*r(t_prev, x)
+        np.multiply(log_x, -a_coeff, out=rate)
+        rate += A_prev
+        rate *= k/2
+        rate += 1
+        np.multiply(x_prev, rate, out=x_inter)
+        # FULL TIME-STEP:  x += k*x_inter*r(t_prev, x_inter)
+        np.log(x_inter, out=rate)
+        rate *= -a_coeff
+        np.add(rate, A_prev, out=update)
+        update *= x_inter
+        update *= k
+        x_prev += update
+        # TRANSPORT:  rho *= exp(-k*g_x(t_new, x_inter))
+        np.add(rate, A_new-a_coeff, out=update)
+        update *= -k
+        np.exp(update, out=update)
+        rho_prev *= update
+        # COLONIZATION RATE:  beta = m_G*exp(alpha_G*log(x))
+        np.log(x_prev, out=log_x)
+        betaRho = x_inter
+        np.multiply(log_x, alpha_G, out=betaRho)
+        np.exp(betaRho, out=betaRho)
+        betaRho *= m_G
+        betaRho *= rho_prev
+        # TRAPEZOID SUM INSIDE THE CHUNK
+        np.subtract(x_prev[1:], x_prev[:-1], out=update[:-1])
+        np.add(betaRho[:-1], betaRho[1:], out=rate[:-1])
+        return np.dot(update[:-1], rate[:-1]), betaRho[0], betaRho[-1]
+
+    # ITERATING
+    executor = ThreadPoolExecutor(max_workers=threads)
+    try:
+        for iteration in range(number_of_iterations):
+            t_new = t_start + (k*(iteration+1))
+            A_prev, A_new = law.specificRate(t_prev), law.specificRate(t_new)
+            # CHUNKS COUNTED FROM THE END OF THE BUFFERS
+            edges = list(range(capacity, start, -chunk_size)) + [start]
+            chunks = [(lo, hi) for hi, lo in zip(edges[:-1], edges[1:])]
+            if len(chunks) > 1:
+                results = list(executor.map(advanceChunk, chunks, [A_prev]*len(chunks), [A_new]*len(chunks)))
+            else:
+                results = [advanceChunk(chunk, A_prev, A_new) for chunk in chunks]
+            partial_sums = [result[0] for result in results]
+            # INTERVALS JOINING TWO CHUNKS
+            for idx in range(1, len(chunks)):
+                hi = chunks[idx][1]
+                partial_sums.append((x_buffer[hi]-x_buffer[hi-1])*(results[idx][2]+results[idx-1][1]))
+            sum_term = sum(partial_sums)/2
+
+            # ADDING THE NEWLY BORN POINT IN FRONT OF THE MESH
+            start -= 1
+            x_buffer[start] = x_init
+            log_x_buffer[start] = np.log(x_init)
+            x_difference = x_buffer[start+1]-x_buffer[start]
+            coeff = 2/((2*x_init*(A_new-(a_coeff*np.log(x_init))))-(x_difference*beta_0))
+            first_term = (x_difference/2)*results[-1][1]
+            additional_seed = iwata.beta(law.maximumSize(x_init, t_new), m_G, alpha_G)
+            # INCORPORATING IWATA'S SEEDING TERM
+            rho_buffer[start] = coeff * (first_term + sum_term + additional_seed)
+            t_prev = t_new
+    finally:
+        executor.shutdown()
+
+    return t_prev, x_buffer[start:], rho_buffer[start:]
+
+# INITIAL MESH IN MAPPED FILES
+def initialMeshInChunks(maximum_size, initial_time, maximum_time, number_of_points, scratch_directory,
+                        chunk_size=CHUNK_SIZE):
+    # BUILDS THE INITIAL MESH OF THE 'iterate' FUNCTIONS /SIZES
+    # 'maximum_size(t)'  ON  'numpy.linspace(initial_time, maximum_
+    # time, number_of_points)'  AND ZERO DENSITIES/  IN 'numpy.mem-
+    # map'  ARRAYS, ONE CHUNK OF TIMES AT A TIME.  THE VALUES ARE
+    # IDENTICAL TO THOSE COMPUTED IN MEMORY.
+    #
+    # INPUT:
+    #   maximum_size : FUNCTION. SIZE REACHED AT 't' BY THE TUMOR
+    #                  BORN AT 'x_init' /e.g. 'iwata.x_max_G'/.
+    #   initial_time, maximum_time : FLOATS. FIRST AND LAST TIME.
+    #   number_of_points : INTEGER. NUMBER OF MESH POINTS.
+    #   scratch_directory : STRING. DIRECTORY OF THE MAPPED FILES.
+    #   chunk_size : INTEGER. DEFAULTS TO 'CHUNK_SIZE'. NUMBER OF
+    #                POINTS COMPUTED AT ONCE.
+    #
+    # OUTPUT:
+    #   x_initial : NUMPY MEMMAP. INITIAL TUMOR SIZES.
+    #   rho_initial : NUMPY MEMMAP. INITIAL DENSITY VALUES.
+
+    x_initial, rho_initial = [np.memmap(tempfile.TemporaryFile(dir=scratch_directory), dtype=float, mode='w+',
+                                        shape=(number_of_points,)) for buffer in range(2)]
+    # SAME ARITHMETIC AS 'numpy.linspace'
+    step = (maximum_time-initial_time)/max(number_of_points-1, 1)
+    for lo in range(0, number_of_points, chunk_size):
+        hi = min(lo+chunk_size, number_of_points)
+        t = (np.arange(lo, hi)*step) + initial_time
+        if hi == number_of_points and number_of_points > 1:
+            t[-1] = maximum_time
+        x_initial[lo:hi] = maximum_size(t)
+        rho_initial[lo:hi] = iwata.rho_at_x_t0(x_initial[lo:hi], t)
+
+    return x_initial, rho_initial
+
+# BACKEND SELECTION
+def numbaAvailable():
+    # CHECKS WHETHER THE 'numba' BACKEND CAN BE USED.  IF NUMBA
+    # IS NOT INSTALLED A WARNING IS ISSUED AND THE CALLER FALLS
+    # BACK TO THE FUSED NUMPY KERNEL.
+    #
+    # OUTPUT:
+    #   available : BOOLEAN. TRUE IF NUMBA IS INSTALLED.
+
+    available = compiled.NUMBA_AVAILABLE
+    if not available:
+        warnings.warn("NUMBA IS NOT INSTALLED. FALLING BACK TO THE FUSED NUMPY KERNEL.")
+
+    return available
+
 
 # ====================================================== RADIOTHERAPY =================================================
 # TUMOR DENSITY /RADIOTHERAPY/
@@ -494,32 +2249,463 @@ def iterate_G_with_Radiotherapy(therapy_type, time_at_therapy_start, therapy_day
     #   x_G : NUMPY ARRAY. COMPUTED TUMOR SIZES.
     #   rho_G : NUMPY ARRAY. COMPUTED DENSITY VALUES.
 
+    # COMPUTING 'x' AND 'rho' VALUES USING GOMPERTZ GROWTH RATE UNTIL 'time_at_therapy_start'
+    snapshot = preTherapySnapshot(time_at_therapy_start=time_at_therapy_start, initial_time=initial_time, a_G=a_G,
+                                  b_G=b_G, k=k, m_G=m_G, alpha_G=alpha_G, x_initial_condition=x_initial_condition,
+                                  export_filename=export_filename_list[0])
+
+    # COMPUTING RADIOTHERAPY EFFECTS
+    x_G, rho_G = forkTherapy(snapshot=snapshot, therapy_type=therapy_type, therapy_days=therapy_days,
+                             rest_days=rest_days, therapy_sessions=therapy_sessions, total_time=total_time, D_LQ=D_LQ,
+                             alpha_LQ=alpha_LQ, beta_LQ=beta_LQ, export_filename_list=[None] + export_filename_list[1:])
+
+    return x_G, rho_G
+
+
+# TUMOR DENSITY /FRACTIONATION SCHEDULE/
+def iterate_G_with_Schedule(schedule, initial_time, total_time, a_G, b_G, k, m_G, alpha_G, alpha_LQ, beta_LQ,
+                            x_initial_condition, export_filename=None, initialize=True, x_initial=None,
+                            rho_initial=None, threshold=1, report=None):
+    # COMPUTES TUMOR DENSITY  FROM  'initial_time'  UNTIL 'total_
+    # time' WHILE RADIOTHERAPY IS ADMINISTERED  FOLLOWING  'sche-
+    # dule' /SEE 'schedule.FractionationSchedule'/.  THE WHOLE RUN
+    # IS A SINGLE CALL TO 'iterateSchedule', HENCE THE NUMBER OF
+    # FRACTIONS DOES NOT MULTIPLY THE SETUP OVERHEAD.  AFTER EACH
+    # FRACTION, METASTASIS BELOW 'threshold' ARE DELETED  AS  IN
+    # 'iterate_G_with_Radiotherapy'.
+    #
+    # INPUT:
+    #   schedule : FRACTIONATIONSCHEDULE. RADIOTHERAPY EVENTS.
+    #   initial_time : INTEGER. DAY ON WHICH SIMULATION BEGINS.
+    #   total_time : INTEGER. DAY ON WHICH SIMULATION ENDS.
+    #   a_G,...,x_initial_condition : PARAMETERS USED IN TUMOR-
+    #                                 COMPUTATIONS.
+    #   export_filename,...,rho_initial : SEE FUNCTION 'iterate_G'.
+    #   threshold : FLOAT. DEFAULTS TO '1'. SEE FUNCTION 'tools.
+    #               deleteMetastasis'.
+    #   report : DICTIONARY. DEFAULTS TO 'None'. SEE FUNCTION 'ite-
+    #            rateSchedule'.
+    #
+    # OUTPUT:
+    #   x_G : NUMPY ARRAY. COMPUTED TUMOR SIZES.
+    #   rho_G : NUMPY ARRAY. COMPUTED DENSITY VALUES.
+
+    segments = schedule.timeline(initial_time, total_time)
+    if initialize:
+        # INITIALIZING NUMPY ARRAYS
+        number_of_iterations = sum(round((end-start)/k) for kind, start, end, D_LQ in segments
+                                   if kind != 'fraction')
+        t = np.linspace(initial_time, total_time, number_of_iterations+1)
+        x_initial = iwata.x_max_G(x_initial_condition, t, a_G, b_G)
+        rho_initial = iwata.rho_at_x_t0(x_initial, t)
+
+    t_prev, x_G, rho_G = iterateSchedule(segments, x_initial, rho_initial, k, m_G, alpha_G, x_initial_condition,
+                                         a_G, b_G, alpha_LQ, beta_LQ, threshold=threshold, report=report)
+
+    # EXPORTING
+    if export_filename:
+        numerical_approximation_DF = pd.DataFrame({'x': x_G, 'rho': rho_G})
+        export_path = '/Users/victor/Documents/TUM/Thesis/Output/' + export_filename + '.csv'
+        numerical_approximation_DF.to_csv(export_path, index=False)
+
+    return x_G, rho_G
+
+
+# EVENT-DRIVEN ITERATION
+def iterateSchedule(segments, x_initial, rho_initial, k, m_G, alpha_G, x_init, a_G, b_G, alpha_LQ, beta_LQ,
+                    threshold=1, report=None):
+    # STEPS THROUGH THE SEGMENTS  OF  'FractionationSchedule.time-
+    # line'  IN  A  SINGLE LOOP OVER ONE PREALLOCATED WORKSPACE
+    # /SEE FUNCTION 'streamInWorkspace'/:
+    #   - 'growth' AND 'phase' SEGMENTS PERFORM  'round(length/k)'
+    #     ANGULO ITERATIONS  WITH  THE GOMPERTZ AND  GOMPERTZ-LIN-
+    #     QUAD GROWTH FUNCTIONS RESPECTIVELY.  AS IN 'iterate_GLQ'
+    #     THE LIN-QUAD TERM IS EVALUATED AT THE ABSOLUTE TIME.
+    #   - 'fraction' SEGMENTS SHRINK ALL TUMORS IN PLACE USING
+    #     'enderling.x_max_LQ' OVER THE FRACTION DURATION AND JUMP
+    #     OVER THE DELETED METASTASIS.  SINCE THE MESH IS SORTED,
+    #     DELETED POINTS ARE ALWAYS AT ITS FRONT: DELETING THEM ONLY
+    #     MOVES THE START OF THE CURRENT VIEW.
+    # EVERY SEGMENT STARTS EXACTLY AT ITS START TIME, SO RESULTS ARE
+    # IDENTICAL TO  CHAINED CALLS  OF  'iterate_G', 'iterate_GLQ'
+    # AND 'tools.deleteMetastasis'.
+    #
+    # INPUT:
+    #   segments : LIST. AS RETURNED BY 'FractionationSchedule.
+    #              timeline'.
+    #   x_initial,...,x_init : SEE FUNCTION 'iterateInWorkspace'.
+    #   a_G,...,beta_LQ : FLOATS. GROWTH AND RADIOTHERAPY PARAMETERS.
+    #   threshold : FLOAT. DEFAULTS TO '1'. SEE FUNCTION 'tools.
+    #               deleteMetastasis'.
+    #   report : DICTIONARY. DEFAULTS TO 'None'. IF GIVEN, IT IS
+    #            FILLED WITH THE NUMBER OF ITERATIONS, FRACTIONS
+    #            AND DELETED MESH POINTS.
+    #
+    # OUTPUT:
+    #   t_prev : FLOAT. TIME AFTER THE LAST SEGMENT.
+    #   x_prev : NUMPY ARRAY. COMPUTED TUMOR SIZES.
+    #   rho_prev : NUMPY ARRAY. COMPUTED DENSITY VALUES.
+
+    # ALLOCATING BUFFERS FOR THE LARGEST POSSIBLE MESH
+    steps = [round((end-start)/k) if kind != 'fraction' else 0 for kind, start, end, D_LQ in segments]
+    capacity = len(x_initial) + sum(steps)
+    x_buffer = np.zeros(capacity)
+    x_inter_buffer = np.zeros(capacity)
+    rho_buffer = np.zeros(capacity)
+    scratch_buffers = np.zeros((3, capacity))
+    start = capacity - len(x_initial)
+    x_buffer[start:] = x_initial
+    rho_buffer[start:] = rho_initial
+    deleted_points = 0
+    fractions = 0
+
+    t_prev = segments[0][1] if segments else 0
+    for (kind, t_start, t_end, D_LQ), number_of_iterations in zip(segments, steps):
+        t_prev = t_start
+        # ADMINISTERING A FRACTION
+        if kind == 'fraction':
+            x_prev = x_buffer[start:]
+            x_prev[:] = enderling.x_max_LQ(x_init=x_prev, t=t_end-t_start, D_LQ=D_LQ, alpha_LQ=alpha_LQ,
+                                           beta_LQ=beta_LQ)
+            # DELETING METASTASIS BELOW THRESHOLD
+            truncation_idx = np.argmax(x_prev >= threshold)
+            start += truncation_idx
+            deleted_points += truncation_idx
+            fractions += 1
+            t_prev = t_end
+            continue
+        if kind == 'growth':
+            g, g_x, x_max = modelFunctions('G', a_G=a_G, b_G=b_G)
+        else:
+            g, g_x, x_max = modelFunctions('GLQ', a_G=a_G, b_G=b_G, D_LQ=D_LQ, alpha_LQ=alpha_LQ, beta_LQ=beta_LQ)
+        for iteration in range(number_of_iterations):
+            start, t_prev = stepInWorkspace(start, t_prev, x_buffer, rho_buffer, x_inter_buffer, scratch_buffers, k,
+                                            m_G, alpha_G, x_init, g, g_x, x_max)
+
+    if report is not None:
+        report['iterations'] = sum(steps)
+        report['fractions'] = fractions
+        report['deleted_points'] = int(deleted_points)
+
+    return t_prev, x_buffer[start:], rho_buffer[start:]
+
+
+# TIMED EVENT-DRIVEN ITERATION
+def timedSchedule(*arguments):
+    # CALLS  'iterateSchedule'  WITH  'arguments'  AND MEASURES ITS
+    # RUNTIME /INSIDE THE WORKER PROCESS OF 'iterate_G_parareal'/.
+    #
+    # OUTPUT:
+    #   runtime : FLOAT. SECONDS SPENT IN 'iterateSchedule'.
+    #   result : TUPLE. OUTPUT OF 'iterateSchedule'.
+
+    start = time.perf_counter()
+    result = iterateSchedule(*arguments)
+
+    return time.perf_counter() - start, result
+
+
+# PARALLEL-IN-TIME TUMOR DENSITY /FRACTIONATION SCHEDULE/
+def iterate_G_parareal(schedule, initial_time, total_time, a_G, b_G, k, k_coarse, m_G, alpha_G, alpha_LQ, beta_LQ,
+                       x_initial_condition, slices=8, workers=None, tolerance=1e-6, max_iterations=None, threshold=1,
+                       report=None):
+    # COMPUTES THE SAME DENSITY AS 'iterate_G_with_Schedule' USING
+    # THE PARAREAL METHOD.  ['initial_time', 'total_time'] IS SPLIT
+    # INTO  'slices'  TIME SLICES.  NO BOUNDARY IS PLACED BETWEEN
+    # THE FIRST AND THE LAST EVENT OF  'schedule':  DELETING META-
+    # STASIS  MAKES  THE  COARSE  PROPAGATOR A POOR PREDICTOR, SO
+    # THE WHOLE TREATMENT IS COMPUTED WITHIN ONE SLICE. THE FINE
+    # PROPAGATOR 'F' IS 'iterateSchedule' WITH STEP SIZE 'k',  THE
+    # COARSE PROPAGATOR 'G' THE SAME FUNCTION WITH 'k_coarse'. AF-
+    # TER A SERIAL COARSE SWEEP,  EACH  ITERATION 'j' RUNS 'F' ON
+    # THE SLICES CONCURRENTLY IN A POOL OF PROCESSES AND CORRECTS
+    # THE STATES 'U' AT THE SLICE BOUNDARIES SERIALLY:
+    #       U_n+1^j = F(U_n^j-1) + G(U_n^j) - G(U_n^j-1).
+    # EVERY POINT OF THE MESH IS IDENTIFIED BY ITS BIRTH TIME. THE
+    # COARSE RESULTS ARE RESAMPLED ONTO THE BIRTH TIMES OF THE FINE
+    # ONES AND THE CORRECTION IS APPLIED TO 'log(x)' AND TO THE FLUX
+    # 'rho*g_G',  WHICH ARE BOTH SMOOTH IN THE BIRTH TIME.  AFTER
+    # 'j' ITERATIONS THE FIRST 'j' SLICES ARE EXACT  /THEY ARE NOT
+    # RECOMPUTED/.  ITERATIONS STOP WHEN THE LARGEST CHANGE OF 'rho'
+    # AT THE SLICE BOUNDARIES, RELATIVE TO ITS MAXIMUM, IS BELOW
+    # 'tolerance', OR WHEN ALL SLICES ARE EXACT: THE RESULT IS THEN
+    # IDENTICAL TO THE SERIAL ONE.
+    #
+    # THE FINE SLICES GET MORE EXPENSIVE AS THE MESH GROWS. HENCE
+    # THE SPEEDUP IS AT MOST THE RATIO  OF  THE SERIAL RUNTIME TO
+    # THAT OF THE LAST SLICE, DIVIDED BY THE NUMBER OF ITERATIONS
+    # /SEE 'tools.pararealSpeedup'/.
+    #
+    # LIMITS:  THE TREATMENT IS ALWAYS COMPUTED SERIALLY  IN ONE
+    # SLICE. BOUNDARIES BETWEEN FRACTIONS WERE TRIED: THE COARSE
+    # PREDICTOR  THEN  NEEDS MORE ITERATIONS AND MAY STOP EARLY ON
+    # A WRONG NUMBER OF METASTASIS. EVEN WITH THE TREATMENT IN ONE
+    # SLICE, THE SLICES AFTER IT NEED ABOUT ONE ITERATION EACH.
+    # WITH ONE CPU PER SLICE /1200 DAYS, k=0.1, k_coarse=2/:
+    #   - WITHOUT FRACTIONS, 16 SLICES CONVERGE IN 3 ITERATIONS
+    #     AND RUN 2.3 TIMES FASTER THAN 'iterate_G_with_Schedule'.
+    #   - WITH 6 OR 40 WEEKS OF FRACTIONS FROM DAY 300, NO NUMBER
+    #     OF SLICES IS FASTER THAN THE SERIAL RUN /0.65 TO 0.76/.
+    # HENCE THIS FUNCTION ONLY PAYS OFF FOR LONG UNTREATED GROWTH.
+    #
+    # NOTE: SCRIPTS CALLING THIS FUNCTION MUST PROTECT THEIR EN-
+    # TRY POINT  AS FOR 'tools.runScenarios'.
+    #
+    # INPUT:
+    #   schedule,...,x_initial_condition : SEE FUNCTION 'iterate_G_
+    #                                      with_Schedule'. AN EMPTY
+    #                                      SCHEDULE GIVES UNTREATED
+    #                                      GOMPERTZ GROWTH.
+    #   k_coarse : FLOAT. STEP SIZE OF THE COARSE PROPAGATOR. SHOULD
+    #              BE A MULTIPLE OF 'k'.
+    #   slices : INTEGER. DEFAULTS TO 8. NUMBER OF TIME SLICES.
+    #   workers : INTEGER. DEFAULTS TO 'None' /ONE PROCESS PER CPU/.
+    #             IF SET TO 1, SLICES ARE RUN SERIALLY IN THE CUR-
+    #             RENT PROCESS.
+    #   tolerance : FLOAT. DEFAULTS TO 1e-6. SEE ABOVE.
+    #   max_iterations : INTEGER. DEFAULTS TO 'None' /'slices'/.
+    #   threshold : FLOAT. DEFAULTS TO '1'. SEE FUNCTION 'tools.
+    #               deleteMetastasis'.
+    #   report : DICTIONARY. DEFAULTS TO 'None'. IF GIVEN, IT IS
+    #            FILLED WITH THE SLICE BOUNDARIES, THE NUMBER OF
+    #            ITERATIONS, THE CHANGE AFTER EACH ITERATION, THE
+    #            BIRTH TIMES OF THE FINAL MESH POINTS, THE RUNTIME
+    #            OF EACH FINE SLICE PER ITERATION /'fine_times'/ AND
+    #            THE RUNTIME SPENT OUTSIDE THE FINE SLICES /'sequen-
+    #            tial_time'/.
+    #
+    # OUTPUT:
+    #   x_G : NUMPY ARRAY. COMPUTED TUMOR SIZES.
+    #   rho_G : NUMPY ARRAY. COMPUTED DENSITY VALUES.
+
+    run_start = time.perf_counter()
+    if max_iterations is None:
+        max_iterations = slices
+
+    # SLICE BOUNDARIES ON THE COARSE GRID, MOVED OUT OF THE TREATMENT
+    boundaries = [initial_time]
+    for n in range(1, slices):
+        boundary = initial_time + (k_coarse*round((total_time-initial_time)*n/(slices*k_coarse)))
+        if schedule.events and schedule.events[0][0] < boundary < schedule.events[-1][1]:
+            boundary = schedule.events[-1][1]
+        if boundaries[-1] < boundary < total_time:
+            boundaries.append(boundary)
+    boundaries.append(total_time)
+    slice_segments = [schedule.window(t_start, t_end).timeline(t_start, t_end)
+                      for t_start, t_end in zip(boundaries[:-1], boundaries[1:])]
+    number_of_slices = len(slice_segments)
+    parameters = (m_G, alpha_G, x_initial_condition, a_G, b_G, alpha_LQ, beta_LQ, threshold)
+
+    def birthTimes(n, step):
+        # BIRTH TIMES OF THE POINTS ADDED IN SLICE 'n', NEWEST FIRST
+        return np.concatenate([start + (step*np.arange(round((end-start)/step), 0, -1)) for kind, start, end, D_LQ
+                               in reversed(slice_segments[n]) if kind != 'fraction'] + [np.zeros(0)])
+
+    def resample(birth_times, state):
+        # INTERPOLATES 'log(x)' AND THE FLUX 'rho*g_G' /BOTH SMOOTH IN
+        # THE BIRTH TIME/ AT 'birth_times'
+        log_x = np.interp(birth_times[::-1], state[2][::-1], np.log(state[0][::-1]))[::-1]
+        flux = state[1]*iwata.g_G(state[0], a_G, b_G)
+        return log_x, np.interp(birth_times[::-1], state[2][::-1], flux[::-1])[::-1]
+
+    def propagate(n, state, step, result=None):
+        if result is None:
+            result = iterateSchedule(slice_segments[n], state[0], state[1], step, *parameters)
+        born = birthTimes(n, step)
+        # DELETED METASTASIS ARE ALWAYS THE NEWEST POINTS
+        birth_times = np.concatenate((born, state[2]))[-len(result[1]):]
+        if step == k or len(result[1]) != len(born) + len(state[0]):
+            return result[1], result[2], birth_times
+        # RESAMPLING COARSE RESULTS ONTO THE BIRTH TIMES OF THE FINE ONES
+        fine_times = np.concatenate((birthTimes(n, k), state[2]))
+        log_x, flux = resample(fine_times, (result[1], result[2], birth_times))
+        x_fine = np.exp(log_x)
+        return x_fine, flux/iwata.g_G(x_fine, a_G, b_G), fine_times
+
+    # INITIALIZING NUMPY ARRAYS AS IN 'iterate_G_with_Schedule'
+    number_of_iterations = sum(round((end-start)/k) for segments in slice_segments
+                               for kind, start, end, D_LQ in segments if kind != 'fraction')
+    t = np.linspace(initial_time, total_time, number_of_iterations+1)
+    x_initial = iwata.x_max_G(x_initial_condition, t, a_G, b_G)
+    states = [(x_initial, iwata.rho_at_x_t0(x_initial, t), (2*initial_time)-t)]
+
+    # SERIAL COARSE SWEEP
+    coarse = []
+    for n in range(number_of_slices):
+        coarse.append(propagate(n, states[n], k_coarse))
+        states.append(coarse[n])
+
+    # PARAREAL ITERATIONS
+    executor = ProcessPoolExecutor(max_workers=workers) if workers != 1 and number_of_slices > 1 else None
+    changes = []
+    fine_times = []
+    fine_wall_time = 0.0
+    fine = [None]*number_of_slices
+    iteration = 0
+    try:
+        while iteration < min(max_iterations, number_of_slices):
+            # FINE PROPAGATION OF THE SLICES THAT ARE NOT EXACT YET
+            fine_start = time.perf_counter()
+            if executor is None:
+                results = {n: timedSchedule(slice_segments[n], states[n][0], states[n][1], k, *parameters)
+                           for n in range(iteration, number_of_slices)}
+            else:
+                futures = {n: executor.submit(timedSchedule, slice_segments[n], states[n][0], states[n][1], k,
+                                              *parameters) for n in range(iteration, number_of_slices)}
+                results = {n: future.result() for n, future in futures.items()}
+            fine_wall_time += time.perf_counter() - fine_start
+            fine_times.append([results[n][0] for n in range(iteration, number_of_slices)])
+            for n in range(iteration, number_of_slices):
+                fine[n] = propagate(n, states[n], k, results[n][1])
+            # SERIAL CORRECTION SWEEP
+            change = 0.0
+            new_states = states[:iteration+1]
+            for n in range(iteration, number_of_slices):
+                if n == iteration:
+                    new_coarse = coarse[n]
+                    new_state = fine[n]
+                else:
+                    # CORRECTING 'log(x)' AND THE FLUX ON THE FINE BIRTH TIMES
+                    new_coarse = propagate(n, new_states[n], k_coarse)
+                    birth_times = fine[n][2]
+                    log_x, flux = resample(birth_times, fine[n])
+                    log_x_new, flux_new = resample(birth_times, new_coarse)
+                    log_x_old, flux_old = resample(birth_times, coarse[n])
+                    x_new = np.exp(log_x + log_x_new - log_x_old)
+                    new_state = (x_new, (flux + flux_new - flux_old)/iwata.g_G(x_new, a_G, b_G), birth_times)
+                coarse[n] = new_coarse
+                new_states.append(new_state)
+                scale = np.max(np.abs(new_state[1]))
+                if scale > 0:
+                    old_rho = resample(new_state[2], states[n+1])[1]/iwata.g_G(new_state[0], a_G, b_G)
+                    change = max(change, np.max(np.abs(new_state[1] - old_rho))/scale)
+            states = new_states
+            changes.append(change)
+            iteration += 1
+            if change < tolerance:
+                break
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if report is not None:
+        report['boundaries'] = boundaries
+        report['iterations'] = iteration
+        report['changes'] = changes
+        report['birth_times'] = states[-1][2]
+        report['fine_times'] = fine_times
+        report['sequential_time'] = time.perf_counter() - run_start - fine_wall_time
+
+    return states[-1][:2]
+
+
+# PRE-THERAPY SNAPSHOT
+def preTherapySnapshot(time_at_therapy_start, initial_time, a_G, b_G, k, m_G, alpha_G, x_initial_condition,
+                       export_filename=None):
+    # COMPUTES  THE UNTREATED TUMOR DENSITY UNTIL 'time_at_thera-
+    # py_start' ONCE,  SO THAT ANY NUMBER OF TREATMENT BRANCHES
+    # CAN BE FORKED FROM IT  /SEE FUNCTION 'forkTherapy'/.  THE
+    # SNAPSHOT  ARRAYS  ARE  MARKED  READ-ONLY  AND  SHARED  BY
+    # ALL BRANCHES: EVERY BRANCH WRITES ITS RESULTS TO NEW ARRAYS
+    # /COPY-ON-WRITE/,  SO  FORKING  NEVER  COPIES  THE  SNAPSHOT
+    # AND NO BRANCH CAN ALTER IT.
+    #
+    # INPUT:
+    #   time_at_therapy_start,...,x_initial_condition : SEE FUNC-
+    #                     TION 'iterate_G_with_Radiotherapy'.
+    #   export_filename : STRING. DEFAULTS TO 'None'. SEE FUNCTION
+    #                     'iterate_G'.
+    #
+    # OUTPUT:
+    #   snapshot : DICTIONARY. CONTAINS THE SNAPSHOT TIME ('time'),
+    #              THE READ-ONLY ARRAYS  'x'  AND  'rho'  AND  THE
+    #              GOMPERTZ PARAMETERS NEEDED TO CONTINUE THE RUN.
+
     # COMPUTING 'x' AND 'rho' VALUES USING GOMPERTZ GROWTH RATE UNTIL 'time_at_therapy_start'
     iterations = round(time_at_therapy_start/k)
     x_G, rho_G = iterate_G(number_of_iterations=iterations, initial_time=initial_time,
                            maximum_time=time_at_therapy_start, a_G=a_G, b_G=b_G, k=k, m_G=m_G, alpha_G=alpha_G,
-                           x_initial_condition=x_initial_condition, export_filename=export_filename_list[0])
+                           x_initial_condition=x_initial_condition, export_filename=export_filename)
+    x_G.flags.writeable = False
+    rho_G.flags.writeable = False
+
+    snapshot = {'time': time_at_therapy_start, 'x': x_G, 'rho': rho_G, 'a_G': a_G, 'b_G': b_G, 'k': k, 'm_G': m_G,
+                'alpha_G': alpha_G, 'x_initial_condition': x_initial_condition}
+
+    return snapshot
+
+
+# TREATMENT BRANCH
+def forkTherapy(snapshot, therapy_type, therapy_days, rest_days, therapy_sessions, total_time, D_LQ, alpha_LQ,
+                beta_LQ, time_at_therapy_start=None, export_filename_list=[None, None, None]):
+    # CONTINUES A PRE-THERAPY SNAPSHOT  /SEE FUNCTION  'preThera-
+    # pySnapshot'/  WITH THE GIVEN TREATMENT.  IF THE THERAPY
+    # STARTS  LATER  THAN  THE SNAPSHOT, THE UNTREATED GROWTH IS
+    # FIRST CONTINUED UNTIL  'time_at_therapy_start'.  FOR THE
+    # SNAPSHOT TIME, RESULTS ARE IDENTICAL TO THOSE OF 'iterate_
+    # G_with_Radiotherapy'.  FOR LATER START TIMES, ONLY THE
+    # INITIAL ZERO-DENSITY MESH POINTS /THEIR NUMBER AND X-VALUES/
+    # DIFFER FROM A RUN STARTED FROM SCRATCH.
+    #
+    # INPUT:
+    #   snapshot : DICTIONARY. RETURNED BY 'preTherapySnapshot'.
+    #   therapy_type : STRING. POSSIBLE VALUES ARE 'continuous',
+    #                  'interval' AND 'none'.  THE  LATTER CONTI-
+    #                  NUES THE UNTREATED GROWTH UNTIL 'total_time'.
+    #   therapy_days,...,beta_LQ : SEE FUNCTION 'iterate_G_with_
+    #                              Radiotherapy'.
+    #   time_at_therapy_start : INTEGER. DEFAULTS TO 'None' /THE
+    #                           SNAPSHOT TIME/. MUST NOT BE EARLIER
+    #                           THAN THE SNAPSHOT TIME.
+    #   export_filename_list : LIST.  ENTRIES USED AS FOLLOWS :
+    #                         -[0] : TUMOR GROWTH UNTIL THERAPY
+    #                                /UNTIL 'total_time' IF 'thera-
+    #                                py_type' IS 'none'/
+    #                         -[1] : TUMOR GROWTH  THERAPY REST
+    #                         -[2] : TUMOR GROWTH AFTER THERAPY
+    #
+    # OUTPUT:
+    #   x_G : NUMPY ARRAY. COMPUTED TUMOR SIZES.
+    #   rho_G : NUMPY ARRAY. COMPUTED DENSITY VALUES.
+
+    # CHECKING THE THERAPY TYPE BEFORE ANY COMPUTATION
+    if therapy_type not in ('interval', 'continuous', 'none'):
+        raise ValueError("'therapy_type' MUST BE ONE OF 'interval', 'continuous' OR 'none'.")
+
+    # UNPACKING THE SNAPSHOT
+    a_G, b_G, k = snapshot['a_G'], snapshot['b_G'], snapshot['k']
+    m_G, alpha_G = snapshot['m_G'], snapshot['alpha_G']
+    x_initial_condition = snapshot['x_initial_condition']
+    x_G, rho_G = snapshot['x'], snapshot['rho']
+    if time_at_therapy_start is None:
+        time_at_therapy_start = snapshot['time']
+    if time_at_therapy_start < snapshot['time']:
+        raise ValueError("THERAPY CANNOT START BEFORE THE SNAPSHOT TIME.")
+
+    # CONTINUING THE UNTREATED GROWTH UNTIL 'time_at_therapy_start'
+    if therapy_type == 'none':
+        time_at_therapy_start = total_time
+    iterations = round((time_at_therapy_start - snapshot['time'])/k)
+    if iterations >= 1:
+        x_G, rho_G = iterate_G(number_of_iterations=iterations, initial_time=snapshot['time'],
+                               maximum_time=time_at_therapy_start, a_G=a_G, b_G=b_G, k=k, m_G=m_G, alpha_G=alpha_G,
+                               x_initial_condition=x_initial_condition, export_filename=export_filename_list[0],
+                               initialize=False, x_initial=x_G, rho_initial=rho_G)
 
     # CLINICALLY ESTABLISHED RADIOTHERAPY PROCEDURE
     if therapy_type == 'interval':
-        # COMPUTING RADIOTHERAPY EFFECTS
-        for session in range(therapy_sessions):
-            # COMPUTING TUMOR DECREASE DUE TO RADIOTHERAPY
-            radiotherapy_effect = enderling.x_max_LQ(x_init=x_G, t=therapy_days, D_LQ=D_LQ,
-                                                     alpha_LQ=alpha_LQ, beta_LQ=beta_LQ)
-            # DELETING METASTASIS BELOW THRESHOLD
-            treated_x_G, treated_rho_G = tools.deleteMetastasis(x_array=radiotherapy_effect, rho_array=rho_G,
-                                                                threshold=1)
-            # COMPUTING TUMOR INCREASE DURING RADIOTHERAPY REST
-            iterations = round(rest_days/k)
-            t_start = time_at_therapy_start + (therapy_days*(session+1)) + (rest_days*session)
-            x_G, rho_G = iterate_G(number_of_iterations=iterations, initial_time=t_start,
-                                   maximum_time=t_start + rest_days, a_G=a_G, b_G=b_G, k=k, m_G=m_G, alpha_G=alpha_G,
-                                   x_initial_condition=x_initial_condition, export_filename=export_filename_list[1],
-                                   initialize=False, x_initial=treated_x_G, rho_initial=treated_rho_G)
+        # COMPUTING RADIOTHERAPY EFFECTS AND TUMOR INCREASE DURING RADIOTHERAPY REST IN A SINGLE LOOP
+        time_elapsed = time_at_therapy_start + ((therapy_days+rest_days)*therapy_sessions)
+        therapy_schedule = schedule.FractionationSchedule.interval(time_at_therapy_start, therapy_days, rest_days,
+                                                                   therapy_sessions, D_LQ)
+        x_G, rho_G = iterate_G_with_Schedule(schedule=therapy_schedule, initial_time=time_at_therapy_start,
+                                             total_time=time_elapsed, a_G=a_G, b_G=b_G, k=k, m_G=m_G, alpha_G=alpha_G,
+                                             alpha_LQ=alpha_LQ, beta_LQ=beta_LQ,
+                                             x_initial_condition=x_initial_condition,
+                                             export_filename=export_filename_list[1] if therapy_sessions else None,
+                                             initialize=False, x_initial=x_G, rho_initial=rho_G)
 
         # COMPUTING TUMOR INCREASE FOR THE REMAINING DAYS AFTER THERAPY
-        time_elapsed = time_at_therapy_start + ((therapy_days+rest_days)*therapy_sessions)
         remaining_time = total_time - time_elapsed
         if remaining_time >= 1:
             iterations = round(remaining_time / k)
@@ -530,12 +2716,51 @@ def iterate_G_with_Radiotherapy(therapy_type, time_at_therapy_start, therapy_day
 
     # CONTINUOUS RADIOTHERAPY MICRODOSAGE
     elif therapy_type == 'continuous':
-        remaining_time = total_time - time_at_therapy_start
-        iterations = round(remaining_time/k)
-        x_G, rho_G = iterate_GLQ(number_of_iterations=iterations, initial_time=time_at_therapy_start,
-                                 maximum_time=remaining_time, a_G=a_G, b_G=b_G, k=k, m_G=m_G, D_LQ=D_LQ,
-                                 alpha_G=alpha_G, alpha_LQ=alpha_LQ, beta_LQ=beta_LQ,
-                                 x_initial_condition=x_initial_condition, export_filename=export_filename_list[1],
-                                 initialize=False, x_initial=x_G, rho_initial=rho_G)
+        therapy_schedule = schedule.FractionationSchedule.continuous(time_at_therapy_start, total_time, D_LQ)
+        x_G, rho_G = iterate_G_with_Schedule(schedule=therapy_schedule, initial_time=time_at_therapy_start,
+                                             total_time=total_time, a_G=a_G, b_G=b_G, k=k, m_G=m_G, alpha_G=alpha_G,
+                                             alpha_LQ=alpha_LQ, beta_LQ=beta_LQ,
+                                             x_initial_condition=x_initial_condition,
+                                             export_filename=export_filename_list[1], initialize=False,
+                                             x_initial=x_G, rho_initial=rho_G)
 
     return x_G, rho_G
+
+
+# TREATMENT BRANCHES SHARING THE PRE-THERAPY RUN
+def iterate_G_therapy_branches(time_at_therapy_start, initial_time, a_G, b_G, k, m_G, alpha_G, x_initial_condition,
+                               branch_list, export_filename=None):
+    # COMPUTES THE PRE-THERAPY SNAPSHOT ONCE AND FORKS ONE TREAT-
+    # MENT BRANCH PER ENTRY OF 'branch_list'.  BRANCHES MAY DIF-
+    # FER IN THERAPY TYPE, 'D_LQ', NUMBER OF SESSIONS AND START
+    # TIME /NOT EARLIER THAN 'time_at_therapy_start'/. COMPARED
+    # TO ONE  'iterate_G_with_Radiotherapy'  CALL  PER  BRANCH,
+    # THE UNTREATED PREFIX IS COMPUTED ONLY ONCE.
+    #
+    # INPUT:
+    #   time_at_therapy_start,...,x_initial_condition : SEE FUNC-
+    #                     TION 'preTherapySnapshot'.
+    #   branch_list : LIST.  CONTAINS  DICTIONARIES  OF  KEYWORD
+    #                 ARGUMENTS OF FUNCTION 'forkTherapy' /ALL BUT
+    #                 'snapshot'/.
+    #   export_filename : STRING. DEFAULTS TO 'None'. EXPORTS THE
+    #                     SNAPSHOT /SEE FUNCTION 'iterate_G'/.
+    #
+    # OUTPUT:
+    #   x_list : LIST. COMPUTED TUMOR SIZES OF EACH BRANCH.
+    #   rho_list : LIST. COMPUTED DENSITY VALUES OF EACH BRANCH.
+
+    # COMPUTING THE SHARED PRE-THERAPY SNAPSHOT
+    snapshot = preTherapySnapshot(time_at_therapy_start=time_at_therapy_start, initial_time=initial_time, a_G=a_G,
+                                  b_G=b_G, k=k, m_G=m_G, alpha_G=alpha_G, x_initial_condition=x_initial_condition,
+                                  export_filename=export_filename)
+
+    # FORKING THE BRANCHES
+    x_list = []
+    rho_list = []
+    for branch in branch_list:
+        x_G, rho_G = forkTherapy(snapshot=snapshot, **branch)
+        x_list.append(x_G)
+        rho_list.append(rho_G)
+
+    return x_list, rho_list
@@ -0,0 +1,207 @@
+# IMPORTING LIBRARIES
+import numpy as np
+
+# IMPORTING FILES
+import iwata
+import enderling
+
+# NUMBA IS OPTIONAL.  IF IT IS NOT INSTALLED THE FUNCTIONS BELOW
+# REMAIN  PLAIN  PYTHON  AND  'angulo'  FALLS BACK TO THE NUMPY
+# KERNELS.
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+    NUMBA_AVAILABLE = False
+
+# NUMERICAL CODES OF THE MODELS /NUMBA DOES NOT DISPATCH ON STRINGS/
+MODEL_CODES = {'G': 0, 'GLQ': 1, 'LQ': 2}
+
+# MAXIMUM RELATIVE DIFFERENCE TO THE NUMPY KERNELS /CHECKED BY 'tools.
+# compareKernels'/
+TOLERANCE = 1e-12
+
+
+def jit(function):
+    # COMPILES  'function'  IN NOPYTHON MODE. COMPILED CODE IS
+    # CACHED ON DISK /NEXT TO THE SOURCE FILE/  SO  THE JIT COST
+    # IS ONLY PAID ONCE.  WITHOUT NUMBA THE FUNCTION IS RETURNED
+    # UNCHANGED.
+    #
+    # INPUT:
+    #   function : FUNCTION. FUNCTION TO BE COMPILED.
+    #
+    # OUTPUT:
+    #   compiled_function : FUNCTION. COMPILED FUNCTION.
+
+    if NUMBA_AVAILABLE:
+        return njit(cache=True)(function)
+    return function
+
+
+# COMPILED GROWTH LAWS FROM IWATA AND ENDERLING
+g_G = jit(iwata.g_G)
+g_x_G = jit(iwata.g_x_G)
+x_max_G = jit(iwata.x_max_G)
+beta = jit(iwata.beta)
+g_LQ = jit(enderling.g_LQ)
+g_x_LQ = jit(enderling.g_x_LQ)
+x_max_LQ = jit(enderling.x_max_LQ)
+
+
+@jit
+def growth(model_code, t, x, a_G, b_G, D_LQ, alpha_LQ, beta_LQ):
+    # GROWTH FUNCTION OF THE GIVEN MODEL. THE GOMPERTZ-LIN-QUAD
+    # CASE ADDS BOTH RATES AS IN 'mix.g_GLQ'.
+
+    if model_code == 0:
+        return g_G(x, a_G, b_G)
+    elif model_code == 1:
+        return g_G(x, a_G, b_G) + g_LQ(x, t, D_LQ, alpha_LQ, beta_LQ)
+    return g_LQ(x, t, D_LQ, alpha_LQ, beta_LQ)
+
+
+@jit
+def growthDerivative(model_code, t, x, a_G, b_G, D_LQ, alpha_LQ, beta_LQ):
+    # GROWTH DERIVATIVE OF THE GIVEN MODEL. THE GOMPERTZ-LIN-
+    # QUAD CASE ADDS BOTH DERIVATIVES AS IN 'mix.g_x_GLQ'.
+
+    if model_code == 0:
+        return g_x_G(x, a_G, b_G)
+    elif model_code == 1:
+        return g_x_G(x, a_G, b_G) + g_x_LQ(t, D_LQ, alpha_LQ, beta_LQ)
+    return g_x_LQ(t, D_LQ, alpha_LQ, beta_LQ)
+
+
+@jit
+def maximumSize(model_code, x_init, t, a_G, b_G, D_LQ, alpha_LQ, beta_LQ):
+    # MAXIMUM TUMOR SIZE OF THE GIVEN MODEL. THE GOMPERTZ-LIN-
+    # QUAD CASE ADDS BOTH SIZES AS IN 'mix.x_max_GLQ'.
+
+    if model_code == 0:
+        return x_max_G(x_init, t, a_G, b_G)
+    elif model_code == 1:
+        return x_max_G(x_init, t, a_G, b_G) + x_max_LQ(x_init, t, D_LQ, alpha_LQ, beta_LQ)
+    return x_max_LQ(x_init, t, D_LQ, alpha_LQ, beta_LQ)
+
+
+@jit
+def specificGrowthRate(model_code, t, a_G, b_G, D_LQ, alpha_LQ, beta_LQ):
+    # TIME DEPENDENT PART 'A(t)' OF THE GROWTH FUNCTIONS WRITTEN
+    # AS  g(t, x) = x*(A(t) - a_G*log(x))  /SEE FUNCTION
+    # 'angulo.iterateFused'/.
+
+    if model_code == 0:
+        return a_G*np.log(b_G)
+    elif model_code == 1:
+        return (a_G*np.log(b_G)) + g_x_LQ(t, D_LQ, alpha_LQ, beta_LQ)
+    return g_x_LQ(t, D_LQ, alpha_LQ, beta_LQ)
+
+
+@jit
+def iterationLoop(model_code, number_of_iterations, t_prev, x_buffer, log_x_buffer, rho_buffer, k, m_G, alpha_G,
+                  x_init, a_G, b_G, D_LQ, alpha_LQ, beta_LQ):
+    # COMPILED VERSION OF THE ANGULO ITERATIONS. THE BUFFERS ARE
+    # LAID OUT AS IN  'angulo.iterateInWorkspace':  THE CURRENT
+    # MESH  IS  'buffer[start:]'  AND  NEW  POINTS  ARE  BORN AT
+    # 'buffer[start-1]'.  EACH ITERATION  IS A SINGLE PASS OVER
+    # THE MESH  THAT  PERFORMS THE INTERMEDIATE AND FULL TIME-STEP
+    # OF EVERY POINT AND ACCUMULATES THE TRAPEZOID SUM ON THE FLY.
+    # AS IN 'angulo.iterateFused', 'log(x)' IS STORED ALONGSIDE
+    # 'x' SO THAT EACH POINT COSTS TWO LOGARITHMS AND TWO EXPO-
+    # NENTIALS PER ITERATION /ONLY THE LOGARITHMS IF ITS DENSITY
+    # IS ZERO/.  THE BOUNDARY TERMS USE THE COMPILED GROWTH LAWS
+    # DIRECTLY.  THESE SCALAR  'log'  AND  'exp'  CALLS ARE NOT
+    # VECTORIZED, HENCE THE LOOP IS ONLY FASTER THAN THE NUMPY
+    # KERNELS FOR SMALL MESHES /SEE 'angulo.iterate_G'/.
+    #
+    # INPUT:
+    #   model_code : INTEGER. ENTRY OF 'MODEL_CODES'.
+    #   number_of_iterations : INTEGER. NUMBER OF ITERATIONS.
+    #   t_prev : FLOAT. TIME AT WHICH ITERATIONS START.
+    #   x_buffer, log_x_buffer, rho_buffer : NUMPY ARRAYS. BUFFERS
+    #                    OF THE FINAL MESH SIZE, THE INITIAL MESH
+    #                    STORED AT THEIR END. UPDATED IN PLACE.
+    #   k,...,beta_LQ : FLOATS. MODEL PARAMETERS.
+    #
+    # OUTPUT:
+    #   t_prev : FLOAT. TIME AFTER THE LAST ITERATION.
+
+    capacity = len(x_buffer)
+    start = number_of_iterations
+    a_coeff = a_G if model_code != 2 else 0.0
+    for iteration in range(number_of_iterations):
+        t_new = t_prev + k
+        A_prev = specificGrowthRate(model_code, t_prev, a_G, b_G, D_LQ, alpha_LQ, beta_LQ)
+        A_new = specificGrowthRate(model_code, t_new, a_G, b_G, D_LQ, alpha_LQ, beta_LQ)
+        sum_term = 0.0
+        first_term = 0.0
+        betaRho_jmin1 = 0.0
+        # UPDATING EXISTING POINTS AND ACCUMULATING THE TRAPEZOID SUM
+        for j in range(start, capacity):
+            x_prev = x_buffer[j]
+            x_inter = x_prev*(1+((k/2)*(A_prev-(a_coeff*log_x_buffer[j]))))
+            log_x_inter = np.log(x_inter)
+            x_buffer[j] = x_prev + (k*x_inter*(A_prev-(a_coeff*log_x_inter)))
+            log_x_buffer[j] = np.log(x_buffer[j])
+            # ZERO DENSITIES STAY ZERO: THEIR EXPONENTIALS ARE SKIPPED
+            betaRho_j = 0.0
+            if rho_buffer[j] != 0.0:
+                rho_buffer[j] *= np.exp(-k*(A_new-a_coeff-(a_coeff*log_x_inter)))
+                betaRho_j = m_G*np.exp(alpha_G*log_x_buffer[j])*rho_buffer[j]
+            if j > start:
+                sum_term += ((x_buffer[j]-x_buffer[j-1])/2)*(betaRho_jmin1+betaRho_j)
+            else:
+                first_term = betaRho_j
+            betaRho_jmin1 = betaRho_j
+        # ADDING THE NEWLY BORN POINT
+        start -= 1
+        x_buffer[start] = x_init
+        log_x_buffer[start] = np.log(x_init)
+        beta_0 = beta(x_init, m_G, alpha_G)
+        x_difference = x_buffer[start+1]-x_buffer[start]
+        coeff = 2/((2*growth(model_code, t_new, x_init, a_G, b_G, D_LQ, alpha_LQ, beta_LQ))-(x_difference*beta_0))
+        first_term *= x_difference/2
+        additonal_seed = beta(maximumSize(model_code, x_init, t_new, a_G, b_G, D_LQ, alpha_LQ, beta_LQ),
+                              m_G, alpha_G)
+        # INCORPORATING IWATA'S SEEDING TERM
+        rho_buffer[start] = coeff * (first_term + sum_term + additonal_seed)
+        t_prev = t_new
+
+    return t_prev
+
+
+def iterateCompiled(model, number_of_iterations, t_prev, x_initial, rho_initial, k, m_G, alpha_G, x_init,
+                    a_G=0.0, b_G=1.0, D_LQ=0.0, alpha_LQ=0.0, beta_LQ=0.0):
+    # ALLOCATES THE BUFFERS  AND  CALLS  'iterationLoop'.  THE
+    # RESULTS  MATCH  THOSE  OF THE  NUMPY  KERNELS  IN 'angulo'
+    # WITHIN A RELATIVE TOLERANCE OF 'TOLERANCE'.
+    #
+    # INPUT:
+    #   model : STRING. POSSIBLE VALUES ARE 'G', 'GLQ' AND 'LQ'.
+    #   number_of_iterations,...,x_init : SEE FUNCTION
+    #                               'angulo.iterateInWorkspace'.
+    #   a_G,...,beta_LQ : FLOATS. PARAMETERS OF THE MODEL. UNUSED
+    #                     ONES MAY BE LEFT AT THEIR DEFAULTS.
+    #
+    # OUTPUT:
+    #   t_prev : FLOAT. TIME AFTER THE LAST ITERATION.
+    #   x_prev : NUMPY ARRAY. COMPUTED TUMOR SIZES.
+    #   rho_prev : NUMPY ARRAY. COMPUTED DENSITY VALUES.
+
+    # ALLOCATING BUFFERS FOR THE FINAL MESH SIZE
+    capacity = len(x_initial) + number_of_iterations
+    x_buffer = np.zeros(capacity)
+    log_x_buffer = np.zeros(capacity)
+    rho_buffer = np.zeros(capacity)
+    x_buffer[number_of_iterations:] = x_initial
+    log_x_buffer[number_of_iterations:] = np.log(x_buffer[number_of_iterations:])
+    rho_buffer[number_of_iterations:] = rho_initial
+
+    # ITERATING
+    t_prev = iterationLoop(MODEL_CODES[model], number_of_iterations, float(t_prev), x_buffer, log_x_buffer,
+                           rho_buffer, float(k), float(m_G), float(alpha_G), float(x_init), float(a_G), float(b_G),
+                           float(D_LQ), float(alpha_LQ), float(beta_LQ))
+
+    return t_prev, x_buffer, rho_buffer
@@ -60,3 +60,41 @@ def x_max_LQ(x_init, t, D_LQ, alpha_LQ, beta_LQ):
     maximum_x = x_init * np.exp(-(alpha_LQ*D_LQ*t)-(beta_LQ*(D_LQ**2)*(t**2)))
 
     return maximum_x
+
+
+# LINEAR QUADRATIC GROWTH LAW EVALUATED ON A PRECOMPUTED 'log(x)'
+class LinQuadGrowth:
+    # GROWTH LAW OBJECT FOR 'g_LQ' AND 'g_x_LQ' WITH THE INTERFACE
+    # OF 'iwata.GompertzGrowth':  A(t) = -(alpha_LQ*D_LQ + 2*beta_LQ*
+    # D_LQ^2*t)  AND  a = 0.  'alpha_LQ*D_LQ'  AND  '2*beta_LQ*D_LQ^2'
+    # ARE PRECOMPUTED AT CONSTRUCTION.
+    #
+    # INPUT:
+    #   D_LQ : FLOAT. DOSAGE.
+    #   alpha_LQ : FLOAT. SINGLE HIT PARAMETER.
+    #   beta_LQ : FLOAT. MULTIPLE HIT PARAMETER.
+
+    def __init__(self, D_LQ, alpha_LQ, beta_LQ):
+        self.D_LQ = D_LQ
+        self.alpha_LQ = alpha_LQ
+        self.beta_LQ = beta_LQ
+        self.log_coefficient = 0.0
+        self.alpha_D_LQ = alpha_LQ*D_LQ
+        self.two_beta_D2_LQ = 2*beta_LQ*(D_LQ**2)
+
+    def specificRate(self, t):
+        # TIME DEPENDENT PART 'A(t)'.
+        return -(self.alpha_D_LQ + (self.two_beta_D2_LQ*t))
+
+    def growth(self, t, x, log_x):
+        # GROWTH FUNCTION 'g_LQ' /'log_x' IS NOT NEEDED/.
+        return x*self.specificRate(t)
+
+    def growthDerivative(self, t, log_x):
+        # DERIVATIVE 'g_x_LQ' /CONSTANT IN 'x'/.
+        return self.specificRate(t)
+
+    def maximumSize(self, x_init, t):
+        # SIZE REACHED AT 't' BY A TUMOR OF SIZE 'x_init' AT 't = 0'.
+        return x_max_LQ(x_init, t, self.D_LQ, self.alpha_LQ, self.beta_LQ)
+
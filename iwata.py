@@ -1,7 +1,9 @@
 
 
 # IMPORTING LIBRARIES
+from functools import lru_cache
 import numpy as np
+from scipy import integrate, optimize, signal
 
 
 # RHO'S INITIAL CONDITION.
@@ -72,6 +74,24 @@ def x_max_G(x_init, t, a_G, b_G):
 
     return maximum_x
 
+# INVERSE OF 'x_max_G' WITH RESPECT TO TIME.
+def t_from_x_G(x, x_init, a_G, b_G):
+    # COMPUTES THE TIME A TUMOR OF INITIAL SIZE 'x_init' NEEDS TO
+    # REACH SIZE 'x' /i.e. 'x_max_G(x_init, t, a_G, b_G) = x'/.
+    #
+    # INPUT:
+    #   x : NUMPY ARRAY.  CONTAINS  PRIMARY TUMOR SIZES AS FLOATS.
+    #   x_init : FLOAT. INITIAL TUMOR SIZE.
+    #   a_G : FLOAT. GROWTH RATE CONSTANT.
+    #   b_G : FLOAT. TUMOR SIZE AT SATURATED LEVEL.
+    #
+    # OUTPUT:
+    #   t : NUMPY ARRAY. TIMES NEEDED TO REACH 'x'.
+
+    t = -np.log(np.log(x/b_G)/np.log(x_init/b_G))/a_G
+
+    return t
+
 # NOTE: BETA FUNCTION FROM IWATA IS ALPHA FUNCTION FROM ANGULO.
 def beta(x, m_G, alpha_G):
     # COMPUTES COLONIZATION RATE AS SEEN IN IWATA.
@@ -87,3 +107,386 @@ def beta(x, m_G, alpha_G):
     vals = m_G*(x**alpha_G)
 
     return vals
+
+
+# BIRTH RATE OF NEW METASTASES
+@lru_cache(maxsize=32)
+def birthRate(t_max, x_init, a_G, b_G, m_G, alpha_G, h=0.25):
+    # ALONG  THE  CHARACTERISTICS  OF  IWATA'S  MODEL THE  FLUX
+    # 'g_G*rho'  IS CONSTANT, HENCE THE DENSITY IS DETERMINED BY
+    # THE BIRTH RATE  'B(t) = g_G(x_init)*rho(x_init, t)'  OF NEW
+    # METASTASES.  A METASTASIS BORN AT 's'  HAS SIZE 'x_max_G(x_-
+    # init, t-s)'  AT 't',  AS  DOES  THE PRIMARY TUMOR BORN AT 0,
+    # SO THE BOUNDARY CONDITION BECOMES THE RENEWAL EQUATION
+    #       B(t) = K(t) + INTEGRAL_0^t K(t-s)*B(s) ds
+    # WITH  'K(u) = beta(x_max_G(x_init, u))'.  IT IS SOLVED ONCE
+    # ON  THE  GRID  '0, h, ..., t_max'  WITH  THE  TRAPEZOID RULE
+    # /SECOND ORDER IN 'h'/ BY 'solveRenewal' AND CACHED.
+    #
+    # INPUT:
+    #   t_max : FLOAT. LAST TIME OF THE GRID.
+    #   x_init,...,alpha_G : FLOATS. MODEL PARAMETERS.
+    #   h : FLOAT. DEFAULTS TO 0.25. GRID SPACING IN DAYS.
+    #
+    # OUTPUT:
+    #   time : NUMPY ARRAY. GRID TIMES /READ-ONLY/.
+    #   birth_rate : NUMPY ARRAY. BIRTH RATES AT 'time' /READ-ONLY/.
+    #   births : NUMPY ARRAY. NUMBER OF METASTASES BORN UNTIL
+    #            'time' /READ-ONLY/.
+
+    n = int(np.ceil(t_max/h))
+    time = h*np.arange(n+1)
+    kernel = beta(x_max_G(x_init, time, a_G, b_G), m_G, alpha_G)
+    birth_rate = solveRenewal(kernel, kernel, h)
+    births = np.concatenate(([0.0], np.cumsum((h/2)*(birth_rate[1:]+birth_rate[:-1]))))
+    for array in (time, birth_rate, births):
+        array.flags.writeable = False
+
+    return time, birth_rate, births
+
+# GROWTH RATE OF A RENEWAL EQUATION ON A GRID
+def renewalGrowthRate(kernel, h):
+    # COMPUTES THE RATE 'lambda' FOR WHICH THE DISCRETE KERNEL
+    # OF  'solveRenewal',  TILTED BY 'exp(-lambda*t)',  HAS UNIT
+    # MASS.  SOLUTIONS OF THE RENEWAL EQUATION GROW LIKE 'exp(lam-
+    # bda*t)' ON THE GRID. IF THE KERNEL MASS IS BELOW '1', THE
+    # RATE IS SET TO 0.
+    #
+    # INPUT:
+    #   kernel : NUMPY ARRAY. KERNEL ON THE GRID '0, h, 2h, ...'.
+    #   h : FLOAT. GRID SPACING.
+    #
+    # OUTPUT:
+    #   rate : FLOAT. GROWTH RATE 'lambda'.
+
+    weights = h*kernel
+    weights[0] /= 2
+    if np.sum(weights) <= 1:
+        return 0.0
+    steps = np.arange(len(kernel))
+
+    def mass(rate):
+        return np.sum(weights*np.exp(-rate*h*steps))
+
+    lower, upper = 0.0, 1.0
+    while mass(upper) > 1:
+        lower, upper = upper, 2*upper
+    # BISECTION
+    for iteration in range(100):
+        middle = (lower+upper)/2
+        if mass(middle) > 1:
+            lower = middle
+        else:
+            upper = middle
+
+    return upper
+
+# RECIPROCAL OF A POWER SERIES
+def seriesReciprocal(series):
+    # COMPUTES  THE  FIRST  'len(series)'  COEFFICIENTS OF THE
+    # POWER SERIES  '1/series'  BY NEWTON ITERATION, DOUBLING THE
+    # NUMBER OF CORRECT COEFFICIENTS IN EACH STEP.  PRODUCTS ARE
+    # FFT CONVOLUTIONS, HENCE THE COST IS 'O(n log(n))'.
+    #
+    # INPUT:
+    #   series : NUMPY ARRAY. COEFFICIENTS. 'series[0]' MUST NOT
+    #            BE ZERO.
+    #
+    # OUTPUT:
+    #   reciprocal : NUMPY ARRAY. COEFFICIENTS OF THE RECIPROCAL.
+
+    n = len(series)
+    reciprocal = np.array([1/series[0]])
+    while len(reciprocal) < n:
+        m = min(2*len(reciprocal), n)
+        correction = -signal.fftconvolve(series[:m], reciprocal)[:m]
+        correction[0] += 2
+        reciprocal = signal.fftconvolve(reciprocal, correction)[:m]
+
+    return reciprocal
+
+# RENEWAL EQUATION SOLVED BY FFT
+def solveRenewal(forcing, kernel, h):
+    # SOLVES  THE RENEWAL /VOLTERRA/ EQUATION
+    #       B(t) = f(t) + INTEGRAL_0^t K(t-s)*B(s) ds
+    # ON  THE  GRID '0, h, 2h, ...'  WITH THE TRAPEZOID RULE. THE
+    # DISCRETE EQUATION IS A CONVOLUTION, SO IN TERMS OF GENERA-
+    # TING FUNCTIONS  'B = f_0/(1 - K_h)'  /WITH THE TRAPEZOID EN-
+    # DPOINT CORRECTION IN 'f_0'/,  WHICH IS COMPUTED BY 'series-
+    # Reciprocal' AND ONE FFT CONVOLUTION IN 'O(n log(n))' INSTEAD
+    # OF  'O(n**2)'.  SINCE  FFT ROUNDING ERRORS ARE RELATIVE TO
+    # THE LARGEST VALUE,  FORCING,  KERNEL AND SOLUTION ARE FIRST
+    # TILTED BY  'exp(-lambda*t)'  /SEE 'renewalGrowthRate'/, WHICH
+    # KEEPS EXPONENTIALLY GROWING SOLUTIONS OF ORDER ONE.
+    #
+    # INPUT:
+    #   forcing : NUMPY ARRAY. 'f' ON THE GRID.
+    #   kernel : NUMPY ARRAY. 'K' ON THE GRID. SAME LENGTH.
+    #   h : FLOAT. GRID SPACING.
+    #
+    # OUTPUT:
+    #   solution : NUMPY ARRAY. 'B' ON THE GRID.
+
+    rate = renewalGrowthRate(kernel, h)
+    tilt = np.exp(-rate*h*np.arange(len(kernel)))
+    tilted_forcing = forcing*tilt
+    tilted_kernel = kernel*tilt
+    # TRAPEZOID WEIGHTS. THE HALF WEIGHT OF 's = 0' ENTERS THE FORCING
+    weights = h*tilted_kernel
+    weights[0] /= 2
+    initial_solution = forcing[0]
+    corrected_forcing = tilted_forcing - ((h/2)*tilted_kernel*initial_solution)
+    corrected_forcing[0] = tilted_forcing[0]*(1 - weights[0])
+    denominator = -weights
+    denominator[0] += 1
+    tilted_solution = signal.fftconvolve(corrected_forcing, seriesReciprocal(denominator))[:len(kernel)]
+    solution = tilted_solution/tilt
+
+    return solution
+
+# METASTASIS COUNTS AND SIZE MOMENTS ON A TIME GRID
+def metastasisCounts(total_time, x_init, a_G, b_G, m_G, alpha_G, x_thresholds=(), moments=(), h=1):
+    # COMPUTES  THE NUMBER OF METASTASES  ON  THE  GRID  '0, h,
+    # ..., total_time'  WITHOUT  MARCHING A MESH.  THE BIRTH RATE
+    # IS  THE  SOLUTION  OF  A RENEWAL EQUATION  /SEE 'birthRate'/
+    # SOLVED BY 'solveRenewal'.  FROM IT:
+    #   - N(t) IS THE INTEGRAL OF THE BIRTH RATE UNTIL 't'.
+    #   - THE NUMBER OF METASTASES OF SIZE 'x' OR LARGER IS N(t -
+    #     tau(x)), WHERE 'tau(x)' IS THE AGE AT WHICH THEY REACH 'x'.
+    #   - THE MOMENT  'INTEGRAL x**p*rho(x, t) dx'  IS THE CONVOLU-
+    #     TION  OF THE BIRTH RATE  WITH  'x_max_G(x_init, t)**p', ALSO
+    #     EVALUATED BY FFT.
+    # THE WHOLE COMPUTATION COSTS 'O(T log(T))'.
+    #
+    # INPUT:
+    #   total_time : INTEGER. LAST DAY OF THE GRID.
+    #   x_init,...,alpha_G : FLOATS. MODEL PARAMETERS.
+    #   x_thresholds : LIST. DEFAULTS TO '()'. SIZES ABOVE WHICH
+    #                  METASTASES ARE COUNTED.
+    #   moments : LIST. DEFAULTS TO '()'. POWERS 'p' OF THE SIZE
+    #             MOMENTS TO COMPUTE.
+    #   h : FLOAT. DEFAULTS TO 1 /DAILY GRID/. GRID SPACING.
+    #
+    # OUTPUT:
+    #   time : NUMPY ARRAY. GRID TIMES.
+    #   N : NUMPY ARRAY. NUMBER OF METASTASES.
+    #   N_above_list : LIST. ONE ARRAY PER ENTRY OF 'x_thresholds'.
+    #   moment_list : LIST. ONE ARRAY PER ENTRY OF 'moments'.
+
+    n = int(np.ceil(total_time/h))
+    time = h*np.arange(n+1)
+    tumor_size = x_max_G(x_init, time, a_G, b_G)
+    kernel = beta(tumor_size, m_G, alpha_G)
+    birth_rate = solveRenewal(kernel, kernel, h)
+    N = np.concatenate(([0.0], np.cumsum((h/2)*(birth_rate[1:]+birth_rate[:-1]))))
+
+    # COUNTING METASTASES ABOVE EACH THRESHOLD
+    N_above_list = [np.interp(time - t_from_x_G(x_threshold, x_init, a_G, b_G), time, N, left=0)
+                    for x_threshold in x_thresholds]
+
+    # COMPUTING SIZE MOMENTS BY TRAPEZOID CONVOLUTION /TILTED AS IN 'solveRenewal'/
+    moment_list = []
+    rate = renewalGrowthRate(kernel, h)
+    tilt = np.exp(-rate*time)
+    for power in moments:
+        size_power = tumor_size**power
+        convolution = signal.fftconvolve(birth_rate*tilt, size_power*tilt)[:n+1]
+        convolution -= ((birth_rate[0]*size_power*tilt) + (birth_rate*tilt*size_power[0]))/2
+        moment_list.append(h*convolution/tilt)
+
+    return time, N, N_above_list, moment_list
+
+# GRID OF THE CACHED BIRTH RATE COVERING 't'
+def birthRateFor(t, x_init, a_G, b_G, m_G, alpha_G, h=0.25):
+    # RETURNS 'birthRate' ON A GRID REACHING AT LEAST 'max(t)'. THE
+    # LAST GRID TIME IS ROUNDED UP TO A POWER OF TWO DAYS, SO THAT
+    # QUERIES FOR DIFFERENT TIMES SHARE THE CACHED TABLE.
+
+    t_max = 2.0**max(6, int(np.ceil(np.log2(max(np.max(t), 1)))))
+
+    return birthRate(t_max, float(x_init), float(a_G), float(b_G), float(m_G), float(alpha_G), float(h))
+
+# DENSITY FROM IWATA'S SOLUTION ALONG THE CHARACTERISTICS
+def rho_analytic(x, t, x_init, a_G, b_G, m_G, alpha_G, h=0.25):
+    # COMPUTES  'rho(x, t)'  AS  'B(t - tau(x))/g_G(x)',  WHERE
+    # 'tau(x)' IS THE AGE OF A METASTASIS OF SIZE 'x' /'t_from_x_G'/
+    # AND 'B' THE BIRTH RATE OF FUNCTION 'birthRate'.  THIS IS THE
+    # DENSITY COMPUTED BY 'angulo.iterate_G' FOR A ZERO INITIAL
+    # DENSITY AND  'initial_time'  0,  WITHOUT  ANY TIME-MARCHING:
+    # ONCE THE BIRTH RATE IS CACHED, QUERIES ONLY INTERPOLATE IT.
+    # SIZES THAT NO METASTASIS HAS REACHED YET HAVE ZERO DENSITY.
+    #
+    # INPUT:
+    #   x : NUMPY ARRAY. TUMOR SIZES.
+    #   t : NUMPY ARRAY. TIMES. BROADCAST AGAINST 'x'.
+    #   x_init,...,alpha_G : FLOATS. MODEL PARAMETERS.
+    #   h : FLOAT. DEFAULTS TO 0.25. SEE FUNCTION 'birthRate'.
+    #
+    # OUTPUT:
+    #   rho : NUMPY ARRAY. DENSITY VALUES.
+
+    x, t = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(t, dtype=float))
+    time, birth_rate, births = birthRateFor(t, x_init, a_G, b_G, m_G, alpha_G, h)
+    birth_time = t - t_from_x_G(x, x_init, a_G, b_G)
+    rho = np.interp(birth_time, time, birth_rate)/g_G(x, a_G, b_G)
+    # NO METASTASIS IS BORN BEFORE 0 OR SMALLER THAN 'x_init'
+    rho = np.where((birth_time < 0) | (birth_time > t), 0.0, rho)
+
+    return rho
+
+# NUMBER OF METASTASES FROM IWATA'S SOLUTION
+def N_analytic(t, x_init, a_G, b_G, m_G, alpha_G, x_min=None, h=0.25):
+    # COMPUTES  THE  TOTAL NUMBER OF METASTASES AT 't',  i.e. THE
+    # INTEGRAL OF 'rho_analytic' OVER ALL SIZES. IF 'x_min' IS
+    # GIVEN, ONLY METASTASES OF SIZE 'x_min' OR LARGER ARE COUNTED:
+    # THOSE BORN BEFORE 't - tau(x_min)'.
+    #
+    # INPUT:
+    #   t : NUMPY ARRAY. TIMES.
+    #   x_init,...,alpha_G : FLOATS. MODEL PARAMETERS.
+    #   x_min : FLOAT. DEFAULTS TO 'None'. SMALLEST SIZE COUNTED.
+    #   h : FLOAT. DEFAULTS TO 0.25. SEE FUNCTION 'birthRate'.
+    #
+    # OUTPUT:
+    #   N : NUMPY ARRAY. NUMBER OF METASTASES.
+
+    t = np.asarray(t, dtype=float)
+    time, birth_rate, births = birthRateFor(t, x_init, a_G, b_G, m_G, alpha_G, h)
+    birth_time = t
+    if x_min is not None:
+        birth_time = t - t_from_x_G(x_min, x_init, a_G, b_G)
+    N = np.interp(birth_time, time, births, left=0)
+
+    return N
+
+
+# MALTHUSIAN PARAMETER OF IWATA'S MODEL
+def malthusianRate(x_init, a_G, b_G, m_G, alpha_G):
+    # COMPUTES  THE  EXPONENTIAL  RATE  'lambda'  AT  WHICH  THE
+    # NUMBER OF METASTASES GROWS IN THE LONG RUN.  IT IS THE REAL
+    # ROOT OF THE CHARACTERISTIC EQUATION OF THE RENEWAL EQUATION
+    # /SEE 'birthRate'/
+    #       INTEGRAL_0^inf beta(x_max_G(x_init, u))*exp(-lambda*u) du = 1
+    # i.e. THE DOMINANT EIGENVALUE OF THE MCKENDRICK-VON FOERSTER
+    # OPERATOR SOLVED IN 'angulo'.  THE INTEGRAL DECREASES  WITH
+    # 'lambda'  AND  'beta'  IS BOUNDED  BY  'beta(b_G)', HENCE THE
+    # ROOT LIES IN /0, beta(b_G)/.  WITHOUT SEEDING /'beta(b_G)'
+    # NOT POSITIVE/ THERE IS NO ROOT AND A 'ValueError' IS RAISED.
+    #
+    # INPUT:
+    #   x_init,...,alpha_G : FLOATS. MODEL PARAMETERS.
+    #
+    # OUTPUT:
+    #   rate : FLOAT. MALTHUSIAN PARAMETER 'lambda' /1/DAY/.
+
+    def characteristic(rate):
+        transform = integrate.quad(lambda u: beta(x_max_G(x_init, u, a_G, b_G), m_G, alpha_G)*np.exp(-rate*u), 0,
+                                   np.inf, limit=200)[0]
+        return transform - 1
+
+    upper = beta(b_G, m_G, alpha_G)
+    if not upper > 0:
+        raise ValueError("'beta(b_G)' MUST BE POSITIVE /CHECK 'm_G' AND 'alpha_G'/.")
+    lower = upper/2
+    while characteristic(lower) < 0:
+        lower /= 2
+        # THE HALVING STOPS BEFORE 'lower' UNDERFLOWS TO ZERO
+        if lower < np.finfo(float).tiny:
+            raise ValueError("NO MALTHUSIAN RATE FOUND IN /0, beta(b_G)/.")
+    rate = optimize.brentq(characteristic, lower, upper, xtol=1e-14, rtol=1e-12)
+
+    return rate
+
+# LONG-TIME DENSITY PROFILE
+def rho_asymptotic(x, x_init, a_G, b_G, m_G, alpha_G, rate=None):
+    # COMPUTES THE LONG-TIME LIMIT OF THE NORMALIZED DENSITY
+    # 'rho(x, t)/N(t)'.  SINCE THE BIRTH RATE GROWS LIKE 'exp(lam-
+    # bda*t)',  'rho_analytic'  TENDS  TO  A MULTIPLE  OF THE
+    # STATIONARY EIGENFUNCTION
+    #       phi(x) = lambda*exp(-lambda*tau(x))/g_G(x),
+    # WHERE 'tau(x)' IS THE AGE AT WHICH A METASTASIS REACHES 'x'.
+    # SINCE 'dx = g_G du' ALONG THE CHARACTERISTICS,  'phi'  INTE-
+    # GRATES TO 1 OVER '/x_init, b_G/'.
+    #
+    # INPUT:
+    #   x : NUMPY ARRAY. TUMOR SIZES.
+    #   x_init,...,alpha_G : FLOATS. MODEL PARAMETERS.
+    #   rate : FLOAT. DEFAULTS TO 'None' /COMPUTED BY 'malthusian-
+    #          Rate'/. MALTHUSIAN PARAMETER.
+    #
+    # OUTPUT:
+    #   phi : NUMPY ARRAY. NORMALIZED LONG-TIME DENSITY.
+
+    if rate is None:
+        rate = malthusianRate(x_init, a_G, b_G, m_G, alpha_G)
+    x = np.asarray(x, dtype=float)
+    age = t_from_x_G(x, x_init, a_G, b_G)
+    phi = rate*np.exp(-rate*age)/g_G(x, a_G, b_G)
+    # SIZES OUTSIDE '/x_init, b_G/' ARE NEVER REACHED
+    phi = np.where((age >= 0) & (x < b_G), phi, 0.0)
+
+    return phi
+
+# GOMPERTZ GROWTH LAW EVALUATED ON A PRECOMPUTED 'log(x)'
+class GompertzGrowth:
+    # GROWTH LAW OBJECT FOR  'g_G'  AND  'g_x_G'.  BOTH ARE WRITTEN
+    # IN TERMS OF 'log(x)' /COMPUTED ONCE PER MESH AND TIME-STEP
+    # BY THE CALLER/ AS
+    #       g(t, x) = x*(A(t) - a*log(x))
+    #       g_x(t, x) = A(t) - a - a*log(x)
+    # WITH  A = a_G*log(b_G)  AND  a = a_G.  CONSTANTS ARE PRECOM-
+    # PUTED AT CONSTRUCTION, SO NO LOGARITHM IS EVALUATED HERE.
+    #
+    # INPUT:
+    #   a_G : FLOAT. GROWTH RATE CONSTANT.
+    #   b_G : FLOAT. TUMOR SIZE AT SATURATED LEVEL.
+
+    def __init__(self, a_G, b_G):
+        self.a_G = a_G
+        self.b_G = b_G
+        self.log_coefficient = a_G
+        self.a_log_b_G = a_G*np.log(b_G)
+
+    def specificRate(self, t):
+        # TIME DEPENDENT PART 'A(t)'. CONSTANT FOR GOMPERTZ GROWTH.
+        if np.isscalar(t):
+            return self.a_log_b_G
+        return np.full(np.shape(t), self.a_log_b_G)
+
+    def growth(self, t, x, log_x):
+        # GROWTH FUNCTION 'g_G' AT SIZES 'x' WITH LOGARITHMS 'log_x'.
+        return x*(self.specificRate(t) - (self.log_coefficient*log_x))
+
+    def growthDerivative(self, t, log_x):
+        # DERIVATIVE 'g_x_G' AT SIZES WITH LOGARITHMS 'log_x'.
+        return self.specificRate(t) - self.log_coefficient - (self.log_coefficient*log_x)
+
+    def maximumSize(self, x_init, t):
+        # SIZE REACHED AT 't' BY A TUMOR BORN WITH SIZE 'x_init'.
+        return x_max_G(x_init, t, self.a_G, self.b_G)
+
+
+# COLONIZATION RATE EVALUATED ON A PRECOMPUTED 'log(x)'
+class Colonization:
+    # COLONIZATION RATE  'beta'  WRITTEN AS  'm_G*exp(alpha_G*log(x))',
+    # WHICH AVOIDS THE GENERAL POWER 'x**alpha_G'. 'log(m_G)' IS ONLY
+    # EVALUATED BY 'logRate', SO 'm_G = 0' IS ALLOWED.
+    #
+    # INPUT:
+    #   m_G : FLOAT. COLONIZATION COEFFICIENT.
+    #   alpha_G : FLOAT. FRACTAL DIMENSION OF BLOOD VESSELS.
+
+    def __init__(self, m_G, alpha_G):
+        self.m_G = m_G
+        self.alpha_G = alpha_G
+
+    def rate(self, log_x):
+        # COLONIZATION RATE AT SIZES WITH LOGARITHMS 'log_x'.
+        return self.m_G*np.exp(self.alpha_G*log_x)
+
+    def logRate(self, log_x):
+        # LOGARITHM OF THE COLONIZATION RATE /'-inf' IF 'm_G = 0'/.
+        with np.errstate(divide='ignore'):
+            log_m_G = np.log(self.m_G)
+        return log_m_G + (self.alpha_G*log_x)
+
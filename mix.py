@@ -55,3 +55,34 @@ def x_max_GLQ(x_init, t, a_G, b_G, D_LQ, alpha_LQ, beta_LQ):
     return maximum_x
 
 
+# GOMPERTZ & LIN-QUAD GROWTH LAW EVALUATED ON A PRECOMPUTED 'log(x)'
+class GompertzLinQuadGrowth:
+    # GROWTH LAW OBJECT COMBINING 'iwata.GompertzGrowth' AND 'en-
+    # derling.LinQuadGrowth' AS IN 'g_GLQ' AND 'g_x_GLQ': THE TIME
+    # DEPENDENT PARTS ARE ADDED AND  'a = a_G'.
+    #
+    # INPUT:
+    #   a_G,...,beta_LQ : PARAMETERS USED BY IWATA AND ENDERLING.
+
+    def __init__(self, a_G, b_G, D_LQ, alpha_LQ, beta_LQ):
+        self.gompertz = iwata.GompertzGrowth(a_G, b_G)
+        self.lin_quad = enderling.LinQuadGrowth(D_LQ, alpha_LQ, beta_LQ)
+        self.log_coefficient = a_G
+
+    def specificRate(self, t):
+        # TIME DEPENDENT PART 'A(t)' OF BOTH LAWS.
+        return self.gompertz.a_log_b_G + self.lin_quad.specificRate(t)
+
+    def growth(self, t, x, log_x):
+        # GROWTH FUNCTION 'g_GLQ' AT SIZES 'x' WITH LOGARITHMS 'log_x'.
+        return x*(self.specificRate(t) - (self.log_coefficient*log_x))
+
+    def growthDerivative(self, t, log_x):
+        # DERIVATIVE 'g_x_GLQ' AT SIZES WITH LOGARITHMS 'log_x'.
+        return self.specificRate(t) - self.log_coefficient - (self.log_coefficient*log_x)
+
+    def maximumSize(self, x_init, t):
+        # SIZE REACHED AT 't' BY A TUMOR BORN WITH SIZE 'x_init'.
+        return x_max_GLQ(x_init, t, self.gompertz.a_G, self.gompertz.b_G, self.lin_quad.D_LQ,
+                         self.lin_quad.alpha_LQ, self.lin_quad.beta_LQ)
+
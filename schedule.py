@@ -0,0 +1,156 @@
+# IMPORTING LIBRARIES
+import bisect
+
+
+# RADIOTHERAPY FRACTIONATION SCHEDULE
+class FractionationSchedule:
+    # SORTED LIST OF RADIOTHERAPY EVENTS. TWO KINDS OF EVENTS ARE
+    # SUPPORTED:
+    #   - FRACTIONS : A DOSE  'D_LQ'  ADMINISTERED AT 'time'. ALL
+    #                 TUMORS SHRINK  AS  IN  'enderling.x_max_LQ'
+    #                 OVER 'duration' DAYS, DURING WHICH NO GROWTH
+    #                 TAKES PLACE /AS  THE  'therapy_days' OF THE
+    #                 'interval' THERAPY/.
+    #   - PHASES : CONTINUOUS MICRO-DOSAGE  'D_LQ'  FROM  'start'
+    #              TO 'end'.  TUMORS GROW FOLLOWING  THE GOMPERTZ-
+    #              LIN-QUAD MODEL /AS IN THE 'continuous' THERAPY/.
+    # BETWEEN EVENTS, TUMORS GROW FOLLOWING GOMPERTZ.  ARBITRARY
+    # CLINICAL SCHEDULES /WEEKENDS, BOOSTS, HYPOFRACTIONATION/ ARE
+    # BUILT BY ADDING EVENTS.  EVENTS MAY NOT OVERLAP.
+    #
+    # EACH EVENT IS STORED AS THE TUPLE '(start, end, kind, D_LQ)'
+    # IN 'events', SORTED BY ITS START TIME.
+
+    def __init__(self):
+        self.events = []
+
+    def addEvent(self, start, end, kind, D_LQ):
+        # INSERTS AN EVENT KEEPING 'events' SORTED. RAISES A 'Value-
+        # Error' IF IT OVERLAPS AN EXISTING EVENT.
+
+        if end < start:
+            raise ValueError("EVENTS CANNOT END BEFORE THEY START.")
+        event = (start, end, kind, D_LQ)
+        position = bisect.bisect(self.events, event)
+        neighbours = self.events[max(position-1, 0):position+1]
+        for other_start, other_end, other_kind, other_D_LQ in neighbours:
+            if (start < other_end and other_start < end) or start == other_start:
+                raise ValueError("EVENT STARTING ON DAY " + str(start) + " OVERLAPS THE EVENT STARTING ON DAY " +
+                                 str(other_start) + ".")
+        self.events.insert(position, event)
+
+        return self
+
+    def addFraction(self, time, D_LQ, duration=1):
+        # ADDS A FRACTION OF DOSE 'D_LQ' AT 'time' /SEE ABOVE/.
+
+        return self.addEvent(time, time + duration, 'fraction', D_LQ)
+
+    def addPhase(self, start, end, D_LQ):
+        # ADDS A CONTINUOUS PHASE OF DOSE 'D_LQ' /SEE ABOVE/.
+
+        return self.addEvent(start, end, 'phase', D_LQ)
+
+    def addWeeklyFractions(self, start, weeks, D_LQ, days_per_week=5, duration=1):
+        # ADDS ONE FRACTION PER DAY ON THE FIRST 'days_per_week' DAYS
+        # OF  EACH  OF  'weeks'  WEEKS  STARTING  ON 'start'.  THE
+        # REMAINING DAYS OF EACH WEEK /e.g. WEEKENDS/ ARE REST DAYS.
+
+        for week in range(weeks):
+            for day in range(days_per_week):
+                self.addFraction(start + (7*week) + day, D_LQ, duration)
+
+        return self
+
+    @classmethod
+    def interval(cls, time_at_therapy_start, therapy_days, rest_days, therapy_sessions, D_LQ):
+        # SCHEDULE OF THE 'interval' THERAPY  /SEE FUNCTION 'angulo.
+        # iterate_G_with_Radiotherapy'/:  'therapy_sessions'  FRAC-
+        # TIONS OF 'therapy_days' DAYS, EACH FOLLOWED BY 'rest_days'.
+
+        schedule = cls()
+        for session in range(therapy_sessions):
+            schedule.addFraction(time_at_therapy_start + ((therapy_days+rest_days)*session), D_LQ, therapy_days)
+
+        return schedule
+
+    @classmethod
+    def continuous(cls, time_at_therapy_start, total_time, D_LQ):
+        # SCHEDULE OF THE 'continuous' THERAPY: A SINGLE PHASE FROM
+        # 'time_at_therapy_start' TO 'total_time'.
+
+        return cls().addPhase(time_at_therapy_start, total_time, D_LQ)
+
+    @classmethod
+    def fromTherapyType(cls, therapy_type, time_at_therapy_start, therapy_days, rest_days, therapy_sessions,
+                        total_time, D_LQ):
+        # TRANSLATES THE 'therapy_type' STRINGS  /'interval', 'conti-
+        # nuous' AND 'none'/ INTO A SCHEDULE.
+
+        if therapy_type == 'interval':
+            return cls.interval(time_at_therapy_start, therapy_days, rest_days, therapy_sessions, D_LQ)
+        elif therapy_type == 'continuous':
+            return cls.continuous(time_at_therapy_start, total_time, D_LQ)
+        elif therapy_type == 'none':
+            return cls()
+        raise ValueError("'therapy_type' MUST BE ONE OF 'interval', 'continuous' OR 'none'.")
+
+    def eventTimes(self):
+        # RETURNS THE SORTED START AND END TIMES OF ALL EVENTS /e.g.
+        # THE 'event_times' OF THE 'adaptive' KERNEL OF 'angulo'/.
+
+        return sorted({time for start, end, kind, D_LQ in self.events for time in (start, end)})
+
+    def window(self, t_start, t_end):
+        # RETURNS A NEW SCHEDULE WITH THE EVENTS OF  ['t_start', 't_
+        # end']  /e.g. ONE TIME SLICE OF 'angulo.iterate_G_parareal'/.
+        # PHASES ARE CUT AT BOTH ENDS. FRACTIONS MAY NOT BE SPLIT.
+
+        window = type(self)()
+        for start, end, kind, D_LQ in self.events:
+            if end <= t_start or start >= t_end:
+                continue
+            if kind == 'fraction' and start < t_start:
+                raise ValueError("DAY " + str(t_start) + " SPLITS THE FRACTION STARTING ON DAY " + str(start) + ".")
+            if kind == 'phase':
+                start, end = max(start, t_start), min(end, t_end)
+            window.events.append((start, end, kind, D_LQ))
+
+        return window
+
+    def timeline(self, t_start, t_end):
+        # SPLITS  ['t_start', 't_end']  INTO CONSECUTIVE SEGMENTS.
+        # THE EVENTS ARE INTERLEAVED WITH GOMPERTZ GROWTH SEGMENTS:
+        # ONE BEFORE THE FIRST EVENT AND ONE AFTER EACH FRACTION ARE
+        # ALWAYS PRESENT /POSSIBLY OF LENGTH ZERO/,  OTHER  GROWTH
+        # SEGMENTS  ONLY  IF THEY ARE NOT EMPTY.  PHASES ARE CUT AT
+        # 't_end', EVENTS STARTING AT OR AFTER 't_end' ARE IGNORED.
+        #
+        # INPUT:
+        #   t_start : INTEGER. DAY ON WHICH THE SEGMENTS START. NO
+        #             EVENT MAY START EARLIER.
+        #   t_end : INTEGER. DAY ON WHICH THE SEGMENTS END.
+        #
+        # OUTPUT:
+        #   segments : LIST. TUPLES '(kind, start, end, D_LQ)' WHERE
+        #              'kind' IS 'growth', 'fraction' OR 'phase'.
+
+        segments = []
+        t = t_start
+        previous_kind = None
+        for start, end, kind, D_LQ in self.events:
+            if start >= t_end:
+                break
+            if start < t_start:
+                raise ValueError("EVENT STARTING ON DAY " + str(start) + " PRECEDES THE SIMULATION START.")
+            if start > t or previous_kind in (None, 'fraction'):
+                segments.append(('growth', t, start, None))
+            if kind == 'phase':
+                end = min(end, t_end)
+            segments.append((kind, start, end, D_LQ))
+            t = end
+            previous_kind = kind
+        if t_end > t or previous_kind in (None, 'fraction'):
+            segments.append(('growth', t, max(t, t_end), None))
+
+        return segments
@@ -0,0 +1,175 @@
+# IMPORTING LIBRARIES
+import numpy as np
+
+# IMPORTING FILES
+import angulo
+import enderling
+import iwata
+import tools
+
+
+# KEYWORD ARGUMENTS OF 'angulo.iterate_G' AND 'angulo.iterate_GLQ'
+# THAT MAY BE SET THROUGH 'iteration_options'
+ITERATION_OPTIONS = ('kernel', 'passes', 'report', 'threads', 'scratch_directory', 'step_control')
+
+
+# RESUMABLE TUMOR DENSITY SIMULATION
+class Simulation:
+    # OWNS THE CURRENT TIME 't', THE TUMOR SIZES 'x' AND THE DEN-
+    # SITY VALUES 'rho' OF AN ANGULO RUN  TOGETHER WITH ITS GOM-
+    # PERTZ PARAMETERS.  RUNS ARE EXTENDED INCREMENTALLY: 'advance'
+    # ONLY COMPUTES THE REQUESTED DAYS, SO A LONGER HORIZON NEVER
+    # REQUIRES RECOMPUTING FROM DAY 0.
+    #
+    # UNLIKE  'angulo.iterate_G',  THE INITIAL MESH HOLDS A SINGLE
+    # POINT /THE HORIZON IS UNKNOWN/.  SINCE THE INITIAL DENSITY
+    # IS ZERO, THE REMAINING POINTS OF THE 'linspace' GRID ONLY
+    # ADD TRAILING ZEROS. THE OTHER VALUES AGREE TO ROUND-OFF:
+    # THE TRAPEZOID SUM OF THE BOUNDARY CONDITION RUNS OVER A
+    # DIFFERENT NUMBER OF POINTS, SO 'rho' MAY DIFFER IN THE LAST
+    # DIGITS /RELATIVE DIFFERENCES OF ORDER 1e-15/.
+    #
+    # INPUT:
+    #   a_G,...,x_initial_condition : PARAMETERS USED IN TUMOR-
+    #                                 COMPUTATIONS.
+    #   initial_time : INTEGER. DEFAULTS TO 0. DAY ON WHICH THE
+    #                  SIMULATION BEGINS.
+    #   x_initial : NUMPY ARRAY. DEFAULTS TO 'None'. TUMOR SIZES
+    #               TO START FROM /e.g. A SNAPSHOT/.
+    #   rho_initial : NUMPY ARRAY.  DEFAULTS TO 'None'. DENSITY
+    #                 VALUES CORRESPONDING TO 'x_initial'.
+    #   iteration_options : DICTIONARY. DEFAULTS TO 'None'. KEY-
+    #                       WORD  ARGUMENTS  PASSED TO 'angulo.
+    #                       iterate_G' AND 'angulo.iterate_GLQ'
+    #                       /e.g. {'kernel': 'fused'}/.  ONLY THE
+    #                       KEYS IN 'ITERATION_OPTIONS' ARE ALLOWED.
+    #                       THEY ARE CHECKED AGAINST THE 'G' MODEL
+    #                       HERE AND AGAINST 'GLQ' BY 'advance'
+    #                       BEFORE ANY RADIOTHERAPY IS COMPUTED.
+
+    def __init__(self, a_G, b_G, k, m_G, alpha_G, x_initial_condition, initial_time=0, x_initial=None,
+                 rho_initial=None, iteration_options=None):
+        self.a_G = a_G
+        self.b_G = b_G
+        self.k = k
+        self.m_G = m_G
+        self.alpha_G = alpha_G
+        self.x_initial_condition = x_initial_condition
+        self.iteration_options = iteration_options or {}
+        self.check_options('G')
+        self.t = initial_time
+        if x_initial is None:
+            # INITIALIZING THE MESH WITH THE TUMOR BORN AT 'initial_time'
+            x_initial = iwata.x_max_G(x_initial_condition, np.array([initial_time]), a_G, b_G)
+            rho_initial = iwata.rho_at_x_t0(x_initial, initial_time)
+        self.x = x_initial
+        self.rho = rho_initial
+
+    @classmethod
+    def from_snapshot(cls, snapshot, iteration_options=None):
+        # CREATES A SIMULATION FROM  A SNAPSHOT  /SEE 'snapshot' AND
+        # 'angulo.preTherapySnapshot'/. THE SNAPSHOT IS NOT ALTERED.
+
+        return cls(a_G=snapshot['a_G'], b_G=snapshot['b_G'], k=snapshot['k'], m_G=snapshot['m_G'],
+                   alpha_G=snapshot['alpha_G'], x_initial_condition=snapshot['x_initial_condition'],
+                   initial_time=snapshot['time'], x_initial=snapshot['x'], rho_initial=snapshot['rho'],
+                   iteration_options=iteration_options)
+
+    def advance(self, days, D_LQ=None, alpha_LQ=None, beta_LQ=None):
+        # ADVANCES THE SIMULATION BY 'days'.  WITHOUT 'D_LQ' THE
+        # TUMORS GROW FOLLOWING GOMPERTZ /'angulo.iterate_G'/. IF
+        # 'D_LQ' IS GIVEN,  CONTINUOUS RADIOTHERAPY IS ADMINISTERED
+        # DURING THESE DAYS /'angulo.iterate_GLQ'/.
+        #
+        # INPUT:
+        #   days : INTEGER. NUMBER OF DAYS TO SIMULATE. ROUNDED TO
+        #          A WHOLE NUMBER OF TIME-STEPS.
+        #   D_LQ, alpha_LQ, beta_LQ : FLOATS. DEFAULT TO 'None'.
+        #                             RADIOTHERAPY PARAMETERS.
+        #
+        # OUTPUT:
+        #   simulation : SIMULATION. THE SIMULATION ITSELF.
+
+        iterations = round(days/self.k)
+        if iterations < 1:
+            return self
+
+        if D_LQ is not None:
+            self.check_options('GLQ')
+
+        if D_LQ is None:
+            self.x, self.rho = angulo.iterate_G(number_of_iterations=iterations, initial_time=self.t,
+                                                maximum_time=self.t + days, a_G=self.a_G, b_G=self.b_G, k=self.k,
+                                                m_G=self.m_G, alpha_G=self.alpha_G,
+                                                x_initial_condition=self.x_initial_condition, initialize=False,
+                                                x_initial=self.x, rho_initial=self.rho, **self.iteration_options)
+        else:
+            self.x, self.rho = angulo.iterate_GLQ(number_of_iterations=iterations, initial_time=self.t,
+                                                  maximum_time=self.t + days, a_G=self.a_G, b_G=self.b_G, k=self.k,
+                                                  m_G=self.m_G, D_LQ=D_LQ, alpha_G=self.alpha_G, alpha_LQ=alpha_LQ,
+                                                  beta_LQ=beta_LQ, x_initial_condition=self.x_initial_condition,
+                                                  initialize=False, x_initial=self.x, rho_initial=self.rho,
+                                                  **self.iteration_options)
+        self.t = self.t + (iterations*self.k)
+
+        return self
+
+    def apply_fractions(self, therapy_days, rest_days, therapy_sessions, D_LQ, alpha_LQ, beta_LQ):
+        # ADMINISTERS RADIOTHERAPY  IN  A SPECIFIC TIME INTERVAL AS
+        # IN  'angulo.iterate_G_with_Radiotherapy':  EACH SESSION
+        # SHRINKS ALL TUMORS  OVER  'therapy_days',  DELETES  THOSE
+        # BELOW SIZE '1' AND LETS THE REST GROW DURING 'rest_days'.
+        #
+        # INPUT:
+        #   therapy_days,...,beta_LQ : SEE FUNCTION 'angulo.ite-
+        #                              rate_G_with_Radiotherapy'.
+        #
+        # OUTPUT:
+        #   simulation : SIMULATION. THE SIMULATION ITSELF.
+
+        for session in range(therapy_sessions):
+            # COMPUTING TUMOR DECREASE DUE TO RADIOTHERAPY
+            radiotherapy_effect = enderling.x_max_LQ(x_init=self.x, t=therapy_days, D_LQ=D_LQ, alpha_LQ=alpha_LQ,
+                                                     beta_LQ=beta_LQ)
+            # DELETING METASTASIS BELOW THRESHOLD
+            self.x, self.rho = tools.deleteMetastasis(x_array=radiotherapy_effect, rho_array=self.rho, threshold=1)
+            self.t = self.t + therapy_days
+            # COMPUTING TUMOR INCREASE DURING RADIOTHERAPY REST
+            self.advance(rest_days)
+
+        return self
+
+    def check_options(self, model):
+        # CHECKS 'iteration_options' FOR THE GIVEN MODEL /'G' OR
+        # 'GLQ'/ AND RAISES A 'ValueError' IF THEY CANNOT BE PASSED
+        # TO THE CORRESPONDING 'angulo' FUNCTION.
+        #
+        # INPUT:
+        #   model : STRING. 'G' OR 'GLQ'.
+
+        unknown = sorted(set(self.iteration_options) - set(ITERATION_OPTIONS))
+        if unknown:
+            raise ValueError("'iteration_options' MUST BE AMONG " + str(ITERATION_OPTIONS) + ", NOT " + str(unknown) +
+                             ".")
+        angulo.checkKernel(model, self.iteration_options.get('kernel', 'standard'),
+                           self.iteration_options.get('passes'), self.iteration_options.get('threads'),
+                           self.iteration_options.get('scratch_directory'),
+                           self.iteration_options.get('step_control'))
+
+    def snapshot(self):
+        # RETURNS  THE CURRENT STATE  IN THE FORMAT OF  'angulo.pre-
+        # TherapySnapshot', SO THAT 'angulo.forkTherapy' AND 'from_
+        # snapshot' CAN CONTINUE IT.  THE ARRAYS ARE READ-ONLY COPIES,
+        # SO THE SIMULATION ITSELF STAYS WRITABLE.
+        #
+        # OUTPUT:
+        #   snapshot : DICTIONARY. CURRENT TIME, 'x', 'rho' AND THE
+        #              GOMPERTZ PARAMETERS.
+
+        x, rho = np.array(self.x), np.array(self.rho)
+        x.flags.writeable = False
+        rho.flags.writeable = False
+        snapshot = {'time': self.t, 'x': x, 'rho': rho, 'a_G': self.a_G, 'b_G': self.b_G, 'k': self.k,
+                    'm_G': self.m_G, 'alpha_G': self.alpha_G, 'x_initial_condition': self.x_initial_condition}
+
+        return snapshot
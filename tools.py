@@ -1,12 +1,15 @@
 
 
 # IMPORTING LIBRARIES
+from concurrent.futures import ProcessPoolExecutor
+import time
 import numpy as np
 import pandas as pd
 from scipy import integrate
 
 # IMPORTING FILES
 import angulo
+import iwata
 
 # SPLITTING ARRAY
 def splitShift(x, shift):
@@ -29,6 +32,60 @@ def splitShift(x, shift):
 
     return start_at_zero, start_at_shift
 
+# QUADRATURE WEIGHTS ON A NON-UNIFORM MESH
+def simpsonWeights(x):
+    # COMPUTES WEIGHTS 'w' SUCH THAT 'sum(w*f)' APPROXIMATES THE
+    # INTEGRAL OF 'f' OVER THE /NON-UNIFORM, POSSIBLY DECREASING/
+    # MESH 'x'. CONSECUTIVE PAIRS OF INTERVALS ARE INTEGRATED BY
+    # THE NON-UNIFORM SIMPSON RULE. IT IS EXACT FOR QUADRATICS AND,
+    # ON SMOOTHLY  VARYING  MESHES  /SUCH AS CHARACTERISTIC MESHES/,
+    # FOURTH ORDER IN THE MESH SPACING. IF THE NUM-
+    # BER OF INTERVALS IS ODD, THE LAST ONE USES THE QUADRATIC
+    # THROUGH ITS LAST THREE POINTS.  PANELS  CONTAINING REPEATED
+    # POINTS FALL BACK TO THE TRAPEZOID RULE.
+    #
+    # INPUT:
+    #   x : NUMPY ARRAY. MESH WITH AT LEAST TWO POINTS.
+    #
+    # OUTPUT:
+    #   weights : NUMPY ARRAY. QUADRATURE WEIGHTS.
+
+    weights = np.zeros(len(x))
+    intervals = len(x) - 1
+    if intervals == 1:
+        weights[:] = (x[1]-x[0])/2
+        return weights
+
+    # SIMPSON PANELS OVER INTERVALS (0,1), (2,3), ...
+    end = 2*(intervals//2)
+    h_0 = x[1:end:2] - x[0:end-1:2]
+    h_1 = x[2:end+1:2] - x[1:end:2]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        panel = (h_0+h_1)/6
+        w_left = panel*(2-(h_1/h_0))
+        w_middle = panel*((h_0+h_1)**2)/(h_0*h_1)
+        w_right = panel*(2-(h_0/h_1))
+    repeated = (h_0 == 0) | (h_1 == 0)
+    w_left[repeated] = h_0[repeated]/2
+    w_middle[repeated] = (h_0[repeated]+h_1[repeated])/2
+    w_right[repeated] = h_1[repeated]/2
+    weights[0:end-1:2] += w_left
+    weights[1:end:2] += w_middle
+    weights[2:end+1:2] += w_right
+
+    # LAST INTERVAL FOR AN ODD NUMBER OF INTERVALS
+    if intervals % 2:
+        h_0 = x[-2]-x[-3]
+        h_1 = x[-1]-x[-2]
+        if h_0 == 0 or h_1 == 0:
+            weights[-2:] += h_1/2
+        else:
+            weights[-3] -= (h_1**3)/(6*h_0*(h_0+h_1))
+            weights[-2] += h_1*(h_1+(3*h_0))/(6*h_0)
+            weights[-1] += h_1*((2*h_1)+(3*h_0))/(6*(h_0+h_1))
+
+    return weights
+
 # FUNCTION TO COMPUTE THE TIME IT TAKES TO REACH A GIVEN PRIMARY TUMOR SIZE
 def timeToGivenSize_G(primary_tumor_size, a_G, b_G):
     # BASED  ON  PIRMIN'S  ARTICLE:  'HOW MATHEMATICAL MODELING
@@ -122,7 +179,23 @@ def setDataInPlottingFormat(x_data, y_data, y_data_task, label_data=None):
     return plot_data_DF
 
 
-def findLargestMetastasis(x_data, rho_data, n_largest=None, export_filename=None):
+# EXPORTING LARGE ARRAYS
+def exportInChunks(x_data, rho_data, export_path, chunk_size=2**16):
+    # STORES 'x_data' AND 'rho_data' AS THE COLUMNS 'x' AND 'rho'
+    # OF A '.csv' FILE, WRITING 'chunk_size' ROWS AT A TIME. THE
+    # FILE IS IDENTICAL TO THAT OF A SINGLE 'DataFrame.to_csv', BUT
+    # MEMORY-MAPPED ARRAYS ARE NEVER LOADED AT ONCE.
+    #
+    # INPUT:
+    #   x_data, rho_data : NUMPY ARRAYS. COLUMNS TO BE STORED.
+    #   export_path : STRING. PATH OF THE '.csv' FILE.
+    #   chunk_size : INTEGER. DEFAULTS TO 2**16. ROWS PER WRITE.
+
+    for lo in range(0, max(len(x_data), 1), chunk_size):
+        chunk_DF = pd.DataFrame({'x': x_data[lo:lo+chunk_size], 'rho': rho_data[lo:lo+chunk_size]})
+        chunk_DF.to_csv(export_path, index=False, header=(lo == 0), mode='w' if lo == 0 else 'a')
+
+def findLargestMetastasis(x_data, rho_data, n_largest=None, export_filename=None, chunk_size=2**16):
     # FLIPS  RHO ARRAY BEFORE COMPUTING THE CUMULATIVE SUM, AND
     # FLOORS THE CUMULATIVE SUM ARRAY ELEMENTS. SPLITS ARRAY IN
     # TWO  PARTS WITH 1-SHIFT TO PERFORM FASTER COMPARISON, AND
@@ -143,6 +216,8 @@ def findLargestMetastasis(x_data, rho_data, n_largest=None, export_filename=None
     #   export_filename : STRING.  DEFAULTS TO 'None'. FILENAME
     #                     /WITHOUT  FILE-TYPE  APPENDIX/  UNDER
     #                     WHICH  THE  DATAFRAME WILL BE STORED.
+    #   chunk_size : INTEGER. DEFAULTS TO 2**16. NUMBER OF ENTRIES
+    #                READ AT ONCE /e.g. FROM 'numpy.memmap' ARRAYS/.
     #
     # HARD-CODED VARIABLES:
     #   export_path : STRING.PATH USED TO SAVE THE DATAFRAME AS
@@ -155,18 +230,33 @@ def findLargestMetastasis(x_data, rho_data, n_largest=None, export_filename=None
     #   export_filename.csv : CSV FILE.
     #                         STORED 'largest_metatasis_DF'.
 
-    flipped_rho = np.flip(rho_data)
-    cumulative_rho = np.floor(np.cumsum(flipped_rho))
-    # SPLITTING COMPUTED CUMULATIVE SUM TO OPTIMIZE ENTRY COMPARISON.
-    cum_rho_jmin1, cum_rho_j = splitShift(cumulative_rho, 1)
-    tumor_count_difference = cum_rho_j - cum_rho_jmin1
-    # NON-ZERO ENTRIES IN DIFFERENCE CORRESPOND TO INTEGER JUMPS BETWEEN ENTRIES IN RHO.
-    nonzero_tumor_count = list(np.nonzero(tumor_count_difference)[0])
-    # FLIPPING 'x_data' SO FOUND INDEXES CORRESPOND.
-    flipped_x = list(np.flip(x_data))
-    # CREATING OUTPUT LISTS
-    tumor_size = [flipped_x[idx+1] for idx in nonzero_tumor_count]
-    number_of_tumors = [cumulative_rho[idx+1] for idx in nonzero_tumor_count]
+    # STREAMING OVER CHUNKS OF THE FLIPPED ARRAYS SO THAT MEMORY-MAPPED
+    # DATA IS NEVER LOADED AT ONCE. THE CUMULATIVE SUM CARRIES OVER.
+    tumor_size = []
+    number_of_tumors = []
+    cumulative_rho_prev = 0.0
+    floor_prev = None
+    for stop in range(len(rho_data), 0, -chunk_size):
+        lo = max(stop-chunk_size, 0)
+        flipped_rho = np.flip(np.asarray(rho_data[lo:stop]))
+        cumulative_rho = np.cumsum(np.concatenate(([cumulative_rho_prev], flipped_rho)))[1:]
+        cumulative_rho_prev = cumulative_rho[-1]
+        cumulative_rho = np.floor(cumulative_rho)
+        if floor_prev is not None:
+            cumulative_rho = np.concatenate(([floor_prev], cumulative_rho))
+        floor_prev = cumulative_rho[-1]
+        # SPLITTING COMPUTED CUMULATIVE SUM TO OPTIMIZE ENTRY COMPARISON.
+        cum_rho_jmin1, cum_rho_j = splitShift(cumulative_rho, 1)
+        tumor_count_difference = cum_rho_j - cum_rho_jmin1
+        # NON-ZERO ENTRIES IN DIFFERENCE CORRESPOND TO INTEGER JUMPS BETWEEN ENTRIES IN RHO.
+        nonzero_tumor_count = np.nonzero(tumor_count_difference)[0]
+        # FLIPPING 'x_data' SO FOUND INDEXES CORRESPOND.
+        flipped_x = np.flip(np.asarray(x_data[lo:stop]))
+        if len(cumulative_rho) > len(flipped_x):
+            flipped_x = np.concatenate(([np.nan], flipped_x))
+        # EXTENDING OUTPUT LISTS
+        tumor_size.extend(flipped_x[idx+1] for idx in nonzero_tumor_count)
+        number_of_tumors.extend(cumulative_rho[idx+1] for idx in nonzero_tumor_count)
 
     # TRUNCATING IF NECESSARY
     if n_largest:
@@ -196,9 +286,9 @@ def findTimeWhenConcavityCahnges(initial_time_c, initial_maximum_time, a_G_c, b_
     # PERFORMS  THE  ITERATIVE  PROCESS  AS LONG AS THE MAXIMUM
     # NUMERICAL   DERIVATIVE   IS  BELOW  THE  GIVEN  THRESHOLD
     # /ARGUMENT 'threshold'/  AND  THE MAXIMUM NUMBER OF CYCLES
-    # HAS  NOT  BEEN  SURPASSED.  DURING  EACH  CYCLE, FUNCTION
-    # 'iterate_G'  IS CALLED TO COMPUTE 'x' AND 'rho' ACCORDING
-    # TO THE SPECIFIED PARAMETERS, THEN BUILT-IN NUMPY FUNCTION
+    # HAS  NOT  BEEN  SURPASSED.  DURING  EACH  CYCLE, 'x' AND
+    # 'rho'  ARE COMPUTED ACCORDING TO THE SPECIFIED PARAMETERS,
+    # THEN BUILT-IN NUMPY FUNCTION
     # 'gradient' IS USED TO COMPUTE THE DERIVATIVE OF THE 'rho'
     # VALUES.  MINIMA  AND MAXIMA ARE FOUND AND STORED IN THEIR
     # RESPECTIVE  LISTS ALONG WITH THE CORRESPONDING MAX. TIME.
@@ -206,6 +296,13 @@ def findTimeWhenConcavityCahnges(initial_time_c, initial_maximum_time, a_G_c, b_
     #     MESSAGE, NOTIFYING OF THE EVENT, IS PRINTED.
     #   + IF A 'filename' HAS BEEN PROVIDED, THE PRODUCED DATA-
     #     FRAME IS EXPORTED.
+    # INSTEAD  OF  RUNNING  'iterate_G'  ONCE PER CYCLE, CYCLES ARE
+    # GROUPED IN BLOCKS OF 1, 2, 4,... CYCLES,  AND EACH BLOCK IS
+    # COMPUTED IN A SINGLE RUN OF 'angulo.iterate_G_stream'.  THE
+    # INITIAL MESH  OF A RUN UNTIL A LATER TIME  EXTENDS  THAT OF
+    # AN EARLIER ONE BY ZERO-DENSITY POINTS, SO AFTER TRUNCATING
+    # THESE POINTS THE RESULTS AGREE UP TO ROUND-OFF /IN THE OR-
+    # DER OF SUMMATION/ WHEN 'initial_time_c' IS 0.
     #
     # INPUT:
     #   initial_time_c,...,x_initial_condition_c:  FUNCTION PA-
@@ -240,27 +337,35 @@ def findTimeWhenConcavityCahnges(initial_time_c, initial_maximum_time, a_G_c, b_
     # INITIALIZING CYCLE VARIABLES
     cycles_performed = 0
     max_numerical_derivative = -1
-    iterative_t_max = initial_maximum_time - step_increase
+    block_cycles = 1
 
     while max_numerical_derivative <= threshold and cycles_performed <= max_cycles:
-        # MAXIMUM TIME FOR COMPUTING 'rho' MUST BE ADJUSTED FOR EACH RUN OF THE CYCLE.
-        iterative_t_max += step_increase
-        cycles_performed += 1
-        iterations_c = round(iterative_t_max / k_days_c)
-        # COMPUTING 'x' AND 'rho'
-        x_c, rho_c = angulo.iterate_G(number_of_iterations=iterations_c, initial_time=initial_time_c,
-                                      maximum_time=iterative_t_max, a_G=a_G_c, b_G=b_G_c,
-                                      k=k_days_c, m_G=m_G_c, alpha_G=alpha_G_c,
-                                      x_initial_condition=x_initial_condition_c)
-        # COMPUTING THE NUMERICAL DERIVATIVE
-        gradient_array = np.gradient(rho_c, x_c)
-        # FINDING AND STORING DERIVATIVE MAXIMA AND MINIMA
-        max_numerical_derivative = max(gradient_array)
-        min_numerical_derivative = min(gradient_array)
-        max_num_derivative_list.append(max_numerical_derivative)
-        min_num_derivative_list.append(min_numerical_derivative)
-        # APPENDING THE CORRESPONDING MAXIMUM TIME
-        max_time_list.append(iterative_t_max)
+        # MAXIMUM TIMES OF THE CYCLES IN THIS BLOCK. THE BLOCK IS COMPUTED IN A SINGLE RUN UNTIL ITS LAST TIME.
+        block_t_max_list = [initial_maximum_time + (step_increase*(cycles_performed+cycle))
+                            for cycle in range(block_cycles)]
+        block_iterations_list = [round(iterative_t_max / k_days_c) for iterative_t_max in block_t_max_list]
+        stream = angulo.iterate_G_stream(number_of_iterations=block_iterations_list[-1], initial_time=initial_time_c,
+                                         maximum_time=block_t_max_list[-1], a_G=a_G_c, b_G=b_G_c, k=k_days_c,
+                                         m_G=m_G_c, alpha_G=alpha_G_c, x_initial_condition=x_initial_condition_c,
+                                         times=[initial_time_c + (iterations_c*k_days_c)
+                                                for iterations_c in block_iterations_list])
+        for iterative_t_max, iterations_c, (t_c, x_c, rho_c) in zip(block_t_max_list, block_iterations_list, stream):
+            cycles_performed += 1
+            # RESTRICTING 'x' AND 'rho' TO THE MESH OF A RUN UNTIL 'iterative_t_max'
+            mesh_size = (2*iterations_c) + 1
+            # COMPUTING THE NUMERICAL DERIVATIVE
+            gradient_array = np.gradient(rho_c[:mesh_size], x_c[:mesh_size])
+            # FINDING AND STORING DERIVATIVE MAXIMA AND MINIMA
+            max_numerical_derivative = max(gradient_array)
+            min_numerical_derivative = min(gradient_array)
+            max_num_derivative_list.append(max_numerical_derivative)
+            min_num_derivative_list.append(min_numerical_derivative)
+            # APPENDING THE CORRESPONDING MAXIMUM TIME
+            max_time_list.append(iterative_t_max)
+            if max_numerical_derivative > threshold or cycles_performed > max_cycles:
+                break
+        # DOUBLING THE NUMBER OF CYCLES COMPUTED IN THE NEXT RUN
+        block_cycles *= 2
 
     # LETTING USER KNOW THAT THE MAXIMUM NUMBER OF CYCLES WAS REACHED
     if cycles_performed >= max_cycles:
@@ -313,3 +418,604 @@ def deleteMetastasis(x_array, rho_array, threshold):
     truncated_rho = rho_array[truncation_idx:]
 
     return truncated_x, truncated_rho
+
+# COARSENING THE CHARACTERISTIC MESH
+def reduceMesh(x_array, rho_array, max_mesh_size):
+    # PERFORMS THE DIMENSIONAL REDUCTION OF THE ANGULO PAPERS.
+    # THE YOUNGEST  'max_mesh_size'/4  POINTS  /THOSE CLOSEST TO
+    # THE  BOUNDARY  WHERE NEW METASTASIS ARE BORN/ ARE KEPT AS
+    # THEY ARE. FROM THE REMAINING POINTS EVERY SECOND ONE IS
+    # DROPPED, ALWAYS KEEPING THE LAST ONE.  THE DENSITY OF THE
+    # COARSENED POINTS IS THEN RESCALED SO THAT THE TOTAL NUMBER
+    # OF  METASTASIS  /TRAPEZOID  INTEGRAL  OF 'rho' OVER 'x'/ IS
+    # CONSERVED.  THE DEVIATION INTRODUCED IS ESTIMATED FROM THE
+    # DIFFERENCE BETWEEN EACH DROPPED DENSITY VALUE AND THE LINE-
+    # AR INTERPOLATION OF ITS KEPT NEIGHBOURS.
+    #
+    # INPUT:
+    #   x_array : NUMPY ARRAY. TUMOR SIZES COMPUTED USING THE AN-
+    #             GULO ALGORITHM.
+    #   rho_array : NUMPY ARRAY. CORRESPONDING DENSITY VALUES.
+    #   max_mesh_size : INTEGER. NUMBER OF MESH POINTS ABOVE WHICH
+    #                   THE MESH IS REDUCED.
+    #
+    # OUTPUT:
+    #   reduced_x : NUMPY ARRAY. COARSENED TUMOR SIZES.
+    #   reduced_rho : NUMPY ARRAY.  CORRESPONDING DENSITY VALUES.
+    #   deviation : FLOAT. ESTIMATED  DEVIATION  RELATIVE TO THE
+    #               TOTAL NUMBER OF METASTASIS.
+
+    if max_mesh_size < angulo.MIN_MESH_SIZE:
+        raise ValueError("'max_mesh_size' MUST BE AT LEAST " + str(angulo.MIN_MESH_SIZE) + ".")
+    x_array = np.asarray(x_array)
+    rho_array = np.asarray(rho_array)
+    # SELECTING POINTS TO KEEP
+    keep_recent = max(max_mesh_size//4, 2)
+    keep = np.zeros(len(x_array), dtype=bool)
+    keep[:keep_recent] = True
+    keep[keep_recent::2] = True
+    keep[-1] = True
+    reduced_x = x_array[keep]
+    reduced_rho = rho_array[keep].copy()
+
+    # ESTIMATING THE DEVIATION FROM THE DROPPED POINTS
+    total_count = integrate.trapezoid(rho_array, x_array)
+    dropped = np.nonzero(~keep)[0]
+    x_left, x_right = x_array[dropped-1], x_array[dropped+1]
+    span = x_right-x_left
+    weight = np.divide(x_array[dropped]-x_left, span, out=np.full(len(span), 0.5), where=span != 0)
+    interpolated_rho = ((1-weight)*rho_array[dropped-1]) + (weight*rho_array[dropped+1])
+    dropped_error = np.sum(np.abs(rho_array[dropped]-interpolated_rho)*np.abs(span)/2)
+    deviation = float(dropped_error/abs(total_count)) if total_count != 0 else 0.0
+
+    # RESCALING COARSENED DENSITIES TO CONSERVE THE NUMBER OF METASTASIS
+    coarsened = np.zeros(len(reduced_x), dtype=bool)
+    coarsened[keep_recent:] = True
+    fixed_count = integrate.trapezoid(np.where(coarsened, 0, reduced_rho), reduced_x)
+    coarsened_count = integrate.trapezoid(np.where(coarsened, reduced_rho, 0), reduced_x)
+    if coarsened_count != 0:
+        reduced_rho[coarsened] *= (total_count-fixed_count)/coarsened_count
+
+    return reduced_x, reduced_rho, deviation
+
+# MERGING THE SATURATED TAIL OF THE MESH
+def compactSaturatedMesh(x_array, rho_array, relative_tolerance):
+    # UNDER GOMPERTZ GROWTH THE OLDEST POINTS OF THE MESH /THOSE
+    # AT ITS END/ CONVERGE TOWARDS 'b_G' AND BECOME NEARLY COIN-
+    # CIDENT.  THE SATURATED TAIL IS THE LONGEST RUN OF TRAILING
+    # POINTS WHOSE RELATIVE DISTANCE TO THEIR PREDECESSOR IS BE-
+    # LOW  'relative_tolerance'.  IT IS SPLIT INTO BINS OF RELA-
+    # TIVE WIDTH 'relative_tolerance' /IN 'log(x)'/  AND THE POINTS
+    # OF EACH BIN ARE MERGED INTO A SINGLE REPRESENTATIVE AT THEIR
+    # MEAN SIZE AND DENSITY.  AS IN 'reduceMesh', THE MERGED DEN-
+    # SITIES ARE THEN RESCALED SO THAT THE TOTAL NUMBER OF META-
+    # STASIS IS CONSERVED.  POINTS OUTSIDE THE TAIL ARE UNCHANGED.
+    #
+    # INPUT:
+    #   x_array : NUMPY ARRAY. TUMOR SIZES COMPUTED USING THE AN-
+    #             GULO ALGORITHM.
+    #   rho_array : NUMPY ARRAY. CORRESPONDING DENSITY VALUES.
+    #   relative_tolerance : FLOAT. RELATIVE DISTANCE BELOW WHICH
+    #                        POINTS ARE CONSIDERED COINCIDENT.
+    #
+    # OUTPUT:
+    #   compacted_x : NUMPY ARRAY. COMPACTED TUMOR SIZES.
+    #   compacted_rho : NUMPY ARRAY.  CORRESPONDING DENSITY VALUES.
+    #   points_removed : INTEGER. NUMBER OF MERGED-AWAY POINTS.
+
+    x_array = np.asarray(x_array)
+    rho_array = np.asarray(rho_array)
+    # FINDING THE SATURATED TAIL
+    coincident = np.abs(np.diff(x_array)) <= relative_tolerance*np.abs(x_array[1:])
+    separated = np.nonzero(~coincident)[0]
+    tail_start = separated[-1]+1 if len(separated) else 0
+    if len(x_array)-tail_start < 2:
+        return x_array, rho_array, 0
+
+    # MERGING THE POINTS OF EACH BIN
+    log_tail = np.log(x_array[tail_start:])
+    bins = np.floor((log_tail-log_tail[0])/np.log1p(relative_tolerance)).astype(np.int64)
+    bins = np.unique(bins, return_inverse=True)[1]
+    counts = np.bincount(bins)
+    representative_x = np.bincount(bins, weights=x_array[tail_start:])/counts
+    representative_rho = np.bincount(bins, weights=rho_array[tail_start:])/counts
+    compacted_x = np.concatenate((x_array[:tail_start], representative_x))
+    compacted_rho = np.concatenate((rho_array[:tail_start], representative_rho))
+
+    # RESCALING MERGED DENSITIES TO CONSERVE THE NUMBER OF METASTASIS
+    # /ONLY THE TAIL AND THE INTERVAL IN FRONT OF IT CHANGE/
+    segment_start = max(tail_start-1, 0)
+    segment_count = integrate.trapezoid(rho_array[segment_start:], x_array[segment_start:])
+    segment_x = compacted_x[segment_start:]
+    segment_rho = compacted_rho[segment_start:]
+    merged = np.arange(segment_start, len(compacted_x)) >= tail_start
+    fixed_count = integrate.trapezoid(np.where(merged, 0, segment_rho), segment_x)
+    merged_count = integrate.trapezoid(np.where(merged, segment_rho, 0), segment_x)
+    if merged_count != 0:
+        segment_rho[merged] *= (segment_count-fixed_count)/merged_count
+
+    return compacted_x, compacted_rho, len(x_array)-len(compacted_x)
+
+# PRUNING NEGLIGIBLE POINTS
+def pruneMesh(x_array, rho_array, size_threshold=None, relative_density=None, max_discarded_mass=np.inf):
+    # DROPS NEGLIGIBLE POINTS FROM THE MESH.  A POINT IS NEGLIGI-
+    # BLE IF ITS SIZE IS BELOW 'size_threshold' /e.g. TUMORS SHRUNK
+    # BELOW 1 CELL BY RADIOTHERAPY/ OR IF ITS DENSITY IS BELOW
+    # 'relative_density' TIMES THE LARGEST DENSITY OF THE MESH.
+    # CONSECUTIVE NEGLIGIBLE POINTS ARE REMOVED AS A WHOLE RUN. THE
+    # MASS DISCARDED BY A RUN IS THE CHANGE IN THE TRAPEZOID INTE-
+    # GRAL OF '|rho|' /THE NEIGHBOURS OF AN INTERIOR RUN BECOME AD-
+    # JACENT/. RUNS ARE REMOVED FROM THE CHEAPEST ONE ON WHILE THE
+    # TOTAL STAYS BELOW 'max_discarded_mass'. THE FIRST TWO POINTS
+    # /THE NEWBORN METASTASIS AND THE NEIGHBOUR USED BY THE BOUNDARY
+    # CONDITION/ ARE ALWAYS KEPT.
+    #
+    # INPUT:
+    #   x_array : NUMPY ARRAY. TUMOR SIZES COMPUTED USING THE AN-
+    #             GULO ALGORITHM.
+    #   rho_array : NUMPY ARRAY. CORRESPONDING DENSITY VALUES.
+    #   size_threshold : FLOAT. DEFAULTS TO 'None'. SIZE BELOW WHICH
+    #                    POINTS ARE NEGLIGIBLE.
+    #   relative_density : FLOAT. DEFAULTS TO 'None'. RELATIVE DEN-
+    #                      SITY BELOW WHICH POINTS ARE NEGLIGIBLE.
+    #   max_discarded_mass : FLOAT. DEFAULTS TO 'numpy.inf'. ABSO-
+    #                        LUTE NUMBER OF METASTASIS THAT MAY BE
+    #                        DISCARDED.
+    #
+    # OUTPUT:
+    #   pruned_x : NUMPY ARRAY. REMAINING TUMOR SIZES.
+    #   pruned_rho : NUMPY ARRAY.  CORRESPONDING DENSITY VALUES.
+    #   discarded_mass : FLOAT. NUMBER OF METASTASIS DISCARDED.
+
+    x_array = np.asarray(x_array)
+    rho_array = np.asarray(rho_array)
+    # FINDING RUNS OF NEGLIGIBLE POINTS
+    negligible = np.zeros(len(x_array), dtype=bool)
+    if size_threshold is not None:
+        negligible |= x_array < size_threshold
+    if relative_density is not None:
+        negligible |= np.abs(rho_array) <= relative_density*np.max(np.abs(rho_array))
+    negligible[:2] = False
+    if not np.any(negligible):
+        return x_array, rho_array, 0.0
+    edges = np.diff(np.concatenate(([0], negligible.view(np.int8), [0])))
+    run_starts = np.nonzero(edges == 1)[0]
+    run_ends = np.nonzero(edges == -1)[0]
+
+    # MASS DISCARDED BY EACH RUN
+    abs_rho = np.abs(rho_array)
+    interval_mass = np.abs(np.diff(x_array))*(abs_rho[:-1]+abs_rho[1:])/2
+    cumulative_mass = np.concatenate(([0.0], np.cumsum(interval_mass)))
+    left = run_starts-1
+    right = np.minimum(run_ends, len(x_array)-1)
+    interior = run_ends < len(x_array)
+    bridge_mass = np.where(interior, np.abs(x_array[right]-x_array[left])*(abs_rho[left]+abs_rho[right])/2, 0.0)
+    run_mass = np.abs(cumulative_mass[right]-cumulative_mass[left]-bridge_mass)
+
+    # REMOVING THE CHEAPEST RUNS WITHIN THE MASS CAP
+    order = np.argsort(run_mass, kind='stable')
+    accepted = np.zeros(len(run_mass), dtype=bool)
+    accepted[order[np.cumsum(run_mass[order]) <= max_discarded_mass]] = True
+    run_index = np.cumsum(edges[:-1] == 1)-1
+    remove = negligible & accepted[run_index]
+
+    return x_array[~remove], rho_array[~remove], float(np.sum(run_mass[accepted]))
+
+# COMPARING A REDUCED RUN AGAINST AN UNREDUCED ONE
+def meshReductionDeviation(x_reduced, rho_reduced, x_full, rho_full):
+    # MEASURES HOW FAR  A  RUN WITH DIMENSIONAL REDUCTION /PASS
+    # 'max_mesh_size' OF THE 'iterate' FUNCTIONS/ DEVIATES
+    # FROM  THE  CORRESPONDING  UNREDUCED  RUN. THE UNREDUCED DEN-
+    # SITY  IS  INTERPOLATED  ONTO THE REDUCED MESH AND THE L1 DIF-
+    # FERENCE IS TAKEN RELATIVE TO THE UNREDUCED NUMBER OF META-
+    # STASIS.
+    #
+    # INPUT:
+    #   x_reduced, rho_reduced : NUMPY ARRAYS.  OUTPUT OF THE RE-
+    #                            DUCED RUN.
+    #   x_full, rho_full : NUMPY ARRAYS.  OUTPUT  OF THE UNREDUCED
+    #                      RUN.
+    #
+    # OUTPUT:
+    #   count_deviation : FLOAT. RELATIVE DIFFERENCE IN THE TOTAL
+    #                     NUMBER OF METASTASIS.
+    #   density_deviation : FLOAT. RELATIVE L1 DIFFERENCE OF THE
+    #                       DENSITIES.
+
+    # SORTING MESHES SO THAT THEY CAN BE INTERPOLATED
+    full_order = np.argsort(x_full)
+    reduced_order = np.argsort(x_reduced)
+    x_full, rho_full = np.asarray(x_full)[full_order], np.asarray(rho_full)[full_order]
+    x_reduced, rho_reduced = np.asarray(x_reduced)[reduced_order], np.asarray(rho_reduced)[reduced_order]
+
+    # COMPUTING DEVIATIONS
+    full_count = integrate.trapezoid(rho_full, x_full)
+    reduced_count = integrate.trapezoid(rho_reduced, x_reduced)
+    count_deviation = float(abs(reduced_count-full_count)/abs(full_count))
+    interpolated_rho = np.interp(x_reduced, x_full, rho_full)
+    density_deviation = float(integrate.trapezoid(np.abs(rho_reduced-interpolated_rho), x_reduced)/abs(full_count))
+
+    return count_deviation, density_deviation
+
+# ACCURACY AND COST OF THE NUMERICAL SOLVER AGAINST IWATA'S SOLUTION
+def compareWithAnalytic(maximum_time, a_G, b_G, k_list, m_G, alpha_G, x_initial_condition, export_filename=None):
+    # RUNS  'angulo.iterate_G'  UNTIL 'maximum_time' FOR EACH STEP
+    # SIZE IN 'k_list' AND COMPARES THE RESULT WITH 'iwata.rho_-
+    # analytic' EVALUATED ON THE SAME MESH.  THE BIRTH RATE /SEE
+    # 'iwata.birthRate'/ IS SOLVED AND CACHED BEFORE THE TIMINGS,
+    # SO THE ANALYTIC TIMING ONLY MEASURES THE QUERY.
+    #
+    # INPUT:
+    #   maximum_time : INTEGER. TIME AT WHICH BOTH ARE COMPARED.
+    #   a_G, b_G : FLOATS. GOMPERTZ PARAMETERS.
+    #   k_list : LIST. STEP SIZES OF THE NUMERICAL SOLVER.
+    #   m_G,...,x_initial_condition : PARAMETERS USED IN TUMOR-
+    #                                 COMPUTATIONS.
+    #   export_filename : STRING. DEFAULTS TO 'None'. FILENAME UN-
+    #                     DER WHICH THE TABLE IS STORED.
+    #
+    # OUTPUT:
+    #   comparison_DF : DATAFRAME. ONE ROW PER STEP SIZE WITH THE
+    #                   RUNTIMES, THE LARGEST AND MEDIAN RELATIVE
+    #                   DENSITY ERROR AND THE RELATIVE ERROR OF THE
+    #                   NUMBER OF METASTASIS.
+
+    rows = []
+    analytic_count = float(iwata.N_analytic(maximum_time, x_initial_condition, a_G, b_G, m_G, alpha_G))
+    for k in k_list:
+        # NUMERICAL SOLUTION
+        start = time.perf_counter()
+        x_G, rho_G = angulo.iterate_G(number_of_iterations=round(maximum_time/k), initial_time=0,
+                                      maximum_time=maximum_time, a_G=a_G, b_G=b_G, k=k, m_G=m_G, alpha_G=alpha_G,
+                                      x_initial_condition=x_initial_condition)
+        numerical_time = time.perf_counter() - start
+        # ANALYTIC SOLUTION ON THE SAME MESH
+        start = time.perf_counter()
+        rho_analytic = iwata.rho_analytic(x_G, maximum_time, x_initial_condition, a_G, b_G, m_G, alpha_G)
+        analytic_time = time.perf_counter() - start
+        # COMPARING
+        alive = rho_G > 0
+        relative_error = np.abs(rho_G[alive]-rho_analytic[alive])/rho_analytic[alive]
+        numerical_count = abs(integrate.trapezoid(rho_G, x_G))
+        rows.append({'k': k, 'NUMERICAL TIME': numerical_time, 'ANALYTIC TIME': analytic_time,
+                     'MAX RELATIVE ERROR': np.max(relative_error), 'MEDIAN RELATIVE ERROR': np.median(relative_error),
+                     'COUNT ERROR': abs(numerical_count-analytic_count)/analytic_count})
+    comparison_DF = pd.DataFrame(rows)
+
+    # EXPORTING
+    if export_filename:
+        export_path = '/Users/victor/Documents/TUM/Thesis/Output/' + export_filename + '.csv'
+        comparison_DF.to_csv(export_path, index=False)
+
+    return comparison_DF
+
+# OBSERVED CONVERGENCE ORDER OF THE ITERATIONS
+def convergenceOrder(maximum_time, a_G, b_G, k_list, m_G, alpha_G, x_initial_condition, h=0.03125,
+                     export_filename=None):
+    # RUNS  'angulo.iterate_G'  UNTIL 'maximum_time'  FOR EACH STEP
+    # SIZE IN 'k_list', ONCE WITH THE STANDARD ITERATIONS AND ONCE
+    # WITH THE 'high_order' KERNEL, AND MEASURES THE LARGEST RELA-
+    # TIVE ERROR AGAINST 'iwata.rho_analytic'. THE OBSERVED ORDER BETWEEN
+    # CONSECUTIVE STEP SIZES IS
+    #       log(error_prev/error)/log(k_prev/k).
+    # THE STANDARD ITERATIONS ARE SECOND ORDER, THE HIGH-ORDER ONES
+    # APPROACH FOURTH ORDER UNTIL THE ERROR OF THE ANALYTIC REFE-
+    # RENCE /CONTROLLED BY 'h'/ IS REACHED.
+    #
+    # INPUT:
+    #   maximum_time,...,x_initial_condition : SEE FUNCTION 'compare-
+    #                                          WithAnalytic'.
+    #   h : FLOAT. DEFAULTS TO 0.03125. STEP SIZE OF THE ANALYTIC
+    #       REFERENCE /SEE 'iwata.birthRate'/.
+    #   export_filename : STRING. DEFAULTS TO 'None'. FILENAME UN-
+    #                     DER WHICH THE TABLE IS STORED.
+    #
+    # OUTPUT:
+    #   order_DF : DATAFRAME. ONE ROW PER SCHEME AND STEP SIZE WITH
+    #              THE RUNTIME, THE LARGEST RELATIVE DENSITY ERROR
+    #              AND THE OBSERVED ORDER.
+
+    rows = []
+    for kernel in ('standard', 'high_order'):
+        k_prev = error_prev = None
+        for k in sorted(k_list, reverse=True):
+            # NUMERICAL SOLUTION
+            start = time.perf_counter()
+            x_G, rho_G = angulo.iterate_G(number_of_iterations=round(maximum_time/k), initial_time=0,
+                                          maximum_time=maximum_time, a_G=a_G, b_G=b_G, k=k, m_G=m_G,
+                                          alpha_G=alpha_G, x_initial_condition=x_initial_condition,
+                                          kernel=kernel)
+            numerical_time = time.perf_counter() - start
+            # ANALYTIC SOLUTION ON THE SAME MESH
+            rho_analytic = iwata.rho_analytic(x_G, maximum_time, x_initial_condition, a_G, b_G, m_G, alpha_G, h=h)
+            alive = rho_G > 0
+            error = np.max(np.abs(rho_G[alive]-rho_analytic[alive])/rho_analytic[alive])
+            order = np.log(error_prev/error)/np.log(k_prev/k) if k_prev is not None else np.nan
+            rows.append({'SCHEME': kernel.replace('_', ' ').upper(), 'k': k, 'NUMERICAL TIME': numerical_time,
+                         'MAX RELATIVE ERROR': error, 'OBSERVED ORDER': order})
+            k_prev, error_prev = k, error
+    order_DF = pd.DataFrame(rows)
+
+    # EXPORTING
+    if export_filename:
+        export_path = '/Users/victor/Documents/TUM/Thesis/Output/' + export_filename + '.csv'
+        order_DF.to_csv(export_path, index=False)
+
+    return order_DF
+
+# AGREEMENT AND COST OF THE ITERATION KERNELS
+def compareKernels(model, parameter_list, kernels, reference='standard', tolerance=None, export_filename=None):
+    # RUNS  'angulo.iterate_G',  'angulo.iterate_GLQ'  OR  'angulo.
+    # iterate_LQ' ONCE WITH THE 'reference' KERNEL AND ONCE WITH EACH
+    # KERNEL IN 'kernels' FOR EACH PARAMETER SET, AND MEASURES THE
+    # LARGEST RELATIVE DIFFERENCE OF 'x' AND 'rho' /OVER THE POINTS
+    # WHERE THE REFERENCE IS A NORMAL FLOAT:  ZEROS AND SUBNORMAL
+    # VALUES CARRY NO RELATIVE PRECISION/.  THE CLAIMS OF THE KERNELS
+    # ARE CHECKED WITH e.g.
+    #   - compareKernels('LQ', ..., ['scaled'])  /'iterateScaled_LQ'
+    #     AGREES WITH THE REGULAR ITERATION UP TO ROUNDING/.
+    #   - compareKernels(..., ['numba'], reference='fused', toleran-
+    #     ce=compiled.TOLERANCE). WITHOUT NUMBA THE 'numba' KERNEL IS
+    #     THE FUSED ONE /SEE 'angulo.numbaAvailable'/, AND THE FIRST
+    #     CALL INCLUDES THE COMPILATION.
+    #
+    # INPUT:
+    #   model : STRING. 'G', 'GLQ' OR 'LQ'.
+    #   parameter_list : LIST. DICTIONARIES OF KEYWORD ARGUMENTS OF
+    #                    THE 'iterate' FUNCTION OF 'model' /e.g. 'num-
+    #                    ber_of_iterations', 'k', 'D_LQ'/.
+    #   kernels : LIST. KERNELS COMPARED /SEE 'angulo.KERNELS'/.
+    #   reference : STRING. DEFAULTS TO 'standard'. KERNEL OF THE
+    #               REFERENCE RUN.
+    #   tolerance : FLOAT. DEFAULTS TO 'None'. IF GIVEN, THE TABLE
+    #               TELLS WHETHER BOTH DIFFERENCES ARE BELOW IT.
+    #   export_filename : STRING. DEFAULTS TO 'None'. FILENAME UN-
+    #                     DER WHICH THE TABLE IS STORED.
+    #
+    # OUTPUT:
+    #   comparison_DF : DATAFRAME. ONE ROW PER PARAMETER SET AND
+    #                   KERNEL WITH THE PARAMETERS, THE RUNTIMES,
+    #                   THE SPEEDUP AND THE LARGEST RELATIVE DIFFE-
+    #                   RENCES OF 'x' AND 'rho'.
+
+    iterate = {'G': angulo.iterate_G, 'GLQ': angulo.iterate_GLQ, 'LQ': angulo.iterate_LQ}[model]
+
+    def maxRelativeDifference(values, reference_values):
+        normal = np.abs(reference_values) >= np.finfo(float).tiny
+        return float(np.max(np.abs(values[normal]-reference_values[normal])/np.abs(reference_values[normal]),
+                            initial=0.0))
+
+    rows = []
+    for parameters in parameter_list:
+        # REFERENCE RUN
+        start = time.perf_counter()
+        x_reference, rho_reference = iterate(kernel=reference, **parameters)
+        reference_time = time.perf_counter() - start
+        for kernel in kernels:
+            # KERNEL RUN
+            start = time.perf_counter()
+            x_kernel, rho_kernel = iterate(kernel=kernel, **parameters)
+            kernel_time = time.perf_counter() - start
+            # COMPARING
+            row = dict(parameters, KERNEL=kernel)
+            row.update({'REFERENCE TIME': reference_time, 'KERNEL TIME': kernel_time,
+                        'SPEEDUP': reference_time/kernel_time,
+                        'MAX RELATIVE DIFFERENCE x': maxRelativeDifference(x_kernel, x_reference),
+                        'MAX RELATIVE DIFFERENCE rho': maxRelativeDifference(rho_kernel, rho_reference)})
+            if tolerance is not None:
+                row['WITHIN TOLERANCE'] = max(row['MAX RELATIVE DIFFERENCE x'],
+                                              row['MAX RELATIVE DIFFERENCE rho']) <= tolerance
+            rows.append(row)
+    comparison_DF = pd.DataFrame(rows)
+
+    # EXPORTING
+    if export_filename:
+        export_path = '/Users/victor/Documents/TUM/Thesis/Output/' + export_filename + '.csv'
+        comparison_DF.to_csv(export_path, index=False)
+
+    return comparison_DF
+
+# DISTANCE OF A RUN TO THE LONG-TIME DENSITY
+def asymptoticDeviation(x_array, rho_array, x_init, a_G, b_G, m_G, alpha_G, rate=None):
+    # MEASURES HOW CLOSE THE NORMALIZED DENSITY  OF A FINITE-TIME
+    # RUN IS TO ITS LONG-TIME LIMIT  /SEE 'iwata.rho_asymptotic'/.
+    # THE DEVIATION IS THE L1 DISTANCE BETWEEN BOTH PROBABILITY
+    # DENSITIES:  THE  INTEGRAL OVER THE MESH PLUS THE MASS THAT
+    # THE LIMIT PUTS ABOVE THE LARGEST MESH SIZE. IT LIES IN /0,2/.
+    #
+    # INPUT:
+    #   x_array, rho_array : NUMPY ARRAYS.  OUTPUT  OF  'angulo.
+    #                        iterate_G'.
+    #   x_init,...,alpha_G : FLOATS. MODEL PARAMETERS.
+    #   rate : FLOAT. DEFAULTS TO 'None'. SEE FUNCTION 'iwata.rho_
+    #          asymptotic'.
+    #
+    # OUTPUT:
+    #   deviation : FLOAT. L1 DISTANCE TO THE LONG-TIME DENSITY.
+
+    if rate is None:
+        rate = iwata.malthusianRate(x_init, a_G, b_G, m_G, alpha_G)
+    order = np.argsort(x_array)
+    x_array, rho_array = np.asarray(x_array)[order], np.asarray(rho_array)[order]
+    normalized_rho = rho_array/integrate.trapezoid(rho_array, x_array)
+    phi = iwata.rho_asymptotic(x_array, x_init, a_G, b_G, m_G, alpha_G, rate)
+    # MASS OF THE LIMIT ABOVE THE MESH /i.e. OF METASTASES OLDER THAN THE LARGEST ONE/
+    missing_mass = np.exp(-rate*iwata.t_from_x_G(x_array[-1], x_init, a_G, b_G))
+    deviation = float(integrate.trapezoid(np.abs(normalized_rho-phi), x_array) + missing_mass)
+
+    return deviation
+
+# TIME AFTER WHICH THE DENSITY IS CLOSE TO ITS LONG-TIME LIMIT
+def timeToAsymptote(tolerance, x_init, a_G, b_G, m_G, alpha_G, max_time=2**16, rate=None):
+    # FINDS  THE  FIRST DAY ON WHICH THE DEVIATION  /SEE 'asympto-
+    # ticDeviation'/ OF THE EXACT DENSITY FALLS BELOW 'tolerance',
+    # WITHOUT MARCHING ANY MESH.  IN TERMS OF AGES 'u', THE NORMA-
+    # LIZED DENSITY IS 'B(t-u)/N(t)' AND THE LIMIT 'lambda*exp(-lam-
+    # bda*u)', SO THE DEVIATION AT 't' IS
+    #       INTEGRAL_0^t |B(t-u)/N(t) - lambda*exp(-lambda*u)| du
+    #       + exp(-lambda*t)
+    # WHICH ONLY NEEDS THE CACHED BIRTH RATE /'iwata.birthRate'/.
+    #
+    # INPUT:
+    #   tolerance : FLOAT. LARGEST ACCEPTED DEVIATION.
+    #   x_init,...,alpha_G : FLOATS. MODEL PARAMETERS.
+    #   max_time : INTEGER. DEFAULTS TO 2**16. LAST DAY SEARCHED.
+    #   rate : FLOAT. DEFAULTS TO 'None'. SEE FUNCTION 'iwata.rho_
+    #          asymptotic'.
+    #
+    # OUTPUT:
+    #   time : INTEGER. FIRST DAY WITH A SMALLER DEVIATION. 'None'
+    #          IF IT IS NOT REACHED BY 'max_time'.
+    #   deviation : FLOAT. DEVIATION ON THAT DAY /OR ON 'max_time'/.
+
+    if rate is None:
+        rate = iwata.malthusianRate(x_init, a_G, b_G, m_G, alpha_G)
+    grid, birth_rate, births = iwata.birthRateFor(max_time, x_init, a_G, b_G, m_G, alpha_G)
+    h = grid[1]-grid[0]
+
+    def deviation(day):
+        n = int(round(day/h))
+        ages = grid[:n+1]
+        normalized_births = birth_rate[n::-1]/births[n]
+        return float(integrate.trapezoid(np.abs(normalized_births - (rate*np.exp(-rate*ages))), ages) +
+                     np.exp(-rate*day))
+
+    # DOUBLING THE SEARCH INTERVAL
+    lower, upper = 0, 1
+    while deviation(upper) >= tolerance:
+        if upper >= max_time:
+            return None, deviation(max_time)
+        lower, upper = upper, min(2*upper, max_time)
+    # BISECTION OVER DAYS
+    while upper - lower > 1:
+        middle = (lower+upper)//2
+        if deviation(middle) < tolerance:
+            upper = middle
+        else:
+            lower = middle
+
+    return upper, deviation(upper)
+
+# RUNNING INDEPENDENT SCENARIOS IN PARALLEL
+def runScenarios(scenario_list, workers=None):
+    # RUNS  INDEPENDENT  SCENARIOS  /e.g. CALLS TO 'angulo.ite-
+    # rate_G'  OR  'angulo.iterate_G_with_Radiotherapy'/ CONCUR-
+    # RENTLY  IN A POOL OF PROCESSES.  RESULTS ARE RETURNED IN THE
+    # SAME  ORDER  AS  THE SCENARIOS, REGARDLESS OF WHICH ONE FIN-
+    # ISHES FIRST.  SINCE EACH SCENARIO RUNS THE SAME CODE AS IN A
+    # SERIAL RUN, RESULTS ARE IDENTICAL. A SCENARIO THAT RAISES AN
+    # EXCEPTION DOES NOT ABORT THE OTHERS: A MESSAGE IS PRINTED
+    # AND THE EXCEPTION IS RETURNED IN PLACE OF ITS RESULT.
+    #
+    # NOTE: SCRIPTS CALLING THIS FUNCTION MUST PROTECT THEIR EN-
+    # TRY POINT WITH  "if __name__ == '__main__':"  SINCE WORKER
+    # PROCESSES MAY RE-IMPORT THEM.
+    #
+    # INPUT:
+    #   scenario_list : LIST. CONTAINS TUPLES /function, arguments/
+    #                   WHERE 'function' IS A MODULE LEVEL FUNCTION
+    #                   AND 'arguments' A DICTIONARY OF KEYWORD AR-
+    #                   GUMENTS.
+    #   workers : INTEGER. DEFAULTS TO 'None'  /ONE  PROCESS  PER
+    #             CPU/.  NUMBER OF WORKER PROCESSES.  IF SET TO 1,
+    #             SCENARIOS ARE RUN SERIALLY IN THE CURRENT PROCESS.
+    #
+    # OUTPUT:
+    #   results : LIST. RETURN VALUE /OR RAISED EXCEPTION/ OF EACH
+    #             SCENARIO.
+
+    results = [None]*len(scenario_list)
+
+    # RUNNING SERIALLY
+    if workers == 1:
+        for idx, (function, arguments) in enumerate(scenario_list):
+            try:
+                results[idx] = function(**arguments)
+            except Exception as error:
+                print('SCENARIO ' + str(idx) + ' FAILED: ' + repr(error))
+                results[idx] = error
+        return results
+
+    # RUNNING IN A POOL OF PROCESSES
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(function, **arguments) for function, arguments in scenario_list]
+        for idx, future in enumerate(futures):
+            try:
+                results[idx] = future.result()
+            except Exception as error:
+                print('SCENARIO ' + str(idx) + ' FAILED: ' + repr(error))
+                results[idx] = error
+
+    return results
+
+# SPEEDUP OF THE PARALLEL-IN-TIME DRIVER
+def pararealSpeedup(schedule, initial_time, total_time, a_G, b_G, k, k_coarse, m_G, alpha_G, alpha_LQ, beta_LQ,
+                    x_initial_condition, workers_list, slices_list=None, tolerance=1e-6, export_filename=None):
+    # RUNS  'angulo.iterate_G_with_Schedule'  ONCE  AND  'angulo.
+    # iterate_G_parareal'  ONCE PER  PAIR  OF  ENTRIES  OF  'wor-
+    # kers_list' AND 'slices_list', AND COMPARES RUNTIMES AND RE-
+    # SULTS.  THE MEASURED SPEEDUP CAN NOT EXCEED THE NUMBER OF
+    # CPUS. THE IDEAL SPEEDUP ASSUMES ONE CPU PER SLICE: ITS TIME IS
+    # THE TIME SPENT OUTSIDE THE FINE SLICES PLUS THE SLOWEST FINE
+    # SLICE OF EACH ITERATION /SEE THE 'report' OF 'angulo.iterate_
+    # G_parareal'/, SO IT CAN BE MEASURED WITH 'workers_list=[1]'.
+    #
+    # NOTE: SCRIPTS CALLING THIS FUNCTION MUST PROTECT THEIR EN-
+    # TRY POINT  AS FOR 'runScenarios'.
+    #
+    # INPUT:
+    #   schedule,...,x_initial_condition : SEE FUNCTION 'angulo.
+    #                                      iterate_G_parareal'.
+    #   workers_list : LIST. NUMBERS OF WORKER PROCESSES.
+    #   slices_list : LIST. DEFAULTS TO 'None' /AS MANY SLICES AS
+    #                 WORKERS/. NUMBERS OF TIME SLICES.
+    #   tolerance : FLOAT. DEFAULTS TO 1e-6. SEE FUNCTION 'angulo.
+    #               iterate_G_parareal'.
+    #   export_filename : STRING. DEFAULTS TO 'None'. FILENAME UN-
+    #                     DER WHICH THE TABLE IS STORED.
+    #
+    # OUTPUT:
+    #   speedup_DF : DATAFRAME. ONE ROW PER NUMBER OF WORKERS AND
+    #                OF SLICES WITH THE NUMBER OF ITERATIONS, THE
+    #                RUNTIMES, THE MEASURED AND IDEAL SPEEDUPS, THE
+    #                LARGEST DEVIATION FROM THE SERIAL DENSITY RELA-
+    #                TIVE TO ITS MAXIMUM /IF BOTH MESHES MATCH/ AND
+    #                THE RELATIVE DEVIATION OF THE NUMBER OF META-
+    #                STASIS.
+
+    # SERIAL RUN
+    start = time.perf_counter()
+    x_serial, rho_serial = angulo.iterate_G_with_Schedule(schedule, initial_time, total_time, a_G, b_G, k, m_G,
+                                                          alpha_G, alpha_LQ, beta_LQ, x_initial_condition)
+    serial_time = time.perf_counter() - start
+    serial_count = integrate.trapezoid(rho_serial, x_serial)
+
+    rows = []
+    for workers in workers_list:
+        for slices in (slices_list or [workers]):
+            # PARAREAL RUN
+            report = {}
+            start = time.perf_counter()
+            x_parareal, rho_parareal = angulo.iterate_G_parareal(schedule, initial_time, total_time, a_G, b_G, k,
+                                                                 k_coarse, m_G, alpha_G, alpha_LQ, beta_LQ,
+                                                                 x_initial_condition, slices=slices, workers=workers,
+                                                                 tolerance=tolerance, report=report)
+            parareal_time = time.perf_counter() - start
+            ideal_time = report['sequential_time'] + sum(max(fine_times) for fine_times in report['fine_times'])
+            # COMPARING /THE MESHES DIFFER IF ANOTHER NUMBER OF METASTASIS WAS DELETED/
+            count_deviation = abs(integrate.trapezoid(rho_parareal, x_parareal)/serial_count - 1)
+            density_deviation = np.nan
+            if len(rho_parareal) == len(rho_serial):
+                density_deviation = np.max(np.abs(rho_parareal-rho_serial))/np.max(np.abs(rho_serial))
+            rows.append({'WORKERS': workers, 'SLICES': len(report['boundaries'])-1, 'ITERATIONS': report['iterations'],
+                         'SERIAL TIME': serial_time, 'PARAREAL TIME': parareal_time,
+                         'SPEEDUP': serial_time/parareal_time, 'IDEAL SPEEDUP': serial_time/ideal_time,
+                         'DENSITY DEVIATION': density_deviation, 'COUNT DEVIATION': count_deviation})
+    speedup_DF = pd.DataFrame(rows)
+
+    # EXPORTING
+    if export_filename:
+        export_path = '/Users/victor/Documents/TUM/Thesis/Output/' + export_filename + '.csv'
+        speedup_DF.to_csv(export_path, index=False)
+
+    return speedup_DF
@@ -7,6 +7,7 @@ import pandas as pd
 # IMPORTING FILES
 import iwata
 import enderling
+import schedule
 
 
 # PRIMARY TUMOR SIZE /NO RADIOTHERAPY/
@@ -84,58 +85,87 @@ def primaryTumorWithRadiotherapy(therapy_type, time_at_therapy_start, therapy_da
     #   export_filename : STRING. FILENAME UNDER WHICH COMPUTED
     #                     DATA WILL BE STORED AS A '.csv' FILE.
 
+    # TRANSLATING THE THERAPY TYPE INTO A SCHEDULE
+    therapy_schedule = schedule.FractionationSchedule.fromTherapyType(therapy_type, time_at_therapy_start,
+                                                                      therapy_days, rest_days, therapy_sessions,
+                                                                      total_time, D_LQ)
+    time_elapsed = total_time
+    if therapy_type == 'interval':
+        time_elapsed = time_at_therapy_start + ((therapy_days+rest_days)*therapy_sessions)
+
+    # COMPUTING TUMOR SIZES UNTIL THE END OF THE THERAPY
+    untreated_time_intervals, untreated_tumor_sizes, therapy_time_intervals, therapy_tumor_sizes = \
+        primaryTumorWithSchedule(schedule=therapy_schedule, initial_time=initial_time, total_time=time_elapsed,
+                                 a_G=a_G, b_G=b_G, alpha_LQ=alpha_LQ, beta_LQ=beta_LQ,
+                                 x_initial_condition=x_initial_condition)
+
+    # COMPUTING TUMOR SIZES AFTER INTERVAL THERAPY
+    if therapy_type == 'interval':
+        remaining_time = np.array(range(0, total_time-time_elapsed+1))
+        after_therapy_tumor_size = iwata.x_max_G(x_init=untreated_tumor_sizes[-1], t=remaining_time, a_G=a_G,
+                                                 b_G=b_G)
+        # STORING COMPUTATIONS ACCORDINGLY
+        untreated_time_intervals.extend(remaining_time+time_elapsed)
+        untreated_tumor_sizes.extend(after_therapy_tumor_size)
+
+    # EXPORTING
+    if export_filename:
+        max_tumor_DF = pd.DataFrame({'UNTREATED TIME': untreated_time_intervals,
+                                     'x(t) UNTREATED': untreated_tumor_sizes,
+                                     'THERAPY TIME': therapy_time_intervals,
+                                     'x(t) THERAPY': therapy_tumor_sizes})
+        export_path = '/Users/victor/Documents/TUM/Thesis/Output/' + export_filename + '.csv'
+        max_tumor_DF.to_csv(export_path, index=False)
+
+    return untreated_time_intervals, untreated_tumor_sizes, therapy_time_intervals, therapy_tumor_sizes
+
+# PRIMARY TUMOR SIZE /FRACTIONATION SCHEDULE/
+def primaryTumorWithSchedule(schedule, initial_time, total_time, a_G, b_G, alpha_LQ, beta_LQ, x_initial_condition,
+                             export_filename=None):
+    # COMPUTES PRIMARY TUMOR SIZE ON EACH DAY WHEN RADIOTHERAPY
+    # FOLLOWS 'schedule' /SEE 'schedule.FractionationSchedule'/.
+    # DURING FRACTIONS AND PHASES  THE  TUMOR SHRINKS FOLLOWING
+    # 'enderling.x_max_LQ',  BETWEEN THEM IT GROWS FOLLOWING 'iwa-
+    # ta.x_max_G'.  EACH SEGMENT STARTS FROM THE LAST SIZE OF THE
+    # PREVIOUS ONE, HENCE THE DAY ON WHICH TWO SEGMENTS MEET IS
+    # STORED IN BOTH. AS IN 'primaryTumor' THE TUMOR IS BORN ON
+    # DAY 0, SO GROWTH BEFORE THE FIRST EVENT IS EVALUATED AT AB-
+    # SOLUTE TIME; LATER SEGMENTS USE TIME SINCE THEIR OWN START.
+    #
+    # INPUT:
+    #   schedule : FRACTIONATIONSCHEDULE. RADIOTHERAPY EVENTS.
+    #   initial_time : INTEGER.  DAY  ON  WHICH  THE SIMULATION
+    #                  BEGINS
+    #   total_time : INTEGER. DAY ON WHICH THE SIMULATION ENDS.
+    #   a_G,...,x_initial_condition : PARAMETERS.
+    #   export_filename : STRING. FILENAME UNDER WHICH COMPUTED
+    #                     DATA WILL BE STORED AS A '.csv' FILE.
+    #
+    # OUTPUT:
+    #   SEE FUNCTION 'primaryTumorWithRadiotherapy'.
+
     # INITIALIZING LISTS
     therapy_time_intervals = []
     therapy_tumor_sizes = []
     untreated_time_intervals = []
     untreated_tumor_sizes = []
 
-    # COMPUTING TUMOR SIZES BEFORE THERAPY BEGINS
-    time_until_therapy = np.array(range(initial_time, time_at_therapy_start+1))
-    tumor_until_therapy = iwata.x_max_G(x_init=x_initial_condition, t=time_until_therapy, a_G=a_G, b_G=b_G)
-    x_initial_condition = tumor_until_therapy[-1]
-    # STORING COMPUTATIONS ACCORDINGLY
-    untreated_time_intervals.extend(time_until_therapy)
-    untreated_tumor_sizes.extend(tumor_until_therapy)
-
-
-    # COMPUTING TUMOR SIZES FOR INTERVAL THERAPY
-    if therapy_type == 'interval':
-        # SETTING TIME INTERVALS TO BE USED THROUGHOUT ITERATIONS
-        therapy_time = np.array(range(initial_time, therapy_days+1))
-        rest_time = np.array(range(initial_time, rest_days+1))
-        # COMPUTING TUMOR SIZES FOR EACH THERAPY SESSION
-        for session in range(therapy_sessions):
-            treated_tumor_size = enderling.x_max_LQ(x_init=x_initial_condition, t=therapy_time, D_LQ=D_LQ,
-                                                    alpha_LQ=alpha_LQ, beta_LQ=beta_LQ)
-            x_initial_condition = treated_tumor_size[-1]
-            rest_tumor_size = iwata.x_max_G(x_init=x_initial_condition, t=rest_time, a_G=a_G, b_G=b_G)
-            x_initial_condition = rest_tumor_size[-1]
+    # COMPUTING TUMOR SIZES SEGMENT BY SEGMENT
+    for segment, (kind, start, end, D_LQ) in enumerate(schedule.timeline(initial_time, total_time)):
+        time = np.array(range(0, end-start+1))
+        if kind == 'growth':
+            growth_time = time+start if segment == 0 else time
+            tumor_size = iwata.x_max_G(x_init=x_initial_condition, t=growth_time, a_G=a_G, b_G=b_G)
             # STORING COMPUTATIONS ACCORDINGLY
-            therapy_time_intervals.extend(therapy_time+time_at_therapy_start+((therapy_days+rest_days)*session))
-            therapy_tumor_sizes.extend(treated_tumor_size)
-            untreated_time_intervals.extend(rest_time+time_at_therapy_start+
-                                            (therapy_days*(session+1))+(rest_days*session))
-            untreated_tumor_sizes.extend(rest_tumor_size)
-
-        # COMPUTING TUMOR SIZES AFTER THERAPY
-        remaining_time = np.array(range(initial_time,
-                                        total_time-
-                                        (time_at_therapy_start+((therapy_days+rest_days)*therapy_sessions))+1))
-        after_therapy_tumor_size = iwata.x_max_G(x_init=x_initial_condition, t=remaining_time, a_G=a_G, b_G=b_G)
-        # STORING COMPUTATIONS ACCORDINGLY
-        untreated_time_intervals.extend(remaining_time+
-                                        time_at_therapy_start+((therapy_days+rest_days)*therapy_sessions))
-        untreated_tumor_sizes.extend(after_therapy_tumor_size)
-
-    # COMPUTING TUMOR SIZES FOR CONTINUOUS THERAPY
-    elif therapy_type == 'continuous':
-        remaining_time = np.array(range(initial_time, total_time-time_at_therapy_start+1))
-        treated_tumor_size = enderling.x_max_LQ(x_init=x_initial_condition, t=remaining_time,
-                                                D_LQ=D_LQ, alpha_LQ=alpha_LQ, beta_LQ=beta_LQ)
-        # STORING COMPUTATIONS ACCORDINGLY
-        therapy_tumor_sizes.extend(treated_tumor_size)
-        therapy_time_intervals.extend(remaining_time+time_at_therapy_start)
+            untreated_time_intervals.extend(time+start)
+            untreated_tumor_sizes.extend(tumor_size)
+        else:
+            tumor_size = enderling.x_max_LQ(x_init=x_initial_condition, t=time, D_LQ=D_LQ, alpha_LQ=alpha_LQ,
+                                            beta_LQ=beta_LQ)
+            # STORING COMPUTATIONS ACCORDINGLY
+            therapy_time_intervals.extend(time+start)
+            therapy_tumor_sizes.extend(tumor_size)
+        x_initial_condition = tumor_size[-1]
 
     # EXPORTING
     if export_filename:
@@ -146,5 +176,4 @@ def primaryTumorWithRadiotherapy(therapy_type, time_at_therapy_start, therapy_da
         export_path = '/Users/victor/Documents/TUM/Thesis/Output/' + export_filename + '.csv'
         max_tumor_DF.to_csv(export_path, index=False)
 
-
-    return untreated_time_intervals, untreated_tumor_sizes, therapy_time_intervals, therapy_tumor_sizes
\ No newline at end of file
+    return untreated_time_intervals, untreated_tumor_sizes, therapy_time_intervals, therapy_tumor_sizes